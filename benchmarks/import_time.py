@@ -0,0 +1,188 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import json
+import subprocess
+import sys
+import time
+
+from typing import List
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define default number of PyOb classes to define
+# i.e. An application with several hundred PyOb classes
+NUMBER = 300
+
+# Define the number of PyOb classes per hierarchy
+# i.e. A keyed root PyOb class followed by children that each add a type hint
+FAMILY_SIZE = 10
+
+# Define default number of cold starts, of which the best is kept
+REPEAT = 5
+
+# Define the flag that runs a single cold start in the current process
+CHILD_FLAG = "--child"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INIT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def init(self, code, amount, tags):
+    """Init Method"""
+
+    # Set key, type hinted and beartype-checked attributes
+    self.code = code
+    self.amount = amount
+    self.tags = tags
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DEFINE CLASSES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def define_classes(PyOb, number):
+    """Returns PyOb classes defined in hierarchies of FAMILY_SIZE classes"""
+
+    # Initialize classes
+    Classes = []
+
+    # Iterate over number
+    for i in range(number):
+
+        # Initialize namespace with a type hint of its own
+        namespace = {"__init__": init, "__annotations__": {f"field{i}": int}}
+
+        # Check if the PyOb class starts a new hierarchy
+        if i % FAMILY_SIZE == 0:
+
+            # Add the type hints and key of the root
+            # NOTE: List[str] is one of the hints that are checked by beartype
+            namespace["__annotations__"].update(code=str, amount=int, tags=List[str])
+            namespace["PyObMeta"] = type("PyObMeta", (), {"keys": ("code",)})
+
+            # Set parent to the PyOb base class
+            Parent = PyOb
+
+        # Define PyOb class
+        Parent = type(f"Model{i}", (Parent,), namespace)
+
+        # Add PyOb class to classes
+        Classes.append(Parent)
+
+    # Return classes
+    return Classes
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COLD START
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def cold_start(number):
+    """Times importing PyOb, defining PyOb classes and their first writes"""
+
+    # Get start time
+    start = time.perf_counter()
+
+    # Import PyOb
+    from pyob import PyOb
+
+    # Get import time
+    imported = time.perf_counter()
+
+    # Get whether beartype was imported along with PyOb
+    beartype_on_import = "beartype" in sys.modules
+
+    # Define PyOb classes
+    Classes = define_classes(PyOb, number)
+
+    # Get definition time
+    defined = time.perf_counter()
+
+    # Get whether beartype was imported by the class definitions
+    beartype_on_define = "beartype" in sys.modules
+
+    # Iterate over PyOb classes
+    for i, PyObClass in enumerate(Classes):
+
+        # Create the first PyOb instance of the PyOb class
+        # i.e. Its first validation, which resolves its type hints and plan
+        PyObClass(f"k{i}", i, ["tag"])
+
+    # Get first write time
+    written = time.perf_counter()
+
+    # Return timings
+    return {
+        "import": imported - start,
+        "define": defined - imported,
+        "first write": written - defined,
+        "beartype on import": beartype_on_import,
+        "beartype on define": beartype_on_define,
+        "beartype on write": "beartype" in sys.modules,
+    }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main(number=NUMBER, repeat=REPEAT):
+    """Times cold starts in fresh interpreters and prints the best of each step"""
+
+    # Initialize cold starts
+    cold_starts = []
+
+    # Iterate over repeat
+    for _ in range(repeat):
+
+        # Run a cold start in a fresh interpreter
+        # NOTE: Modules imported by an earlier cold start would otherwise be cached
+        output = subprocess.run(
+            [sys.executable, __file__, CHILD_FLAG, str(number)],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+
+        # Add cold start
+        cold_starts.append(json.loads(output))
+
+    # Print results
+    print(f"classes defined:     {number:,}")
+
+    # Iterate over timed steps
+    for step in ("import", "define", "first write"):
+
+        # Print the best time of the step in milliseconds
+        best = min(timings[step] for timings in cold_starts) * 1000
+        print(f"{step + ' (ms):':<21}{best:.1f}")
+
+    # Print when beartype was imported
+    for step in ("import", "define", "write"):
+        print(f"beartype on {step + ':':<9}{cold_starts[0]['beartype on ' + step]}")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ENTRYPOINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+
+    # Check if running a single cold start for the parent process
+    if sys.argv[1:2] == [CHILD_FLAG]:
+
+        # Write cold start timings as JSON
+        print(json.dumps(cold_start(int(sys.argv[2]))))
+
+    # Otherwise time cold starts with an optional number of PyOb classes
+    else:
+        main(*[int(arg) for arg in sys.argv[1:2]])
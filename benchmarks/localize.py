@@ -0,0 +1,138 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import gc
+import sys
+import time
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob import PyOb
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define default number of localizations to time
+# e.g. One per test or per tenant request
+NUMBER = 1000
+
+# Define the number of PyOb classes of the hierarchy
+SIZE = 50
+
+# Define the number of children per PyOb class of the hierarchy
+BRANCHING = 3
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INIT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def init(self, code, amount):
+    """Init Method"""
+
+    # Set key and type hinted attributes
+    self.code = code
+    self.amount = amount
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DEFINE HIERARCHY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def define_hierarchy(size=SIZE):
+    """Returns the PyOb classes of a tree under a single keyed root PyOb class"""
+
+    # Define root
+    Classes = [
+        type(
+            "Node0",
+            (PyOb,),
+            {
+                "__init__": init,
+                "__annotations__": {"code": str, "amount": int},
+                "PyObMeta": type("PyObMeta", (), {"keys": ("code",)}),
+            },
+        )
+    ]
+
+    # Iterate over the remaining PyOb classes
+    for i in range(1, size):
+
+        # Define a child of an earlier PyOb class with a type hint of its own
+        Classes.append(
+            type(
+                f"Node{i}",
+                (Classes[(i - 1) // BRANCHING],),
+                {"__annotations__": {f"field{i}": int}},
+            )
+        )
+
+    # Return classes
+    return Classes
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main(number=NUMBER):
+    """Times the localization of a whole hierarchy of PyOb classes"""
+
+    # Define hierarchy
+    Root, *Classes = define_hierarchy()
+
+    # Create a PyOb instance per PyOb class
+    # So that type hints are resolved and plans compiled, as in a running application
+    for i, PyObClass in enumerate([Root, *Classes]):
+        PyObClass(f"k{i}", i)
+
+    # Time the first localization
+    # i.e. Which also builds the localization template of the hierarchy
+    start = time.perf_counter()
+    Localized = Root.Localized(include=Classes)
+    first = time.perf_counter() - start
+
+    # Check that the localized hierarchy starts out empty and stays isolated
+    Localized[-1]("k0", 0)
+    assert len(Localized[0].obs) == 1, "Localized store is not isolated"
+    assert len(Root.obs) == SIZE, "Localized PyOb instance leaked into the original"
+
+    # Disable garbage collection so that it does not skew timings, as timeit
+    gc.disable()
+
+    # Initialize try-finally block
+    try:
+
+        # Time the remaining localizations
+        start = time.perf_counter()
+        for _ in range(number):
+            Root.Localized(include=Classes)
+        elapsed = time.perf_counter() - start
+
+    # Re-enable garbage collection
+    finally:
+        gc.enable()
+
+    # Print results
+    print(f"classes localized:     {SIZE:,}")
+    print(f"localizations:         {number:,}")
+    print(f"first (ms):            {first * 1000:.2f}")
+    print(f"per localization (ms): {elapsed / number * 1000:.2f}")
+    print(f"per class (us):        {elapsed / number / SIZE * 1e6:.1f}")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ENTRYPOINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+
+    # Time localizations with an optional number of localizations
+    main(*[int(arg) for arg in sys.argv[1:2]])
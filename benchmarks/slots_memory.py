@@ -0,0 +1,155 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import gc
+import sys
+import tracemalloc
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob import PyOb
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define default number of PyOb instances to create per PyOb class
+NUMBER = 100_000
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ POINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Point(PyOb):
+    """A keyed PyOb class whose instances store their fields in a __dict__"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PYOB META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class PyObMeta:
+        """PyOb Meta Class"""
+
+        # Define keys
+        keys = "pid"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, pid: int, x: float, y: float, label: str):
+        """Init Method"""
+
+        # Set attributes
+        self.pid = pid
+        self.x = x
+        self.y = y
+        self.label = label
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SLOTTED POINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SlottedPoint(PyOb):
+    """The same PyOb class with its fields stored in slots generated from type hints"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PYOB META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class PyObMeta:
+        """PyOb Meta Class"""
+
+        # Define keys
+        keys = "pid"
+
+        # Define slots
+        slots = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, pid: int, x: float, y: float, label: str):
+        """Init Method"""
+
+        # Set attributes
+        self.pid = pid
+        self.x = x
+        self.y = y
+        self.label = label
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MEASURE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def measure(PyObClass, number):
+    """Returns the bytes allocated per stored PyOb instance as traced by tracemalloc"""
+
+    # Create the field values ahead of tracing so that only PyOb overhead is measured
+    rows = [(pid, float(pid), float(-pid), "point") for pid in range(number)]
+
+    # Collect any existing garbage
+    gc.collect()
+
+    # Start tracing memory allocations
+    tracemalloc.start()
+
+    # Get baseline traced memory
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    # Create and store PyOb instances
+    for row in rows:
+        PyObClass(*row)
+
+    # Get traced memory
+    current, _ = tracemalloc.get_traced_memory()
+
+    # Stop tracing memory allocations
+    tracemalloc.stop()
+
+    # Return bytes per PyOb instance
+    # NOTE: This includes the store and key index entries, which are the same for both
+    return (current - baseline) / number
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main(number=NUMBER):
+    """Prints the memory allocated per PyOb instance with and without slots"""
+
+    # Measure bytes per PyOb instance
+    unslotted = measure(Point, number)
+    slotted = measure(SlottedPoint, number)
+
+    # Print results
+    print(f"instances per class:    {number:,}")
+    print(f"bytes per instance:     {unslotted:.0f}")
+    print(f"bytes per slotted:      {slotted:.0f}")
+    print(f"bytes saved:            {unslotted - slotted:.0f}")
+    print(f"saved (%):              {(unslotted - slotted) / unslotted:.0%}")
+
+    # Check that slotted PyOb instances are in fact smaller
+    assert slotted < unslotted, "Slotted PyOb instances are not smaller"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ENTRYPOINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+
+    # Run memory comparison with an optional number of PyOb instances
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,5 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.suite.runner import run_suite  # noqa
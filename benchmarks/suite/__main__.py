@@ -0,0 +1,70 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import argparse
+import json
+import sys
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.suite.cases import PYOB_CASES
+from benchmarks.suite.hierarchies import BUILDERS
+from benchmarks.suite.runner import NUMBER, REPEAT, run_suite
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main(args=None):
+    """Runs the benchmark suite and writes its results as JSON"""
+
+    # Initialize argument parser
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Benchmarks PyOb against dict and dataclass baselines",
+    )
+
+    # Add arguments
+    parser.add_argument("--number", type=int, default=NUMBER, help="records per case")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="runs per case")
+    parser.add_argument("--hierarchy", action="append", choices=list(BUILDERS))
+    parser.add_argument("--operation", action="append", choices=list(PYOB_CASES))
+    parser.add_argument("--output", help="path of a JSON file, stdout if omitted")
+
+    # Parse arguments
+    args = parser.parse_args(args)
+
+    # Run suite
+    results = run_suite(
+        number=args.number,
+        repeat=args.repeat,
+        hierarchies=args.hierarchy,
+        operations=args.operation,
+    )
+
+    # Check if no output path was given
+    if args.output is None:
+
+        # Write results to stdout
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+        # Return
+        return
+
+    # Write results to the output file
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ENTRYPOINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from dataclasses import dataclass
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the number of times a whole hierarchy is localized per measurement
+LOCALIZE_NUMBER = 20
+
+# NOTE: Every setup function below takes the number of records to operate on and
+# returns a (run, ops) pair, where run is timed and performs ops operations
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB CONSTRUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def pyob_construct(build, number):
+    """Sets up the creation of PyOb instances through Metaclass.__call__"""
+
+    # Build hierarchy
+    Classes = build().Classes
+
+    # Get init arguments
+    rows = [(Classes[i % len(Classes)], f"k{i}", i) for i in range(number)]
+
+    # Define run
+    def run():
+        """Creates PyOb instances"""
+
+        # Iterate over rows
+        for PyObClass, code, amount in rows:
+
+            # Create PyOb instance
+            PyObClass(code, amount)
+
+    # Return run and number of operations
+    return run, number
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB SETATTR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def pyob_setattr(build, number, name):
+    """Sets up writes to an attribute of stored PyOb instances"""
+
+    # Build and populate hierarchy
+    pyobs = build().populate(number)
+
+    # Get new values
+    # i.e. Unused keys for the key, new values otherwise
+    pairs = [
+        (pyob, f"n{i}" if name == "code" else i + 1) for i, pyob in enumerate(pyobs)
+    ]
+
+    # Define run
+    def run():
+        """Writes an attribute of every PyOb instance"""
+
+        # Iterate over PyOb instances and values
+        for pyob, value in pairs:
+
+            # Set attribute
+            setattr(pyob, name, value)
+
+    # Return run and number of operations
+    return run, number
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB LOOKUP
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def pyob_lookup(build, number):
+    """Sets up key lookups from the root of a hierarchy"""
+
+    # Build hierarchy
+    hierarchy = build()
+
+    # Populate hierarchy
+    hierarchy.populate(number)
+
+    # Get root
+    Root = hierarchy.Root
+
+    # Get keys
+    codes = [f"k{i}" for i in range(number)]
+
+    # Define run
+    def run():
+        """Looks up every PyOb instance by key"""
+
+        # Iterate over keys
+        for code in codes:
+
+            # Look up PyOb instance
+            Root[code]
+
+    # Return run and number of operations
+    return run, number
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB LEN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def pyob_len(build, number):
+    """Sets up calls to len() on the store of the root of a hierarchy"""
+
+    # Build hierarchy
+    hierarchy = build()
+
+    # Populate hierarchy
+    hierarchy.populate(number)
+
+    # Get store
+    store = hierarchy.Root.obs
+
+    # Define run
+    def run():
+        """Counts the PyOb instances of the hierarchy repeatedly"""
+
+        # Iterate over number
+        for _ in range(number):
+
+            # Count PyOb instances
+            len(store)
+
+    # Return run and number of operations
+    return run, number
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB ITERATE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def pyob_iterate(build, number):
+    """Sets up iteration over the store of the root of a hierarchy"""
+
+    # Build hierarchy
+    hierarchy = build()
+
+    # Populate hierarchy
+    hierarchy.populate(number)
+
+    # Get store
+    store = hierarchy.Root.obs
+
+    # Define run
+    def run():
+        """Iterates over every PyOb instance of the hierarchy"""
+
+        # Iterate over store
+        for _ in store:
+            pass
+
+    # Return run and number of operations
+    return run, number
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB LOCALIZE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def pyob_localize(build, number):
+    """Sets up the localization of every PyOb class of a hierarchy"""
+
+    # NOTE: Localization does not depend on the number of PyOb instances
+
+    # Get classes
+    *Classes, Leaf = build().Classes
+
+    # Define run
+    def run():
+        """Localizes the hierarchy repeatedly"""
+
+        # Iterate over localize number
+        for _ in range(LOCALIZE_NUMBER):
+
+            # Localize the leaf along with the rest of the hierarchy
+            Leaf.Localized(include=Classes)
+
+    # Return run and number of operations
+    return run, LOCALIZE_NUMBER
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB CASES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define PyOb setup functions by operation
+# i.e. Each takes a hierarchy builder and the number of PyOb instances
+PYOB_CASES = {
+    "construct": pyob_construct,
+    "setattr_key": lambda build, number: pyob_setattr(build, number, "code"),
+    "setattr_hinted": lambda build, number: pyob_setattr(build, number, "amount"),
+    "setattr_untracked": lambda build, number: pyob_setattr(build, number, "note"),
+    "lookup": pyob_lookup,
+    "len": pyob_len,
+    "iterate": pyob_iterate,
+    "localize": pyob_localize,
+}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class Record:
+    """A dataclass with the fields of the benchmarked PyOb classes"""
+
+    # Define fields
+    code: str
+    amount: int
+    note: object = None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DICT CASES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def dict_construct(number):
+    """Sets up the creation of dict records in a dict keyed by code"""
+
+    # Initialize index
+    index = {}
+
+    # Get field values
+    rows = [(f"k{i}", i) for i in range(number)]
+
+    # Define run
+    def run():
+        """Creates records"""
+
+        # Iterate over rows
+        for code, amount in rows:
+
+            # Create and index record
+            index[code] = {"code": code, "amount": amount, "note": None}
+
+    # Return run and number of operations
+    return run, number
+
+
+def dict_populate(number):
+    """Returns a dict of dict records keyed by code"""
+
+    # Return index
+    return {
+        f"k{i}": {"code": f"k{i}", "amount": i, "note": None} for i in range(number)
+    }
+
+
+def dict_setattr_key(number):
+    """Sets up re-keying every dict record"""
+
+    # Populate index
+    index = dict_populate(number)
+
+    # Get records and new keys
+    pairs = [(record, f"n{i}") for i, record in enumerate(list(index.values()))]
+
+    # Define run
+    def run():
+        """Re-keys every record"""
+
+        # Iterate over records and keys
+        for record, code in pairs:
+
+            # Move record to its new key
+            del index[record["code"]]
+            record["code"] = code
+            index[code] = record
+
+    # Return run and number of operations
+    return run, number
+
+
+def dict_setattr(number, name):
+    """Sets up writes to a field of every dict record"""
+
+    # Get records and new values
+    pairs = [(record, i + 1) for i, record in enumerate(dict_populate(number).values())]
+
+    # Define run
+    def run():
+        """Writes a field of every record"""
+
+        # Iterate over records and values
+        for record, value in pairs:
+
+            # Set field
+            record[name] = value
+
+    # Return run and number of operations
+    return run, number
+
+
+def dict_lookup(number):
+    """Sets up key lookups of dict records"""
+
+    # Populate index
+    index = dict_populate(number)
+
+    # Get keys
+    codes = list(index)
+
+    # Define run
+    def run():
+        """Looks up every record by key"""
+
+        # Iterate over keys
+        for code in codes:
+
+            # Look up record
+            index[code]
+
+    # Return run and number of operations
+    return run, number
+
+
+def dict_len(number):
+    """Sets up calls to len() on a dict of records"""
+
+    # Populate index
+    index = dict_populate(number)
+
+    # Define run
+    def run():
+        """Counts the records repeatedly"""
+
+        # Iterate over number
+        for _ in range(number):
+
+            # Count records
+            len(index)
+
+    # Return run and number of operations
+    return run, number
+
+
+def dict_iterate(number):
+    """Sets up iteration over a dict of records"""
+
+    # Populate index
+    index = dict_populate(number)
+
+    # Define run
+    def run():
+        """Iterates over every record"""
+
+        # Iterate over records
+        for _ in index.values():
+            pass
+
+    # Return run and number of operations
+    return run, number
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DATACLASS CASES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def dataclass_construct(number):
+    """Sets up the creation of dataclass records in a dict keyed by code"""
+
+    # Initialize index
+    index = {}
+
+    # Get field values
+    rows = [(f"k{i}", i) for i in range(number)]
+
+    # Define run
+    def run():
+        """Creates records"""
+
+        # Iterate over rows
+        for code, amount in rows:
+
+            # Create and index record
+            index[code] = Record(code, amount)
+
+    # Return run and number of operations
+    return run, number
+
+
+def dataclass_populate(number):
+    """Returns a dict of dataclass records keyed by code"""
+
+    # Return index
+    return {f"k{i}": Record(f"k{i}", i) for i in range(number)}
+
+
+def dataclass_setattr_key(number):
+    """Sets up re-keying every dataclass record"""
+
+    # Populate index
+    index = dataclass_populate(number)
+
+    # Get records and new keys
+    pairs = [(record, f"n{i}") for i, record in enumerate(list(index.values()))]
+
+    # Define run
+    def run():
+        """Re-keys every record"""
+
+        # Iterate over records and keys
+        for record, code in pairs:
+
+            # Move record to its new key
+            del index[record.code]
+            record.code = code
+            index[code] = record
+
+    # Return run and number of operations
+    return run, number
+
+
+def dataclass_setattr(number, name):
+    """Sets up writes to a field of every dataclass record"""
+
+    # Get records and new values
+    pairs = [
+        (record, i + 1) for i, record in enumerate(dataclass_populate(number).values())
+    ]
+
+    # Define run
+    def run():
+        """Writes a field of every record"""
+
+        # Iterate over records and values
+        for record, value in pairs:
+
+            # Set field
+            setattr(record, name, value)
+
+    # Return run and number of operations
+    return run, number
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ BASELINE CASES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define baseline setup functions by baseline and operation
+# i.e. Each takes the number of records, kept in a dict keyed by code like a store
+# NOTE: Lookups, len() and iteration are the same dict operations for both baselines
+BASELINE_CASES = {
+    "dict": {
+        "construct": dict_construct,
+        "setattr_key": dict_setattr_key,
+        "setattr_hinted": lambda number: dict_setattr(number, "amount"),
+        "setattr_untracked": lambda number: dict_setattr(number, "note"),
+        "lookup": dict_lookup,
+        "len": dict_len,
+        "iterate": dict_iterate,
+    },
+    "dataclass": {
+        "construct": dataclass_construct,
+        "setattr_key": dataclass_setattr_key,
+        "setattr_hinted": lambda number: dataclass_setattr(number, "amount"),
+        "setattr_untracked": lambda number: dataclass_setattr(number, "note"),
+        "lookup": dict_lookup,
+        "len": dict_len,
+        "iterate": dict_iterate,
+    },
+}
@@ -0,0 +1,149 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob import PyOb
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the number of levels of the deep hierarchy
+DEPTH = 12
+
+# Define the number of children of the wide hierarchy
+WIDTH = 120
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HIERARCHY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Hierarchy:
+    """A freshly defined tree of PyOb classes to benchmark against"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, Root, Classes):
+        """Init Method"""
+
+        # Set root
+        # i.e. The PyOb class whose store covers every PyOb instance of the hierarchy
+        self.Root = Root
+
+        # Set classes
+        # i.e. The PyOb classes that PyOb instances are created from, in turn
+        self.Classes = Classes
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ POPULATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def populate(self, number):
+        """Returns PyOb instances created across the classes of the hierarchy"""
+
+        # Get classes
+        Classes = self.Classes
+
+        # Return PyOb instances
+        return [Classes[i % len(Classes)](f"k{i}", i) for i in range(number)]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INIT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def init(self, code, amount):
+    """Init Method"""
+
+    # Set key, type hinted and untracked attributes
+    self.code = code
+    self.amount = amount
+    self.note = None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DEFINE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def define(name, Parent):
+    """Returns a new PyOb class, keyed by code if it is a root"""
+
+    # Initialize namespace
+    namespace = {"__init__": init, "__annotations__": {"amount": int}}
+
+    # Check if root
+    if Parent is PyOb:
+
+        # Add key and its type hint
+        namespace["__annotations__"]["code"] = str
+        namespace["PyObMeta"] = type("PyObMeta", (), {"keys": ("code",)})
+
+    # Return PyOb class
+    return type(name, (Parent,), namespace)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ BUILD FLAT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def build_flat():
+    """Returns a hierarchy of a single PyOb class"""
+
+    # Define PyOb class
+    Item = define("Item", PyOb)
+
+    # Return hierarchy
+    return Hierarchy(Root=Item, Classes=[Item])
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ BUILD DEEP
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def build_deep(depth=DEPTH):
+    """Returns a hierarchy of a chain of PyOb classes, populated at every level"""
+
+    # Initialize classes with the root
+    Classes = [define("Level0", PyOb)]
+
+    # Iterate over the remaining levels
+    for level in range(1, depth):
+
+        # Define a child of the previous level
+        Classes.append(define(f"Level{level}", Classes[-1]))
+
+    # Return hierarchy
+    return Hierarchy(Root=Classes[0], Classes=Classes)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ BUILD WIDE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def build_wide(width=WIDTH):
+    """Returns a hierarchy of a root PyOb class with many children populated"""
+
+    # Define root
+    Root = define("Root", PyOb)
+
+    # Return hierarchy
+    return Hierarchy(
+        Root=Root, Classes=[define(f"Child{i}", Root) for i in range(width)]
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ BUILDERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define hierarchy builders by name
+BUILDERS = {"flat": build_flat, "deep": build_deep, "wide": build_wide}
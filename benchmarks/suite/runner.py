@@ -0,0 +1,188 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import gc
+import platform
+import sys
+import time
+
+from importlib.metadata import PackageNotFoundError, version
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.suite.cases import BASELINE_CASES, PYOB_CASES
+from benchmarks.suite.hierarchies import BUILDERS
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the default number of records per measurement
+NUMBER = 10_000
+
+# Define the default number of measurements per case, of which the best is kept
+REPEAT = 5
+
+# Define the version of the result format
+# i.e. To be bumped whenever results stop being comparable with earlier ones
+FORMAT_VERSION = 1
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MEASURE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def measure(setup, repeat):
+    """Returns the best time of a case in seconds, along with its operation count"""
+
+    # Initialize best time
+    best = float("inf")
+
+    # Iterate over repeat
+    for _ in range(repeat):
+
+        # Set up a fresh case
+        # NOTE: This is done per measurement as most cases consume their state
+        run, ops = setup()
+
+        # Disable garbage collection so that it does not skew timings, as timeit
+        gc.disable()
+
+        # Initialize try-finally block
+        try:
+
+            # Time case
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+
+        # Re-enable garbage collection
+        finally:
+            gc.enable()
+
+    # Return best time and operation count
+    return best, ops
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ENVIRONMENT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_environment(number, repeat):
+    """Returns a dictionary describing the conditions of a benchmark run"""
+
+    # Initialize try-except block
+    try:
+
+        # Get installed PyOb version
+        pyob_version = version("pyob")
+
+    # Handle PyOb being run from a checkout without being installed
+    except PackageNotFoundError:
+
+        # Set PyOb version to None
+        pyob_version = None
+
+    # Return environment
+    return {
+        "format": FORMAT_VERSION,
+        "pyob": pyob_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN SUITE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run_suite(number=NUMBER, repeat=REPEAT, hierarchies=None, operations=None):
+    """Runs the benchmark suite and returns its results as a JSON-ready dictionary"""
+
+    # Get hierarchies and operations, defaulting to all of them
+    hierarchies = hierarchies or list(BUILDERS)
+    operations = operations or list(PYOB_CASES)
+
+    # Initialize baselines
+    # i.e. A map of baseline to a map of operation to nanoseconds per operation
+    baselines = {}
+
+    # Iterate over baselines
+    for baseline, cases in BASELINE_CASES.items():
+
+        # Iterate over the operations of the baseline
+        for operation, setup in cases.items():
+
+            # Continue if operation is not selected
+            if operation not in operations:
+                continue
+
+            # Report progress
+            print(f"baseline {baseline} {operation}", file=sys.stderr)
+
+            # Measure case
+            seconds, ops = measure(lambda: setup(number), repeat)
+
+            # Add nanoseconds per operation
+            baselines.setdefault(baseline, {})[operation] = seconds / ops * 1e9
+
+    # Initialize results
+    results = []
+
+    # Iterate over hierarchies
+    for hierarchy in hierarchies:
+
+        # Get builder
+        build = BUILDERS[hierarchy]
+
+        # Iterate over operations
+        for operation in operations:
+
+            # Report progress
+            print(f"pyob {hierarchy} {operation}", file=sys.stderr)
+
+            # Get setup function
+            setup = PYOB_CASES[operation]
+
+            # Measure case
+            seconds, ops = measure(lambda: setup(build, number), repeat)
+
+            # Get nanoseconds per operation
+            ns = seconds / ops * 1e9
+
+            # Add result
+            # i.e. With slowdowns relative to each baseline, None if there is none
+            results.append(
+                {
+                    "hierarchy": hierarchy,
+                    "operation": operation,
+                    "ops": ops,
+                    "seconds": seconds,
+                    "ns_per_op": ns,
+                    **{
+                        f"vs_{baseline}": (
+                            ns / baselines[baseline][operation]
+                            if operation in baselines.get(baseline, {})
+                            else None
+                        )
+                        for baseline in BASELINE_CASES
+                    },
+                }
+            )
+
+    # Return results along with the environment they were measured in
+    return {
+        "environment": get_environment(number, repeat),
+        "baselines": baselines,
+        "results": results,
+    }
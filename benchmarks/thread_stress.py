@@ -0,0 +1,263 @@
+"""Stresses thread-safe PyOb stores with threads that compete for the same keys
+
+Usage: python benchmarks/thread_stress.py [threads] [number]
+"""
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import sys
+import threading
+import time
+
+from pathlib import Path
+
+# Add the repository root to the import path
+# So that the script runs from a checkout without pyob being installed
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob import PyOb
+from pyob.exceptions import DuplicateKeyError
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define default number of threads
+THREADS = 16
+
+# Define default number of distinct keys that the threads compete for
+NUMBER = 20_000
+
+# Define the number of rows per bulk create
+BATCH = 50
+
+# Define a thread switch interval far below the default of 5 ms
+# i.e. So that threads are preempted between a key check and its insert
+SWITCH_INTERVAL = 1e-6
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ACCOUNT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Account(PyOb):
+    """A thread-safe PyOb class keyed by number"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PYOB META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class PyObMeta:
+        """PyOb Meta Class"""
+
+        # Define keys
+        keys = "number"
+
+        # Define secondary indexes
+        indexes = "branch"
+
+        # Define threadsafe
+        threadsafe = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number: int, branch: str):
+        """Init Method"""
+
+        # Set attributes
+        self.number = number
+        self.branch = branch
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SAVINGS ACCOUNT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SavingsAccount(Account):
+    """A child PyOb class sharing the key index and lock of its family"""
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ WORKER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def worker(index, number, created):
+    """Creates, re-keys and deletes PyOb instances over keys shared by every thread"""
+
+    # Initialize PyObs created by the thread
+    pyobs = created[index] = []
+
+    # Iterate over every key, starting at an offset so that threads overlap
+    for i in range(number):
+
+        # Get key
+        key = (i * 7 + index * 13) % number
+
+        # Get PyOb class, alternating between the classes of the family
+        PyObClass = SavingsAccount if key % 2 else Account
+
+        # Initialize try-except block
+        try:
+
+            # Check if this key should be created in bulk
+            if key % BATCH == 0:
+
+                # Create a batch of PyOb instances at once
+                pyobs += PyObClass.bulk_create(
+                    [(k, f"branch-{k % 10}") for k in range(key, key + BATCH // 2)]
+                )
+
+            # Otherwise create a single PyOb instance
+            else:
+
+                # Create PyOb instance
+                pyobs.append(PyObClass(key, f"branch-{key % 10}"))
+
+        # Handle keys already taken by another thread
+        except DuplicateKeyError:
+            continue
+
+        # Check if the PyOb instance should be re-keyed out of the shared range
+        if i % 10 == 0 and pyobs:
+
+            # Move the PyOb instance to a key of its own and back
+            # NOTE: Another thread may take the original key while it is released
+            pyob = pyobs[-1]
+            original = pyob.number
+            pyob.number = -(original + 1)
+
+            # Initialize try-except block
+            try:
+
+                # Move the PyOb instance back to its original key
+                pyob.number = original
+
+            # Handle original keys taken by another thread meanwhile
+            except DuplicateKeyError:
+                pass
+
+        # Check if the PyOb instance should be deleted
+        if i % 25 == 0 and pyobs:
+
+            # Delete the last PyOb instance created by the thread
+            pyobs.pop().delete()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ READER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def reader(number, done, reads):
+    """Looks up keys and iterates over the store without taking any lock"""
+
+    # Iterate until the workers are done
+    while not done.is_set():
+
+        # Iterate over the store
+        # NOTE: This must not fail with a dictionary changed size during iteration
+        reads[0] += sum(1 for _ in Account.obs)
+
+        # Look up a range of keys
+        reads[0] += sum(
+            1 for key in range(0, number, 97) if Account.obs.key(key, None) is not None
+        )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(threads=THREADS, number=NUMBER):
+    """Runs threads that compete for keys and returns what they kept and read"""
+
+    # NOTE: The consistency of the stores afterwards is checked by
+    # tests/test_thread_stress.py
+
+    # Get the current thread switch interval
+    switch_interval = sys.getswitchinterval()
+
+    # Set thread switch interval
+    sys.setswitchinterval(SWITCH_INTERVAL)
+
+    # Initialize PyObs created by thread
+    created = [None] * threads
+
+    # Initialize done event and read count of the reader
+    done, reads = threading.Event(), [0]
+
+    # Initialize workers and reader
+    workers = [
+        threading.Thread(target=worker, args=(index, number, created))
+        for index in range(threads)
+    ]
+    lookups = threading.Thread(target=reader, args=(number, done, reads))
+
+    # Get start time
+    start_time = time.perf_counter()
+
+    # Initialize try-finally block
+    try:
+
+        # Start threads
+        lookups.start()
+        [thread.start() for thread in workers]
+
+        # Wait for the workers and then the reader
+        [thread.join() for thread in workers]
+        done.set()
+        lookups.join()
+
+    # Restore thread switch interval
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    # Get elapsed time
+    elapsed = time.perf_counter() - start_time
+
+    # Get the PyOb instances that the threads created and kept
+    pyobs = [pyob for thread_pyobs in created for pyob in thread_pyobs]
+
+    # Return PyOb instances, read count and elapsed time
+    return pyobs, reads[0], elapsed
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main(threads=THREADS, number=NUMBER):
+    """Runs threads that compete for keys and prints the results"""
+
+    # Run threads
+    pyobs, reads, elapsed = run(threads=threads, number=number)
+
+    # Print results
+    print(f"threads:            {threads}")
+    print(f"instances kept:     {len(pyobs):,}")
+    print(f"instances stored:   {len(Account.obs):,}")
+    print(f"lock-free reads:    {reads:,}")
+    print(f"elapsed (s):        {elapsed:.2f}")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ENTRYPOINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+
+    # Run stress test with an optional number of threads and keys
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,90 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import timeit
+
+from typing import Dict, List, Optional, Union
+
+from beartype.abby import is_bearable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.main.tools.check import get_type_checker
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define number of checks per measurement
+NUMBER = 20000
+
+# Define cases
+# i.e. (label, expected type, value) triples covering fast paths and fallbacks
+CASES = (
+    ("int", int, 1),
+    ("str", str, "a"),
+    ("bool", bool, True),
+    ("Optional[int]", Optional[int], None),
+    ("Union[int, str]", Union[int, str], "a"),
+    ("List[int]", List[int], [1, 2, 3]),
+    ("Dict[str, int]", Dict[str, int], {"a": 1}),
+)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ IS VALID BEFORE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def is_valid_before(value, expected_type):
+    """Replicates the per-write type check performed prior to compiled checkers"""
+
+    # Check if boolean edge case
+    if type(value) is bool and expected_type is not bool:
+        return False
+
+    # Return boolean of whether value is bearable
+    return is_bearable(value, expected_type)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main():
+    """Prints the per-write type check cost before and after compiled checkers"""
+
+    # Print header
+    print(f"{'hint':<20}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+
+    # Iterate over cases
+    for label, expected_type, value in CASES:
+
+        # Get compiled type checker
+        is_valid = get_type_checker(expected_type)
+
+        # Time the previous type check
+        before = timeit.timeit(
+            lambda: is_valid_before(value, expected_type), number=NUMBER
+        )
+
+        # Time the compiled type check
+        after = timeit.timeit(lambda: is_valid(value), number=NUMBER)
+
+        # Convert timings to microseconds per check
+        before, after = before / NUMBER * 1e6, after / NUMBER * 1e6
+
+        # Print timings
+        print(f"{label:<20}{before:>14.3f}{after:>14.3f}{before / after:>9.1f}x")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ENTRYPOINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Measures the memory a weak PyOb store retains once its PyOb instances are dropped
+
+Usage: python benchmarks/weak_store.py [number]
+"""
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import gc
+import sys
+import time
+
+from pathlib import Path
+
+# Add the repository root to the import path
+# So that the script runs from a checkout without pyob being installed
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob import PyOb
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define default number of PyOb instances to create and drop
+NUMBER = 1_000_000
+
+# Define number of PyOb instances created per request
+# i.e. The transient PyObs of a single request in a long-running service
+BATCH = 1000
+
+# Define the maximum number of memory blocks retained once all PyObs are dropped
+# i.e. Generous headroom for interpreter noise, far below the cost of live instances
+MAX_RETAINED_BLOCKS = 10_000
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SESSION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Session(PyOb):
+    """A transient, weakly stored PyOb class with key, secondary and ordered indexes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PYOB META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class PyObMeta:
+        """PyOb Meta Class"""
+
+        # Define keys
+        keys = "sid"
+
+        # Define secondary indexes
+        indexes = "user"
+
+        # Define ordered indexes
+        ordered_indexes = "started"
+
+        # Define weak
+        weak = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, sid: int, user: str, started: int):
+        """Init Method"""
+
+        # Set attributes
+        self.sid = sid
+        self.user = user
+        self.started = started
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(number=NUMBER):
+    """Creates and drops PyOb instances and returns the memory blocks retained"""
+
+    # NOTE: The weak store and its indexes are checked for leftovers by
+    # tests/test_weak_store.py
+
+    # Collect any existing garbage
+    gc.collect()
+
+    # Get baseline number of allocated memory blocks
+    # NOTE: Unlike tracemalloc this adds no overhead to the allocations being measured
+    baseline = sys.getallocatedblocks()
+
+    # Get start time
+    start_time = time.perf_counter()
+
+    # Iterate over requests
+    for start in range(0, number, BATCH):
+
+        # Create the transient PyOb instances of a request
+        pyobs = [
+            Session(sid, f"user-{sid % 100}", sid % 1000)
+            for sid in range(start, min(start + BATCH, number))
+        ]
+
+        # Look up the first PyOb instance of the request by key
+        Session[start]
+
+        # Drop the PyOb instances of the request
+        del pyobs
+
+    # Get elapsed time
+    elapsed = time.perf_counter() - start_time
+
+    # Collect any remaining garbage
+    gc.collect()
+
+    # Get retained number of allocated memory blocks
+    retained = sys.getallocatedblocks() - baseline
+
+    # Return retained number of memory blocks and elapsed time
+    return retained, elapsed
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main(number=NUMBER):
+    """Creates and drops PyOb instances and prints the memory retained"""
+
+    # Run requests
+    retained, elapsed = run(number=number)
+
+    # Print results
+    print(f"instances created:  {number:,}")
+    print(f"instances retained: {len(Session.obs):,}")
+    print(f"blocks retained:    {retained:,}")
+    print(f"elapsed (s):        {elapsed:.2f}")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ENTRYPOINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+
+    # Run memory regression check with an optional number of PyOb instances
+    main(*[int(arg) for arg in sys.argv[1:2]])
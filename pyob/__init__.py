@@ -3,3 +3,6 @@
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from pyob.main import PyOb  # noqa
+from pyob import stats  # noqa
+from pyob.batch import transaction  # noqa
+from pyob.main.tools.validate import validation  # noqa
@@ -0,0 +1,5 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.aggregate.classes import Count, Max, Mean, Min, Sum  # noqa
@@ -0,0 +1,288 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from array import array
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ OPTIONAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize try-except block
+try:
+
+    # Import NumPy to reduce packed columns without unboxing their values
+    import numpy
+
+# Handle environments without NumPy
+except ImportError:
+
+    # Fall back to pure-Python reductions
+    numpy = None
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the bound beyond which a sum of 64-bit integers may overflow in NumPy
+INT64_BOUND = 2**63
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PREPARE BATCH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def prepare_batch(batch):
+    """Returns a batch of field values ready to be reduced, without None values"""
+
+    # Check if the batch is a packed column
+    # i.e. Primitive values that can never be None
+    if isinstance(batch, array):
+
+        # Return a zero-copy NumPy view of the column if NumPy is installed
+        return numpy.frombuffer(batch, dtype=batch.typecode) if numpy else batch
+
+    # Return values that are not None
+    return [value for value in batch if value is not None]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SUM VALUES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def sum_values(values):
+    """Returns the sum of a prepared batch of field values"""
+
+    # Return the Python sum unless the batch is a NumPy view
+    if numpy is None or not isinstance(values, numpy.ndarray):
+        return sum(values)
+
+    # Return the NumPy sum of floats as a Python float
+    if values.dtype.kind == "f":
+        return float(values.sum())
+
+    # Return the Python sum of integers whose NumPy sum might overflow
+    if len(values) and len(values) * max(
+        abs(int(values.min())), abs(int(values.max()))
+    ) >= INT64_BOUND:
+        return sum(values.tolist())
+
+    # Return the NumPy sum of integers as a Python int
+    return int(values.sum())
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ AGGREGATE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Aggregate:
+    """A base class for a reduction of a field over a PyObSet or PyObStore"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, field=None):
+        """Init Method"""
+
+        # Set field
+        # i.e. The name of the field to reduce, None for the PyOb instances themselves
+        self.field = field
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self):
+        """Representation Method"""
+
+        # Return representation
+        return f"{self.__class__.__name__}({self.field or ''!r})"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ START
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def start(self):
+        """Returns the initial state of the reduction"""
+
+        # Return None
+        return None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ STEP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def step(self, state, values):
+        """Returns the state of the reduction after a prepared batch of values"""
+
+        # Raise NotImplementedError
+        raise NotImplementedError
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FINISH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def finish(self, state):
+        """Returns the result of the reduction from its final state"""
+
+        # Return state
+        return state
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COUNT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Count(Aggregate):
+    """Counts PyOb instances, or those whose field is set and not None"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ START
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def start(self):
+        """Returns the initial state of the reduction"""
+
+        # Return 0
+        return 0
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ STEP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def step(self, state, values):
+        """Returns the state of the reduction after a prepared batch of values"""
+
+        # Return count
+        return state + len(values)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SUM
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Sum(Aggregate):
+    """Sums the values of a field, ignoring None"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ START
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def start(self):
+        """Returns the initial state of the reduction"""
+
+        # Return 0
+        return 0
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ STEP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def step(self, state, values):
+        """Returns the state of the reduction after a prepared batch of values"""
+
+        # Return sum
+        return state + sum_values(values)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MEAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Mean(Aggregate):
+    """Averages the values of a field, ignoring None, or None if there are none"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ START
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def start(self):
+        """Returns the initial state of the reduction"""
+
+        # Return sum and count
+        return 0, 0
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ STEP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def step(self, state, values):
+        """Returns the state of the reduction after a prepared batch of values"""
+
+        # Unpack state
+        total, n = state
+
+        # Return sum and count
+        return total + sum_values(values), n + len(values)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FINISH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def finish(self, state):
+        """Returns the result of the reduction from its final state"""
+
+        # Unpack state
+        total, n = state
+
+        # Return mean if there were any values
+        return total / n if n else None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Min(Aggregate):
+    """Returns the smallest value of a field, ignoring None"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ STEP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def step(self, state, values):
+        """Returns the state of the reduction after a prepared batch of values"""
+
+        # Return state if the batch is empty
+        if not len(values):
+            return state
+
+        # Get the smallest value of the batch as a Python value
+        value = values.min().item() if hasattr(values, "dtype") else min(values)
+
+        # Return the smallest value so far
+        return value if state is None else min(state, value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Max(Aggregate):
+    """Returns the largest value of a field, ignoring None"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ STEP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def step(self, state, values):
+        """Returns the state of the reduction after a prepared batch of values"""
+
+        # Return state if the batch is empty
+        if not len(values):
+            return state
+
+        # Get the largest value of the batch as a Python value
+        value = values.max().item() if hasattr(values, "dtype") else max(values)
+
+        # Return the largest value so far
+        return value if state is None else max(state, value)
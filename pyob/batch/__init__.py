@@ -0,0 +1,6 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.batch.classes import PyObTransaction  # noqa
+from pyob.batch.tools import transaction  # noqa
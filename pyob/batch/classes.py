@@ -0,0 +1,360 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.main.tools.bulk import get_set_values, store_pyobs
+from pyob.main.tools.index import (
+    current_transaction,
+    deindex_pyob_attr,
+    detached_weakrefs_by_id,
+    index_pyob_attr,
+    untracked_pyob_ids,
+)
+from pyob.main.tools.validate import is_type_checked, validate_pyob_attr
+from pyob.utils import Nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the operations of undo log entries
+INSERT = "insert"
+REMOVE = "remove"
+SET = "set"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB TRANSACTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObTransaction:
+    """A context in which PyOb writes are undo logged and type checked on commit"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize stores to None
+    # i.e. The PyOb stores whose writes are covered, or None to cover every store
+    stores = None
+
+    # Initialize parent to None
+    # i.e. The enclosing transaction if nested
+    parent = None
+
+    # Initialize log to None
+    # i.e. A list of (operation, PyOb, name, previous value) entries in write order
+    log = None
+
+    # Initialize pending to None
+    # i.e. A map of (PyOb ID, name) to the PyOb instances whose type checks are due
+    pending = None
+
+    # Initialize token to None
+    # i.e. The context variable token that restores the enclosing transaction
+    token = None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, stores=None):
+        """Init Method"""
+
+        # Set stores
+        self.stores = stores
+
+        # Initialize log
+        self.log = []
+
+        # Initialize pending
+        self.pending = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ENTER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __enter__(self):
+        """Enter Method"""
+
+        # Set parent to the current transaction if any
+        self.parent = current_transaction.get()
+
+        # Make transaction current
+        self.token = current_transaction.set(self)
+
+        # Return transaction
+        return self
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __EXIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __exit__(self, Error, error, traceback):
+        """Exit Method"""
+
+        # Restore the enclosing transaction if any
+        current_transaction.reset(self.token)
+
+        # Check if the block raised
+        if Error is not None:
+
+            # Undo the writes of the block
+            self.rollback()
+
+            # Return and let the exception propagate
+            return
+
+        # Commit the writes of the block
+        self.commit()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ WRITE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def write(self, pyob, name, value, attr_plan=None):
+        """Validates keys and indexes a PyOb instance attribute, logging the change"""
+
+        # Get PyObMeta
+        PyObMeta = pyob.__class__.PyObMeta
+
+        # Get store
+        store = PyObMeta.store
+
+        # Get whether to type check the write at all
+        check_types = is_type_checked(pyob=pyob, name=name)
+
+        # Hold the lock of the family if any
+        with store._family.locked():
+
+            # Validate PyOb instance attribute, deferring type checks
+            # NOTE: Keys are still checked eagerly as the key index cannot hold both,
+            # as are the types of ordered indexes, which cannot sort mistyped values
+            validate_pyob_attr(
+                pyob=pyob,
+                name=name,
+                value=value,
+                attr_plan=attr_plan,
+                check_types=check_types and name in PyObMeta.ordered_indexes,
+            )
+
+            # Check if PyOb instance is stored
+            # NOTE: The writes of a PyOb instance under construction are undone by
+            # the removal of its insert, or by the metaclass if its init method fails
+            if pyob in store._counts_by_pyob:
+
+                # Get the value set on the PyOb instance itself if any
+                pairs = get_set_values(pyob.__class__, (pyob,), name)
+
+                # Log the previous value
+                self.log.append((SET, pyob, name, pairs[0][1] if pairs else Nothing))
+
+            # Index PyOb instance attribute
+            index_pyob_attr(pyob=pyob, name=name, value=value)
+
+        # Check if the write is type checked
+        if check_types:
+
+            # Mark the attribute as pending a type check
+            # So that an attribute written many times is type checked once
+            self.pending[(id(pyob), name)] = pyob
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOG INSERT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def log_insert(self, pyobs):
+        """Logs PyOb instances added to a store"""
+
+        # Log inserts
+        self.log.extend((INSERT, pyob, None, Nothing) for pyob in pyobs)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOG REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def log_remove(self, pyob):
+        """Logs a PyOb instance removed from a store"""
+
+        # Log removal
+        self.log.append((REMOVE, pyob, None, Nothing))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COMMIT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def commit(self):
+        """Type checks the final values of the written attributes once"""
+
+        # Check if nested
+        if self.parent is not None:
+
+            # Hand the log and pending type checks over to the enclosing transaction
+            # So that they are applied once, and undone if it rolls back
+            self.parent.log.extend(self.log)
+            self.parent.pending.update(self.pending)
+
+            # Return
+            return
+
+        # Initialize try-except block
+        try:
+
+            # Iterate over pending PyOb instances and attribute names
+            for (_, name), pyob in self.pending.items():
+
+                # Continue if PyOb instance is no longer stored
+                if pyob not in pyob.__class__.PyObMeta.store._counts_by_pyob:
+                    continue
+
+                # Get value
+                value = getattr(pyob, name, Nothing)
+
+                # Check if value is defined
+                if value is not Nothing:
+
+                    # Validate PyOb instance attribute
+                    validate_pyob_attr(pyob=pyob, name=name, value=value)
+
+        # Handle invalid values
+        except Exception:
+
+            # Undo every write of the transaction
+            self.rollback()
+
+            # Re-raise exception
+            raise
+
+        # Reset log and pending
+        self.log = []
+        self.pending = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ROLLBACK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def rollback(self):
+        """Undoes the logged writes in reverse order, in time linear to their number"""
+
+        # Suspend transactions so that undoing a write does not log it again
+        token = current_transaction.set(None)
+
+        # Initialize try-finally block
+        try:
+
+            # Iterate over log entries from last to first
+            for operation, pyob, name, value in reversed(self.log):
+
+                # Get PyOb class
+                PyObClass = pyob.__class__
+
+                # Get store
+                store = PyObClass.PyObMeta.store
+
+                # Check if PyOb instance was inserted
+                if operation == INSERT:
+
+                    # Remove PyOb instance from every index
+                    store._remove(pyob)
+
+                # Otherwise check if PyOb instance was removed
+                elif operation == REMOVE:
+
+                    # Reattach PyOb instance
+                    self.reattach(pyob)
+
+                # Otherwise undo attribute write
+                else:
+
+                    # Hold the lock of the family if any
+                    with store._family.locked():
+
+                        # Restore attribute
+                        self.restore(pyob, name, value)
+
+                    # Persist the restored state if the store needs to
+                    store._save(pyob)
+
+        # Restore transactions
+        finally:
+            current_transaction.reset(token)
+
+        # Reset log and pending
+        self.log = []
+        self.pending = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REATTACH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def reattach(pyob):
+        """Indexes and stores a removed PyOb instance again"""
+
+        # Get PyOb class
+        PyObClass = pyob.__class__
+
+        # Get PyOb instance ID
+        pyob_id = id(pyob)
+
+        # Track the writes of the PyOb instance again
+        untracked_pyob_ids.discard(pyob_id)
+        detached_weakrefs_by_id.pop(pyob_id, None)
+
+        # Get the key index entries of the PyOb instance
+        # NOTE: Every later holder of these keys has been rolled back already
+        pyobs_by_key = {
+            value: pyob
+            for value in (getattr(pyob, key, None) for key in PyObClass.PyObMeta.keys)
+            if value is not None
+        }
+
+        # Hold the lock of the family if any
+        with PyObClass.PyObMeta.store._family.locked():
+
+            # Index and store the PyOb instance
+            store_pyobs(PyObClass=PyObClass, pyobs=(pyob,), pyobs_by_key=pyobs_by_key)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RESTORE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def restore(pyob, name, value):
+        """Sets a PyOb instance attribute back to its previous value and indexes it"""
+
+        # Check if the attribute was set on the PyOb instance before
+        if value is not Nothing:
+
+            # Move PyOb instance from its current value to its previous one
+            index_pyob_attr(pyob=pyob, name=name, value=value)
+
+            # Set attribute, bypassing PyOb.__setattr__
+            object.__setattr__(pyob, name, value)
+
+            # Return
+            return
+
+        # Remove the current value from every index
+        deindex_pyob_attr(pyob=pyob, name=name)
+
+        # Delete attribute, bypassing any wrapped __delattr__
+        object.__delattr__(pyob, name)
+
+        # Get the class-level default if any
+        value = getattr(pyob, name, Nothing)
+
+        # Get PyObMeta
+        PyObMeta = pyob.__class__.PyObMeta
+
+        # Check if a class-level default key or index is uncovered
+        # i.e. As indexed by the metaclass when the PyOb instance was created
+        if value is not Nothing and (
+            name in PyObMeta.keys
+            or name in PyObMeta.indexes
+            or name in PyObMeta.ordered_indexes
+        ):
+
+            # Index class-level default
+            index_pyob_attr(pyob=pyob, name=name, value=value)
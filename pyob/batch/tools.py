@@ -0,0 +1,17 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.batch.classes import PyObTransaction
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TRANSACTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def transaction():
+    """Returns a context in which the writes to every PyOb store are undo logged"""
+
+    # Return a transaction that covers every store
+    return PyObTransaction()
@@ -0,0 +1,5 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.column.classes import PyObColumn, PyObColumns  # noqa
@@ -0,0 +1,378 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from array import array
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.exceptions import NonExistentPyObError
+from pyob.utils import Nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define array typecodes by type hint
+# i.e. The primitive types that can be packed into a compact array
+TYPECODES = {int: "q", float: "d"}
+
+# Define is set flags
+# i.e. Whether the field of a row is unset, set in the array or set but kept aside
+UNSET, PACKED, KEPT_ASIDE = 0, 1, 2
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB COLUMN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObColumn:
+    """A descriptor that stores the values of one field of a columnar PyOb class"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, name, type_hint=None, default=Nothing):
+        """Init Method"""
+
+        # Set field name
+        self.name = name
+
+        # Set class-level default
+        # i.e. The value read from rows where the field has not been set
+        self.default = default
+
+        # Get array typecode of the type hint if any
+        typecode = TYPECODES.get(type_hint)
+
+        # Set packed type
+        # i.e. The exact type of the values packed into the array, None if a list
+        self.type = typecode and type_hint
+
+        # Initialize values to an array if primitive or otherwise a list
+        self.values = array(typecode) if typecode else []
+
+        # Initialize is set flags
+        # i.e. A byte per row of whether and where the field has been set
+        self.is_set = bytearray()
+
+        # Initialize overflow
+        # i.e. A map of row to the values kept aside as they cannot be packed into the
+        # array, e.g. a bool in an int column, which would read back as 1
+        self.overflow = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GET__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __get__(self, pyob, PyObClass=None):
+        """Get Method"""
+
+        # Return column if accessed from the class
+        if pyob is None:
+            return self
+
+        # Get row
+        row = pyob._row
+
+        # Initialize try-except block
+        try:
+
+            # Get is set flag
+            is_set = self.is_set[row]
+
+        # Handle PyOb instances cleared from their store, whose row is None
+        except TypeError:
+            is_set = UNSET
+
+        # Return value if set in the array
+        if is_set == PACKED:
+            return self.values[row]
+
+        # Return value if kept aside
+        if is_set:
+            return self.overflow[row]
+
+        # Return class-level default if any
+        if self.default is not Nothing:
+            return self.default
+
+        # Raise AttributeError
+        raise AttributeError(
+            f"'{pyob.__class__.__name__}' object has no attribute '{self.name}'"
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SET__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __set__(self, pyob, value):
+        """Set Method"""
+
+        # Get row
+        row = pyob._row
+
+        # Check if the PyOb instance has been cleared from its store
+        if row is None:
+
+            # Raise NonExistentPyObError
+            raise NonExistentPyObError(
+                f"{pyob.__class__.__name__} instance was cleared from its store and "
+                f"can no longer set '{self.name}'"
+            )
+
+        # Check if the value is not of the packed type
+        if self.type is not None and type(value) is not self.type:
+
+            # Check if the value is an int that a float column holds exactly
+            if self.type is float and type(value) is int and float(value) == value:
+
+                # Coerce value to float
+                value = float(value)
+
+            # Otherwise keep the value aside rather than unpacking the whole column
+            else:
+
+                # Keep value aside and return
+                self._keep_aside(row, value)
+                return
+
+        # Initialize try-except block
+        try:
+
+            # Write value through to the column
+            self.values[row] = value
+
+        # Handle ints that do not fit the packed array
+        except OverflowError:
+
+            # Keep value aside and return
+            self._keep_aside(row, value)
+            return
+
+        # Check if a previous value of the row was kept aside
+        if self.is_set[row] == KEPT_ASIDE:
+
+            # Remove previous value
+            del self.overflow[row]
+
+        # Flag value as set in the array
+        self.is_set[row] = PACKED
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __DELETE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __delete__(self, pyob):
+        """Delete Method"""
+
+        # Get row
+        row = pyob._row
+
+        # Check if value is not set
+        # NOTE: The row is None if the PyOb instance has been cleared from its store
+        if row is None or not self.is_set[row]:
+
+            # Raise AttributeError
+            raise AttributeError(self.name)
+
+        # Clear row
+        self._clear(row)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _clear(self, row):
+        """Blanks a row so that it no longer references its value"""
+
+        # Blank value
+        self.values[row] = None if self.type is None else 0
+
+        # Remove any value kept aside for the row
+        self.overflow.pop(row, None)
+
+        # Flag value as unset
+        self.is_set[row] = UNSET
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _KEEP ASIDE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _keep_aside(self, row, value):
+        """Sets the value of a row that cannot be packed into the array"""
+
+        # Blank packed value
+        self.values[row] = 0
+
+        # Keep value aside
+        self.overflow[row] = value
+
+        # Flag value as kept aside
+        self.is_set[row] = KEPT_ASIDE
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ READ
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def read(self, row):
+        """Returns the value set in a row"""
+
+        # Return value if kept aside
+        if self.is_set[row] == KEPT_ASIDE:
+            return self.overflow[row]
+
+        # Return value set in the array
+        return self.values[row]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ IS FULL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def is_full(self):
+        """Returns a boolean of whether the field is set in every row of the array"""
+
+        # Return whether no row is unset or kept aside
+        return not self.overflow and self.is_set.find(UNSET) == -1
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB COLUMNS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObColumns(dict):
+    """A map of field name to PyObColumn that allocates rows to PyOb instances"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, *args, **kwargs):
+        """Init Method"""
+
+        # Call parent init method
+        super().__init__(*args, **kwargs)
+
+        # Initialize size
+        # i.e. The number of rows allocated, including free rows
+        self.size = 0
+
+        # Initialize free rows
+        # i.e. Rows released by collected PyOb instances, to be reused
+        self.free_rows = set()
+
+        # Initialize is ordered to True
+        # i.e. Whether each row is the position of its PyOb instance in the store
+        self.is_ordered = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ALLOCATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def allocate(self):
+        """Returns a blank row for a new PyOb instance"""
+
+        # Check if there are free rows
+        if self.free_rows:
+
+            # Reused rows no longer follow the order of the store
+            self.is_ordered = False
+
+            # Return a free row
+            return self.free_rows.pop()
+
+        # Iterate over columns
+        for column in self.values():
+
+            # Append a blank value
+            column.values.append(None if column.type is None else 0)
+
+            # Append an unset flag
+            column.is_set.append(0)
+
+        # Increment size
+        self.size += 1
+
+        # Return the new row
+        return self.size - 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FREE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def free(self, row):
+        """Releases the row of a collected PyOb instance"""
+
+        # Iterate over columns
+        for column in self.values():
+
+            # Clear row
+            column._clear(row)
+
+        # Add row to free rows
+        self.free_rows.add(row)
+
+        # Trim free rows off the end of the columns
+        # e.g. The row of a PyOb instance whose initialization failed
+        while self.size - 1 in self.free_rows:
+
+            # Remove last row from free rows
+            self.free_rows.remove(self.size - 1)
+
+            # Iterate over columns
+            for column in self.values():
+
+                # Remove last row
+                column.values.pop()
+                column.is_set.pop()
+
+            # Decrement size
+            self.size -= 1
+
+        # Reset is ordered once the columns are empty
+        if not self.size:
+            self.is_ordered = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RESET
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def reset(self, pyobs):
+        """Releases every row, including those of PyOb instances still in memory"""
+
+        # Iterate over PyOb instances
+        for pyob in pyobs:
+
+            # Release row so that the PyOb instance no longer reads or frees it
+            object.__setattr__(pyob, "_row", None)
+
+        # Iterate over columns
+        for column in self.values():
+
+            # Replace values, flags and overflow rather than emptying them in place
+            # NOTE: So that zero-copy views of the previous values stay valid
+            column.values = column.values[:0]
+            column.is_set = bytearray()
+            column.overflow = {}
+
+        # Reset size, free rows and is ordered
+        self.size = 0
+        self.free_rows = set()
+        self.is_ordered = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ TRACK ORDER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def track_order(self, pyobs, start):
+        """Checks that PyOb instances added to the store at start are in row order"""
+
+        # Set is ordered to whether every PyOb instance is at the row of its position
+        self.is_ordered = self.is_ordered and all(
+            pyob._row == row for row, pyob in enumerate(pyobs, start)
+        )
@@ -0,0 +1,5 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.disk.classes import PyObDiskFile, PyObDiskKeyIndex, PyObDiskRecords  # noqa
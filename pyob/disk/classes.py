@@ -0,0 +1,649 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import io
+import mmap
+import os
+import pickle
+import tempfile
+
+from array import array
+from itertools import repeat
+from weakref import WeakValueDictionary, ref
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.main.tools.state import get_pyob_state, set_pyob_state
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the minimum number of bytes by which a disk file grows
+MIN_GROWTH = 1 << 16
+
+# Define the length of a deleted record
+DELETED = -1
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RECORD PICKLER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class RecordPickler(pickle.Pickler):
+    """A pickler of PyOb instance state that refuses references to PyOb instances"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REDUCER OVERRIDE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def reducer_override(self, obj):
+        """Raises PicklingError for PyOb instances and reduces anything else as usual"""
+
+        # Reduce anything but a PyOb instance as usual
+        if isinstance(obj, type) or not hasattr(obj.__class__, "PyObMeta"):
+            return NotImplemented
+
+        # Raise PicklingError
+        # NOTE: A copy of the PyOb instance would be detached from its store on load
+        raise pickle.PicklingError(
+            f"A disk-backed PyOb instance cannot reference a PyOb instance: {obj!r}"
+        )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB DISK FILE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObDiskFile:
+    """An append-only temporary file of records, accessed through mmap"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self):
+        """Init Method"""
+
+        # Initialize file
+        # NOTE: An anonymous file is deleted by the OS as soon as it is closed
+        self._file = tempfile.TemporaryFile()
+
+        # Initialize map to None until there is something to map
+        self._mmap = None
+
+        # Initialize size
+        # i.e. The number of bytes written, up to which records are valid
+        self.size = 0
+
+        # Initialize capacity
+        # i.e. The number of bytes mapped, which grows ahead of the size
+        self._capacity = 0
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GROW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _grow(self, minimum):
+        """Extends the file and its map to at least a minimum number of bytes"""
+
+        # Get new capacity, doubling so that appends are amortized
+        capacity = max(minimum, 2 * self._capacity, MIN_GROWTH)
+
+        # Close the current map if any
+        # NOTE: A file cannot be resized while mapped on some platforms
+        if self._mmap is not None:
+            self._mmap.close()
+
+        # Extend file
+        os.ftruncate(self._file.fileno(), capacity)
+
+        # Map file
+        self._mmap = mmap.mmap(self._file.fileno(), capacity)
+
+        # Set capacity
+        self._capacity = capacity
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ APPEND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def append(self, data):
+        """Appends bytes to the file and returns their offset"""
+
+        # Get offset and end
+        offset = self.size
+        end = offset + len(data)
+
+        # Grow file if the bytes do not fit
+        if end > self._capacity:
+            self._grow(end)
+
+        # Write bytes through the map
+        self._mmap[offset:end] = data
+
+        # Set size
+        self.size = end
+
+        # Return offset
+        return offset
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ READ
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def read(self, offset, length):
+        """Returns the bytes of a record"""
+
+        # Return bytes
+        return self._mmap[offset : offset + length]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def clear(self):
+        """Discards every record and releases the disk space they used"""
+
+        # Close the current map if any
+        if self._mmap is not None:
+            self._mmap.close()
+
+        # Reset map
+        self._mmap = None
+
+        # Truncate file
+        os.ftruncate(self._file.fileno(), 0)
+
+        # Reset size and capacity
+        self.size = self._capacity = 0
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB DISK RECORDS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObDiskRecords:
+    """A map of PyOb instance to count whose instances live on disk between uses"""
+
+    # NOTE: This stands in for the counts by PyOb dictionary of a PyObDiskStore, so
+    # instances are materialized on access and released once no longer referenced
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, PyObClass):
+        """Init Method"""
+
+        # Set PyOb class
+        self._PyObClass = PyObClass
+
+        # Initialize file
+        self._file = PyObDiskFile()
+
+        # Initialize offsets and lengths
+        # i.e. The location of each record in the file by record number
+        self._offsets = array("q")
+        self._lengths = array("q")
+
+        # Initialize count
+        # i.e. The number of records that have not been deleted
+        self._count = 0
+
+        # Initialize PyObs by record
+        # i.e. The PyOb instances of records that are currently in memory
+        self._pyobs_by_record = WeakValueDictionary()
+
+        # Initialize records by ID
+        # i.e. The record numbers of the PyOb instances that are currently in memory
+        self._records_by_id = {}
+
+        # Initialize weakrefs by ID
+        # i.e. Weak references that forget a record number once its instance is gone
+        self._weakrefs_by_id = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __CONTAINS__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __contains__(self, pyob):
+        """Contains Method"""
+
+        # Return whether the PyOb instance is the one in memory for its record
+        return self.get_record(pyob) is not None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getitem__(self, pyob):
+        """Get Item Method"""
+
+        # Raise KeyError if the PyOb instance is not stored
+        if pyob not in self:
+            raise KeyError(pyob)
+
+        # Return count
+        return 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self):
+        """Iterate Method"""
+
+        # Iterate over record numbers
+        # NOTE: Records deleted or added during iteration are skipped
+        for record in range(len(self._lengths)):
+
+            # Continue if record has been deleted
+            if self._lengths[record] == DELETED:
+                continue
+
+            # Yield PyOb instance
+            yield self.materialize(record)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self):
+        """Length Method"""
+
+        # Return count
+        return self._count
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _WRITE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _write(self, pyob):
+        """Appends the current state of a PyOb instance and returns its location"""
+
+        # Initialize buffer
+        buffer = io.BytesIO()
+
+        # Pickle state into buffer
+        RecordPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(
+            get_pyob_state(pyob)
+        )
+
+        # Get bytes
+        data = buffer.getvalue()
+
+        # Return offset and length
+        return self._file.append(data), len(data)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _TRACK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _track(self, pyob, record):
+        """Keeps track of a PyOb instance in memory until it is collected"""
+
+        # Get PyOb ID
+        pyob_id = id(pyob)
+
+        # Set PyOb instance of record
+        self._pyobs_by_record[record] = pyob
+
+        # Set record of PyOb ID
+        self._records_by_id[pyob_id] = record
+
+        # Define callback
+        def callback(_, records_by_id=self._records_by_id):
+            """Forgets the record of a collected PyOb instance"""
+
+            # Remove record and weakref of PyOb ID
+            records_by_id.pop(pyob_id, None)
+            weakrefs_by_id.pop(pyob_id, None)
+
+        # Get weakrefs by ID
+        weakrefs_by_id = self._weakrefs_by_id
+
+        # Set weakref of PyOb ID so that the callback fires once the instance is gone
+        weakrefs_by_id[pyob_id] = ref(pyob, callback)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET RECORD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get_record(self, pyob):
+        """Returns the record number of a stored PyOb instance or None"""
+
+        # Get record of PyOb ID
+        record = self._records_by_id.get(id(pyob))
+
+        # Return record if it belongs to this very PyOb instance
+        # NOTE: An ID may have been reused by an unrelated object
+        if record is not None and self._pyobs_by_record.get(record) is pyob:
+            return record
+
+        # Return None
+        return None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MATERIALIZE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def materialize(self, record):
+        """Returns the PyOb instance of a record, loading it from disk if needed"""
+
+        # Get PyOb instance if already in memory
+        pyob = self._pyobs_by_record.get(record)
+
+        # Return PyOb instance if in memory
+        if pyob is not None:
+            return pyob
+
+        # Get the state of the record
+        state = pickle.loads(
+            self._file.read(self._offsets[record], self._lengths[record])
+        )
+
+        # Create a blank PyOb instance without initializing it
+        pyob = self._PyObClass.__new__(self._PyObClass)
+
+        # Restore state without validating or indexing it
+        set_pyob_state(pyob, state)
+
+        # Track PyOb instance
+        self._track(pyob, record)
+
+        # Return PyOb instance
+        return pyob
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ITEMS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def items(self):
+        """Returns an iterator of (PyOb, count) pairs"""
+
+        # Return PyOb instances with a count of 1
+        return ((pyob, 1) for pyob in self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def values(self):
+        """Returns an iterator of counts"""
+
+        # Return a count of 1 per record
+        return repeat(1, self._count)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ UPDATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def update(self, counts_by_pyob):
+        """Writes a record for each PyOb instance"""
+
+        # Write the state of every PyOb instance before adding any record
+        # So that a PyOb instance that cannot be written leaves no record behind
+        locations = [(pyob, *self._write(pyob)) for pyob in counts_by_pyob]
+
+        # Iterate over PyOb instances and the locations of their states
+        for pyob, offset, length in locations:
+
+            # Add record
+            self._offsets.append(offset)
+            self._lengths.append(length)
+
+            # Track PyOb instance under its record number
+            self._track(pyob, len(self._lengths) - 1)
+
+            # Increment count
+            self._count += 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SAVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def save(self, pyob):
+        """Writes the current state of a stored PyOb instance as its record"""
+
+        # Get record
+        record = self.get_record(pyob)
+
+        # Return if the PyOb instance is not stored
+        # e.g. While it is still being initialized
+        if record is None:
+            return
+
+        # Append state and point the record at it
+        # NOTE: The previous state is left behind as the file is append-only
+        self._offsets[record], self._lengths[record] = self._write(pyob)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ POP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def pop(self, pyob, *default):
+        """Deletes the record of a PyOb instance and returns its count"""
+
+        # Get record
+        record = self.get_record(pyob)
+
+        # Check if the PyOb instance is not stored
+        if record is None:
+
+            # Return default if any
+            if default:
+                return default[0]
+
+            # Raise KeyError
+            raise KeyError(pyob)
+
+        # Mark record as deleted
+        self._lengths[record] = DELETED
+
+        # Forget PyOb instance
+        del self._pyobs_by_record[record]
+
+        # Decrement count
+        self._count -= 1
+
+        # Return count
+        return 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def clear(self):
+        """Deletes every record"""
+
+        # Clear file
+        self._file.clear()
+
+        # Reset records
+        self._offsets = array("q")
+        self._lengths = array("q")
+        self._count = 0
+
+        # Forget PyOb instances in memory
+        self._pyobs_by_record.clear()
+        self._records_by_id.clear()
+        self._weakrefs_by_id.clear()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOADED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def loaded(self):
+        """Returns a list of the stored PyOb instances currently in memory"""
+
+        # Return PyOb instances in memory
+        return list(self._pyobs_by_record.values())
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB DISK KEY INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObDiskKeyIndex:
+    """A map of key value to PyOb instance that holds record numbers in memory"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, records):
+        """Init Method"""
+
+        # Set records
+        self._records = records
+
+        # Initialize records by key
+        self._records_by_key = {}
+
+        # Initialize pending PyObs by key
+        # i.e. Keys of PyOb instances being created, which have no record yet
+        self._pending = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __CONTAINS__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __contains__(self, key):
+        """Contains Method"""
+
+        # Return whether key is indexed
+        return key in self._records_by_key or key in self._pending
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getitem__(self, key):
+        """Get Item Method"""
+
+        # Return pending PyOb instance if any
+        if key in self._pending:
+            return self._pending[key]
+
+        # Return the PyOb instance of the record
+        return self._records.materialize(self._records_by_key[key])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setitem__(self, key, pyob):
+        """Set Item Method"""
+
+        # Get record
+        record = self._records.get_record(pyob)
+
+        # Check if the PyOb instance has no record yet
+        if record is None:
+
+            # Hold PyOb instance until it is stored
+            self._pending[key] = pyob
+
+        # Otherwise index the record
+        else:
+
+            # Set record of key
+            self._records_by_key[key] = record
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self):
+        """Iterate Method"""
+
+        # Yield keys
+        yield from list(self._records_by_key)
+        yield from list(self._pending)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self):
+        """Length Method"""
+
+        # Return number of keys
+        return len(self._records_by_key) + len(self._pending)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get(self, key, default=None):
+        """Returns the PyOb instance of a key or a default"""
+
+        # Return PyOb instance if key is indexed
+        return self[key] if key in self else default
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ POP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def pop(self, key, *default):
+        """Removes a key and returns its record number or pending PyOb instance"""
+
+        # Return pending PyOb instance if any
+        if key in self._pending:
+            return self._pending.pop(key)
+
+        # Return record number
+        return self._records_by_key.pop(key, *default)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ UPDATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def update(self, pyobs_by_key):
+        """Indexes several keys at once"""
+
+        # Iterate over keys and PyOb instances
+        for key, pyob in pyobs_by_key.items():
+
+            # Index key
+            self[key] = pyob
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FLUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def flush(self):
+        """Indexes the records of pending PyOb instances that have since been stored"""
+
+        # Iterate over pending keys and PyOb instances
+        for key, pyob in list(self._pending.items()):
+
+            # Get record
+            record = self._records.get_record(pyob)
+
+            # Continue if the PyOb instance has not been stored yet
+            if record is None:
+                continue
+
+            # Index record and release PyOb instance
+            self._records_by_key[key] = record
+            del self._pending[key]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def clear(self):
+        """Removes every key"""
+
+        # Clear records by key and pending PyOb instances
+        self._records_by_key.clear()
+        self._pending.clear()
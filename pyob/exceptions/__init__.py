@@ -16,6 +16,24 @@ class InvalidKeyError(Exception):
     """Invalid Key Error"""
 
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INVALID SNAPSHOT ERROR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class InvalidSnapshotError(Exception):
+    """Invalid Snapshot Error"""
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INVALID STORAGE ERROR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class InvalidStorageError(Exception):
+    """Invalid Storage Error"""
+
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ INVALID TYPE ERROR
 # └─────────────────────────────────────────────────────────────────────────────────────
@@ -25,6 +43,24 @@ class InvalidTypeError(Exception):
     """Invalid Type Error"""
 
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INVALID VALIDATION MODE ERROR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class InvalidValidationModeError(Exception):
+    """Invalid Validation Mode Error"""
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NON-EXISTENT INDEX ERROR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class NonExistentIndexError(Exception):
+    """Non-existent Index Error"""
+
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ NON-EXISTENT KEY ERROR
 # └─────────────────────────────────────────────────────────────────────────────────────
@@ -32,3 +68,12 @@ class InvalidTypeError(Exception):
 
 class NonExistentKeyError(Exception):
     """Non-existent Key Error"""
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NON-EXISTENT PYOB ERROR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class NonExistentPyObError(Exception):
+    """Non-existent PyOb Error"""
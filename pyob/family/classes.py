@@ -0,0 +1,173 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from contextlib import nullcontext
+from threading import RLock
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define a lock that does nothing, held in place of that of a family without one
+NULL_LOCK = nullcontext()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB FAMILY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObFamily:
+    """A group of PyOb stores connected by inheritance that share one key index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize stores to None
+    # i.e. The PyOb stores of every PyOb class in the family
+    _stores = None
+
+    # Initialize stores by key to None
+    # i.e. A map of key value to the store holding it, or a list of stores if several
+    # PyOb classes of the family that do not validate each other's keys hold it
+    _stores_by_key = None
+
+    # Initialize lock to None
+    # i.e. An RLock serializing the key checks and index writes of a thread-safe family
+    _lock = None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, store):
+        """Init Method"""
+
+        # Initialize stores
+        self._stores = [store]
+
+        # Initialize stores by key
+        self._stores_by_key = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self):
+        """Length Method"""
+
+        # Return number of indexed key values
+        return len(self._stores_by_key)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, key, store):
+        """Indexes a key value to the store that holds it"""
+
+        # Get stores by key
+        stores_by_key = self._stores_by_key
+
+        # Get existing entry
+        entry = stores_by_key.get(key)
+
+        # Check if key is not yet indexed
+        if entry is None:
+
+            # Index key to store
+            stores_by_key[key] = store
+
+        # Otherwise check if key is held by several stores
+        elif type(entry) is list:
+
+            # Add store to stores if not present
+            if store not in entry:
+                entry.append(store)
+
+        # Otherwise check if key is held by another store
+        elif entry is not store:
+
+            # Index key to both stores
+            stores_by_key[key] = [entry, store]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DISCARD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def discard(self, key, store):
+        """Removes the index of a key value to a store if present"""
+
+        # Get stores by key
+        stores_by_key = self._stores_by_key
+
+        # Get existing entry
+        entry = stores_by_key.get(key)
+
+        # Check if key is indexed to the store alone
+        if entry is store:
+
+            # Remove key
+            stores_by_key.pop(key)
+
+        # Otherwise check if key is held by several stores
+        elif type(entry) is list and store in entry:
+
+            # Remove store from stores
+            entry.remove(store)
+
+            # Collapse stores back to a single store if only one remains
+            if len(entry) == 1:
+                stores_by_key[key] = entry[0]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOCKED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def locked(self):
+        """Returns the lock of the family as a context manager, or a no-op if none"""
+
+        # Return lock or a lock that does nothing
+        return self._lock or NULL_LOCK
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MAKE THREADSAFE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def make_threadsafe(self):
+        """Gives the family a lock if it does not have one already"""
+
+        # Initialize lock if None
+        # NOTE: Re-entrant as a locked bulk insert goes on to insert into the store
+        self._lock = self._lock or RLock()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MERGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def merge(self, family):
+        """Absorbs the stores and key index of another family into this one"""
+
+        # Iterate over the key index of the other family
+        for key, entry in family._stores_by_key.items():
+
+            # Iterate over the stores that hold the key
+            for store in entry if type(entry) is list else (entry,):
+
+                # Index key to store
+                self.add(key, store)
+
+        # Iterate over the stores of the other family
+        for store in family._stores:
+
+            # Move store into this family
+            store._family = self
+
+        # Add the stores of the other family to the stores
+        self._stores.extend(family._stores)
+
+        # Inherit the lock of the other family if this one has none
+        # i.e. A family is thread-safe as a whole if any of its members is
+        self._lock = self._lock or family._lock
@@ -0,0 +1,246 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from weakref import ref
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB ORDERED INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObOrderedIndex:
+    """A sorted index of the values of a single field of a PyOb store"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize values to None
+    # i.e. The sorted field values of all indexed PyOb instances
+    _values = None
+
+    # Initialize PyObs to None
+    # i.e. The PyOb instances aligned position by position with values
+    _pyobs = None
+
+    # Initialize is weak to False
+    # i.e. Whether PyOb instances are held by weak reference
+    _is_weak = False
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, weak=False):
+        """Init Method"""
+
+        # Initialize values
+        self._values = []
+
+        # Initialize PyObs
+        self._pyobs = []
+
+        # Set is weak
+        self._is_weak = weak
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET PYOB
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_pyob(self, index):
+        """Returns the PyOb instance at a position, or None if it has been collected"""
+
+        # Get entry
+        entry = self._pyobs[index]
+
+        # Return PyOb instance
+        return entry() if self._is_weak else entry
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self):
+        """Length Method"""
+
+        # Return number of indexed PyOb instances
+        return len(self._values)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CHECK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def check(self, values):
+        """Raises a TypeError if values cannot be ordered together and by the index"""
+
+        # Sort values, skipping None as it is never indexed
+        values = sorted(value for value in values if value is not None)
+
+        # Return if there are no values or no indexed values to order them against
+        if not values or not self._values:
+            return
+
+        # Order the lowest and highest values against the index
+        # i.e. The same comparisons that inserting them would make
+        bisect_right(self._values, values[0])
+        bisect_right(self._values, values[-1])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, pyob, value):
+        """Inserts a PyOb instance at the sorted position of its value
+
+        Inserting shifts every later position of both lists, i.e. O(n) per write, so
+        batches of PyOb instances are added with extend instead.
+        """
+
+        # Return if value is None
+        # None cannot be ordered against other values and so is never indexed
+        if value is None:
+            return
+
+        # Get insertion index
+        # i.e. After any equal values so that ties keep their insertion order
+        index = bisect_right(self._values, value)
+
+        # Insert value and PyOb instance
+        self._values.insert(index, value)
+        self._pyobs.insert(index, ref(pyob) if self._is_weak else pyob)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXTEND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def extend(self, pairs):
+        """Inserts a batch of (PyOb, value) pairs, sorting once instead of per insert"""
+
+        # Get is weak
+        is_weak = self._is_weak
+
+        # Get the new entries, skipping None as it is never indexed
+        entries = [
+            (value, ref(pyob) if is_weak else pyob)
+            for pyob, value in pairs
+            if value is not None
+        ]
+
+        # Return if there are no new entries
+        if not entries:
+            return
+
+        # Sort the indexed and new entries together by value
+        # NOTE: The sort is stable so that ties keep their insertion order, and merges
+        # the already sorted index in linear time
+        entries = [*zip(self._values, self._pyobs), *entries]
+        entries.sort(key=itemgetter(0))
+
+        # Set values and PyOb instances
+        self._values = [value for value, _ in entries]
+        self._pyobs = [pyob for _, pyob in entries]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def remove(self, pyob, value):
+        """Removes a PyOb instance indexed under a value"""
+
+        # Return if value is None
+        if value is None:
+            return
+
+        # Get values
+        values = self._values
+
+        # Initialize try-except block
+        try:
+
+            # Get the positions of equal values
+            indices = range(bisect_left(values, value), bisect_right(values, value))
+
+        # Handle values that cannot be ordered against the index
+        # i.e. A class-level default that was never indexed in the first place
+        except TypeError:
+            return
+
+        # Iterate over the positions of equal values
+        for index in indices:
+
+            # Check if position holds the PyOb instance
+            if self._get_pyob(index) is pyob:
+
+                # Remove value and PyOb instance
+                del values[index]
+                del self._pyobs[index]
+
+                # Break
+                break
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ITEMS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """Yields (value, PyOb) pairs with lo <= value <= hi in sorted order"""
+
+        # Get values
+        values = self._values
+
+        # Get start index
+        start = 0 if lo is None else bisect_left(values, lo)
+
+        # Get stop index
+        stop = len(values) if hi is None else bisect_right(values, hi)
+
+        # Get a snapshot of the values and PyOb instances in range
+        # So that writes or collections during iteration cannot shift positions
+        values, pyobs = values[start:stop], self._pyobs[start:stop]
+
+        # Reverse values and PyOb instances if reverse
+        if reverse:
+            values.reverse()
+            pyobs.reverse()
+
+        # Iterate over values and PyOb instances
+        for value, pyob in zip(values, pyobs):
+
+            # Dereference PyOb instance if weak
+            pyob = pyob() if self._is_weak else pyob
+
+            # Yield value and PyOb instance unless it has been collected
+            if pyob is not None:
+                yield value, pyob
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PURGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def purge(self, value):
+        """Removes the collected PyOb instances of a weak index indexed under a value"""
+
+        # Return if value is None
+        if value is None:
+            return
+
+        # Get values
+        values = self._values
+
+        # Get the positions of equal values
+        indices = range(bisect_left(values, value), bisect_right(values, value))
+
+        # Iterate backwards over positions
+        # So that deleting a position does not shift the positions yet to be visited
+        for index in reversed(indices):
+
+            # Check if the PyOb instance at position has been collected
+            if self._get_pyob(index) is None:
+
+                # Remove value and PyOb instance
+                del values[index]
+                del self._pyobs[index]
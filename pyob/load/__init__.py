@@ -0,0 +1,6 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.load.classes import PyObLoadBatch, PyObRowError  # noqa
+from pyob.load.tools import load_csv, load_jsonl  # noqa
@@ -0,0 +1,107 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB ROW ERROR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObRowError:
+    """A row of a loaded file that could not be turned into a PyOb instance"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, row, data, error):
+        """Init Method"""
+
+        # Set row
+        # i.e. The line number of the row in the file
+        self.row = row
+
+        # Set data
+        # i.e. The parsed row, or the raw line if it could not be parsed
+        self.data = data
+
+        # Set error
+        # e.g. A DuplicateKeyError or InvalidTypeError instance
+        self.error = error
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self):
+        """Representation Method"""
+
+        # Return representation
+        return f"<PyObRowError: row {self.row}: {self.kind}: {self.error}>"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ KIND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def kind(self):
+        """Returns the name of the error class, e.g. DuplicateKeyError"""
+
+        # Return name of error class
+        return self.error.__class__.__name__
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB LOAD BATCH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObLoadBatch:
+    """The outcome of loading one batch of rows into a PyOb store"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number, rows, pyobs, errors, seconds):
+        """Init Method"""
+
+        # Set number
+        # i.e. The position of the batch in the file, starting at 1
+        self.number = number
+
+        # Set rows
+        # i.e. The number of rows read for the batch
+        self.rows = rows
+
+        # Set PyObs
+        # i.e. The PyOb instances created and stored from the batch
+        self.pyobs = pyobs
+
+        # Set errors
+        # i.e. A PyObRowError per row of the batch that was skipped
+        self.errors = errors
+
+        # Set seconds
+        # i.e. The time taken to parse, validate and store the batch
+        self.seconds = seconds
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self):
+        """Representation Method"""
+
+        # Return representation
+        return (
+            f"<PyObLoadBatch {self.number}: {self.rows} rows, {len(self.pyobs)} "
+            f"loaded, {len(self.errors)} errors, {self.rate:,.0f} rows/s>"
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def rate(self):
+        """Returns the throughput of the batch in rows per second"""
+
+        # Return rows per second
+        return self.rows / self.seconds if self.seconds else float("inf")
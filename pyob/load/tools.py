@@ -0,0 +1,461 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import csv
+import json
+
+from itertools import count, islice
+from time import perf_counter
+from typing import get_args, get_origin
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.load.classes import PyObLoadBatch, PyObRowError
+from pyob.main.tools.bulk import store_pyobs, validate_pyob_keys, validate_pyob_types
+from pyob.main.tools.check import UNION_ORIGINS
+from pyob.main.tools.index import untracked_pyob_ids
+from pyob.main.tools.parallel import get_row_values, validate_rows_in_parallel
+from pyob.main.tools.plan import get_pyob_plan, get_pyob_type_hints
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the default number of rows per batch
+BATCH_SIZE = 1_000
+
+# Define the strings coerced to booleans
+BOOLEANS = {
+    **dict.fromkeys(("true", "t", "yes", "y", "1"), True),
+    **dict.fromkeys(("false", "f", "no", "n", "0"), False),
+}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COERCE VALUE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def coerce_value(hint, value):
+    """Converts a parsed value to the scalar type hint of its field where possible"""
+
+    # Get the types allowed by the type hint
+    # e.g. (int, NoneType) for Optional[int]
+    types = get_args(hint) if get_origin(hint) in UNION_ORIGINS else (hint,)
+
+    # Return value if it is already of an allowed type
+    # NOTE: An exact check so that a bool is never taken for an int
+    if type(value) in types:
+        return value
+
+    # Return None for an empty string if allowed
+    if value == "" and type(None) in types:
+        return None
+
+    # Iterate over the scalar types allowed by the type hint
+    for Type in (t for t in types if t in (bool, int, float, str)):
+
+        # Check if value should be read as a boolean
+        if Type is bool:
+
+            # Return boolean if the value spells one
+            if type(value) is str and value.strip().lower() in BOOLEANS:
+                return BOOLEANS[value.strip().lower()]
+
+            # Return boolean if the value is 0 or 1
+            if type(value) is int and value in (0, 1):
+                return bool(value)
+
+            # Try the next type
+            continue
+
+        # Initialize try-except block
+        try:
+
+            # Convert value
+            converted = Type(value)
+
+        # Handle values that cannot be converted to the type
+        except (TypeError, ValueError):
+            continue
+
+        # Return converted value unless it is a float truncated to an int
+        if type(value) is not float or converted == value:
+            return converted
+
+    # Return value as is so that validation reports it as an invalid type
+    return value
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COERCE ROW
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def coerce_row(type_hints, row):
+    """Returns a row of keyword arguments with values coerced to their type hints"""
+
+    # Return positional rows as is
+    # NOTE: These are only matched to type hints by name once set on the instance
+    if not isinstance(row, dict):
+        return row
+
+    # Return coerced row
+    return {
+        name: coerce_value(type_hints[name], value) if name in type_hints else value
+        for name, value in row.items()
+    }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ READ CSV ROWS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def read_csv_rows(path, **kwargs):
+    """Yields the line number and a dictionary of each row of a CSV file"""
+
+    # Open file
+    with open(path, newline="", encoding=kwargs.pop("encoding", "utf-8")) as file:
+
+        # Initialize reader
+        reader = csv.DictReader(file, **kwargs)
+
+        # Iterate over rows
+        for row in reader:
+
+            # Yield line number and row without the fields missing from a short row
+            # So that the init method falls back to the defaults of those arguments
+            # NOTE: The line number is that of the end of a row spanning several lines
+            yield reader.line_num, {
+                name: value
+                for name, value in row.items()
+                if value is not None or reader.restval is not None
+            }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ READ JSONL ROWS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def read_jsonl_rows(path, **kwargs):
+    """Yields the line number and the parsed object or error of each JSON line"""
+
+    # Open file
+    with open(path, encoding=kwargs.pop("encoding", "utf-8")) as file:
+
+        # Iterate over lines
+        for number, line in enumerate(file, start=1):
+
+            # Continue if line is blank
+            if not line.strip():
+                continue
+
+            # Initialize try-except block
+            try:
+
+                # Yield line number and parsed row
+                yield number, json.loads(line, **kwargs)
+
+            # Handle lines that are not valid JSON
+            except json.JSONDecodeError as error:
+
+                # Yield line number and error in place of a row
+                yield number, error
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ BUILD BATCH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def build_batch(PyObClass, rows, on_error):
+    """Initializes a PyOb instance per row, reporting the rows that fail to init"""
+
+    # Initialize PyObs
+    pyobs = []
+
+    # Iterate over line numbers and rows
+    for number, row in rows:
+
+        # Create a blank PyOb instance
+        pyob = PyObClass.__new__(PyObClass)
+
+        # Mark PyOb instance as untracked so that __setattr__ skips straight through
+        # i.e. Validation and indexing is deferred to the batch as a whole
+        untracked_pyob_ids.add(id(pyob))
+
+        # Initialize try-except block
+        try:
+
+            # Initialize PyOb instance with keyword or positional arguments
+            if isinstance(row, dict):
+                pyob.__init__(**row)
+            else:
+                pyob.__init__(*row)
+
+        # Handle rows that fail to initialize
+        # e.g. Missing arguments or a ValueError raised by the init method
+        except Exception as error:
+
+            # Forget PyOb instance
+            untracked_pyob_ids.discard(id(pyob))
+
+            # Report row
+            on_error(number, row, error)
+            continue
+
+        # Add line number, row and PyOb instance to PyObs
+        pyobs.append((number, row, pyob))
+
+    # Return PyObs
+    return pyobs
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOAD BATCH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def load_batch(PyObClass, rows, executor=None, workers=None, chunk_size=None):
+    """Creates, validates and stores the valid rows of a batch and reports the rest"""
+
+    # Initialize errors
+    errors = []
+
+    # Define on row error
+    def on_row_error(number, row, error):
+        """Reports a row that cannot be loaded"""
+
+        # Add row error to errors
+        errors.append(PyObRowError(row=number, data=row, error=error))
+
+    # Get type hints
+    type_hints = get_pyob_type_hints(PyObClass)
+
+    # Initialize parsed rows
+    parsed = []
+
+    # Iterate over line numbers and rows
+    for number, row in rows:
+
+        # Check if row could not be parsed
+        if isinstance(row, Exception):
+
+            # Report row
+            on_row_error(number, None, row)
+            continue
+
+        # Add row coerced to the type hints of the PyOb class
+        parsed.append((number, coerce_row(type_hints, row)))
+
+    # Check if the rows should be validated across worker processes
+    if executor is not None:
+
+        # Validate the shape and types of the raw rows in worker processes
+        invalid = validate_rows_in_parallel(
+            PyObClass=PyObClass,
+            numbers=[number for number, _ in parsed],
+            rows=[row for _, row in parsed],
+            executor=executor,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
+        # Iterate over line numbers and rows
+        for number, row in parsed:
+
+            # Report row if invalid
+            if number in invalid:
+                on_row_error(number, row, invalid[number])
+
+        # Get the rows still valid
+        parsed = [(number, row) for number, row in parsed if number not in invalid]
+
+    # Initialize a PyOb instance per row
+    built = build_batch(PyObClass=PyObClass, rows=parsed, on_error=on_row_error)
+
+    # Initialize rows by PyOb ID
+    # So that a PyOb instance that fails validation can be traced back to its row
+    rows_by_id = {id(pyob): (number, row) for number, row, pyob in built}
+
+    # Get the row values of each PyOb instance validated in worker processes if any
+    validated = executor and dict(
+        zip(
+            rows_by_id,
+            get_row_values(PyObClass=PyObClass, rows=[row for _, row, _ in built]),
+        )
+    )
+
+    # Define on PyOb error
+    def on_pyob_error(pyob, error):
+        """Reports the row of a PyOb instance that fails validation"""
+
+        # Report row
+        on_row_error(*rows_by_id.pop(id(pyob)), error)
+
+    # Get validation plan
+    plan = get_pyob_plan(PyObClass)
+
+    # Get PyObs
+    pyobs = [pyob for _, _, pyob in built]
+
+    # Initialize try-finally block
+    try:
+
+        # Type check the batch, reporting invalid rows
+        validate_pyob_types(
+            PyObClass=PyObClass,
+            plan=plan,
+            pyobs=pyobs,
+            on_error=on_pyob_error,
+            validated=validated,
+        )
+
+        # Get the PyOb instances still valid
+        pyobs = [pyob for pyob in pyobs if id(pyob) in rows_by_id]
+
+        # Hold the lock of the family if any
+        # So that no other thread can take a key between the check and the insert
+        with PyObClass.PyObMeta.store._family.locked():
+
+            # Validate the keys of the batch, reporting rows with invalid keys
+            pyobs_by_key = validate_pyob_keys(
+                PyObClass=PyObClass, plan=plan, pyobs=pyobs, on_error=on_pyob_error
+            )
+
+            # Get the PyOb instances still valid
+            pyobs = [pyob for pyob in pyobs if id(pyob) in rows_by_id]
+
+            # Index and store the valid PyOb instances
+            store_pyobs(PyObClass=PyObClass, pyobs=pyobs, pyobs_by_key=pyobs_by_key)
+
+    # Clear untracked PyOb IDs whether or not the batch is valid
+    finally:
+
+        # Remove untracked PyOb IDs
+        untracked_pyob_ids.difference_update([id(pyob) for _, _, pyob in built])
+
+    # Return PyOb instances and errors sorted by line number
+    return pyobs, sorted(errors, key=lambda row_error: row_error.row)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOAD ROWS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def load_rows(PyObClass, rows, batch_size, workers=None, chunk_size=None):
+    """Loads numbered rows into a PyOb store batch by batch, yielding each outcome"""
+
+    # Check if the rows should be validated across worker processes
+    if workers:
+
+        # Import process pool executor
+        # NOTE: Deferred as concurrent.futures is only needed once workers are used
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Yield from the batches loaded with a pool of worker processes
+        # NOTE: The pool is shared by every batch and shut down once the file is read
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from load_batches(
+                PyObClass, rows, batch_size, executor, workers, chunk_size
+            )
+
+    # Otherwise validate the rows in this process
+    else:
+
+        # Yield from the batches loaded
+        yield from load_batches(PyObClass, rows, batch_size)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOAD BATCHES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def load_batches(
+    PyObClass, rows, batch_size, executor=None, workers=None, chunk_size=None
+):
+    """Yields the outcome of loading each batch of numbered rows"""
+
+    # Get rows as an iterator so that batches are read lazily
+    rows = iter(rows)
+
+    # Iterate over batch numbers
+    for number in count(start=1):
+
+        # Get start time
+        # NOTE: This includes reading and parsing the rows of the batch
+        start = perf_counter()
+
+        # Get batch
+        batch = list(islice(rows, batch_size))
+
+        # Return if there are no rows left
+        if not batch:
+            return
+
+        # Load batch
+        pyobs, errors = load_batch(
+            PyObClass=PyObClass,
+            rows=batch,
+            executor=executor,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
+        # Yield outcome of batch
+        yield PyObLoadBatch(
+            number=number,
+            rows=len(batch),
+            pyobs=pyobs,
+            errors=errors,
+            seconds=perf_counter() - start,
+        )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOAD CSV
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def load_csv(
+    PyObClass, path, batch_size=BATCH_SIZE, workers=None, chunk_size=None, **kwargs
+):
+    """Streams the rows of a CSV file into a PyOb store, batch by batch"""
+
+    # Return batch outcomes
+    # NOTE: Nothing is read until the first batch is requested
+    return load_rows(
+        PyObClass=PyObClass,
+        rows=read_csv_rows(path, **kwargs),
+        batch_size=batch_size,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOAD JSONL
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def load_jsonl(
+    PyObClass, path, batch_size=BATCH_SIZE, workers=None, chunk_size=None, **kwargs
+):
+    """Streams the lines of a JSON Lines file into a PyOb store, batch by batch"""
+
+    # Return batch outcomes
+    # NOTE: Nothing is read until the first batch is requested
+    return load_rows(
+        PyObClass=PyObClass,
+        rows=read_jsonl_rows(path, **kwargs),
+        batch_size=batch_size,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
@@ -2,9 +2,16 @@
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
+from pyob.batch import PyObTransaction
+from pyob.load.tools import BATCH_SIZE, load_csv, load_jsonl
 from pyob.main.tools import get_pyob_string_field, localize_pyob_class
+from pyob.main.tools.bulk import abulk_create_pyobs, bulk_create_pyobs
+from pyob.main.tools.index import untracked_pyob_ids
 from pyob.main.tools.validate import validate_and_index_pyob_attr
 from pyob.meta import Metaclass
+from pyob.query.classes import CHUNK_SIZE
+from pyob.stats import PyObStats
+from pyob.stats.tools import record
 from pyob.tools import is_pyob_instance
 from pyob.tools.object import hexify
 from pyob.tools.string import pascalize
@@ -18,6 +25,14 @@ from pyob.tools.string import pascalize
 class PyOb(metaclass=Metaclass):
     """A base class for PyOb classes"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SLOTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define empty slots so that slotted subclasses can do without a __dict__
+    # NOTE: Subclasses that do not define slots still get a __dict__ as usual
+    __slots__ = ()
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ LOCALIZED
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -29,6 +44,92 @@ class PyOb(metaclass=Metaclass):
         # Return localized PyOb classes
         return localize_pyob_class(cls, *(include or []))
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ BATCH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def batch(cls):
+        """Returns a context in which writes to the PyOb store are undo logged"""
+
+        # Return a transaction that covers the PyOb store and its descendants
+        # NOTE: Type checks are deferred to the end of the block, which undoes every
+        # write of the block if it raises
+        return PyObTransaction(stores=cls.PyObMeta.store._descendant_stores)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ BULK CREATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def bulk_create(cls, rows, workers=None, chunk_size=None):
+        """Creates and stores a PyOb instance per row of init arguments atomically"""
+
+        # Return bulk created PyOb instances
+        # NOTE: With workers, raw rows are validated across that many processes
+        return bulk_create_pyobs(cls, rows, workers=workers, chunk_size=chunk_size)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ABULK CREATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def abulk_create(cls, rows, chunk=CHUNK_SIZE):
+        """Returns an awaitable that bulk creates, yielding to the event loop"""
+
+        # Return a coroutine of the bulk created PyOb instances
+        return abulk_create_pyobs(cls, rows, chunk=chunk)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOAD CSV
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def load_csv(
+        cls, path, batch_size=BATCH_SIZE, workers=None, chunk_size=None, **kwargs
+    ):
+        """Streams a CSV file into the store, batch by batch"""
+
+        # Return a generator of batch outcomes
+        return load_csv(
+            cls,
+            path,
+            batch_size=batch_size,
+            workers=workers,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOAD JSONL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def load_jsonl(
+        cls, path, batch_size=BATCH_SIZE, workers=None, chunk_size=None, **kwargs
+    ):
+        """Streams a JSON Lines file into the store, batch by batch"""
+
+        # Return a generator of batch outcomes
+        return load_jsonl(
+            cls,
+            path,
+            batch_size=batch_size,
+            workers=workers,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DELETE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def delete(self):
+        """Removes the PyOb instance from its store and every index"""
+
+        # Remove PyOb instance from its store
+        self.__class__.PyObMeta.store.remove(self)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ LABEL SINGULAR
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -77,11 +178,26 @@ class PyOb(metaclass=Metaclass):
     def __setattr__(self, name, value):
         """Set Attr Method"""
 
-        # Validate and index PyOb instance attribute
-        validate_and_index_pyob_attr(pyob=self, name=name, value=value)
+        # Record the call if stats are enabled
+        if PyObStats.enabled:
+            record(self.__class__, "setattr_calls")
+
+        # Get validation plan
+        # i.e. None if it has been invalidated and must be recompiled
+        plan = self.PyObMeta.plan
+
+        # Check if the attribute may be tracked
+        # Untracked attributes skip straight through to the parent __setattr__ method
+        # as do the attributes of PyOb instances pending a bulk create or removed
+        if (plan is None or name in plan) and id(self) not in untracked_pyob_ids:
+
+            # Validate and index PyOb instance attribute
+            validate_and_index_pyob_attr(pyob=self, name=name, value=value)
 
-        # Call parent __setattr__ method
-        super().__setattr__(name, value)
+        # Call object __setattr__ method
+        # NOTE: Zero-argument super() would be bound to this class and fail for the
+        # instances of localized copies of it, which are not subclasses of it
+        object.__setattr__(self, name, value)
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __STR__
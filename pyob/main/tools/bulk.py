@@ -0,0 +1,528 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from itertools import islice
+from types import MemberDescriptorType
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.column import PyObColumn
+from pyob.exceptions import DuplicateKeyError, InvalidKeyError, InvalidTypeError
+from pyob.main.tools.index import (
+    add_to_secondary_index,
+    extend_ordered_index,
+    remember_weak_value,
+    untracked_pyob_ids,
+)
+from pyob.main.tools.parallel import get_row_values, validate_rows_in_parallel
+from pyob.main.tools.plan import get_pyob_plan
+from pyob.main.tools.validate import validate_pyob_order
+from pyob.query.classes import CHUNK_SIZE, yield_control
+from pyob.utils import Nothing
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ BUILD PYOBS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def build_pyobs(PyObClass, rows, pyobs):
+    """Initializes a PyOb instance per row with validation and indexing deferred"""
+
+    # Iterate over rows
+    for row in rows:
+
+        # Create a blank PyOb instance
+        pyob = PyObClass.__new__(PyObClass)
+
+        # Mark PyOb instance as untracked so that __setattr__ skips straight through
+        # i.e. Validation and indexing is deferred to the batch as a whole
+        untracked_pyob_ids.add(id(pyob))
+
+        # Add PyOb instance to PyObs
+        # This happens before init so that a failed row is still cleaned up
+        pyobs.append(pyob)
+
+        # Check if row is a dictionary of keyword arguments
+        if isinstance(row, dict):
+
+            # Initialize PyOb instance with keyword arguments
+            pyob.__init__(**row)
+
+        # Otherwise handle row as a sequence of positional arguments
+        else:
+
+            # Initialize PyOb instance with positional arguments
+            pyob.__init__(*row)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET SET VALUES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_set_values(PyObClass, pyobs, name):
+    """Returns (PyOb, value) pairs of an attribute set on the PyOb instances"""
+
+    # Get slot or column descriptor of the attribute if any
+    slot = getattr(PyObClass, name, None)
+
+    # Check if the attribute is stored in a column
+    if isinstance(slot, PyObColumn):
+
+        # Return the values of the rows where the attribute is set
+        # NOTE: The column is read directly so that class-level defaults are excluded
+        return [
+            (pyob, slot.read(pyob._row)) for pyob in pyobs if slot.is_set[pyob._row]
+        ]
+
+    # Check if the attribute is not stored in a slot
+    if type(slot) is not MemberDescriptorType:
+
+        # Return the values found in the instance dictionaries
+        # NOTE: Class-level defaults are excluded, as with __setattr__
+        return [
+            (pyob, pyob.__dict__[name])
+            for pyob in pyobs
+            if name in getattr(pyob, "__dict__", ())
+        ]
+
+    # Initialize pairs
+    pairs = []
+
+    # Iterate over PyOb instances
+    for pyob in pyobs:
+
+        # Initialize try-except block
+        try:
+
+            # Add the value of the slot to pairs
+            # NOTE: The slot is read directly so that slot defaults are excluded
+            pairs.append((pyob, slot.__get__(pyob, PyObClass)))
+
+        # Handle slots that have not been set
+        except AttributeError:
+            continue
+
+    # Return pairs
+    return pairs
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET INDEXED VALUES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_indexed_values(pyobs, name):
+    """Returns (PyOb, value) pairs of an attribute, including class-level defaults"""
+
+    # Initialize pairs
+    pairs = []
+
+    # Iterate over PyOb instances
+    for pyob in pyobs:
+
+        # Get PyOb instance attribute
+        # NOTE: Class-level defaults are included, as indexed by the metaclass
+        value = getattr(pyob, name, Nothing)
+
+        # Add the value to pairs if defined
+        if value is not Nothing:
+            pairs.append((pyob, value))
+
+    # Return pairs
+    return pairs
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ VALIDATE PYOB TYPES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def validate_pyob_types(PyObClass, plan, pyobs, on_error=None, validated=None):
+    """Type checks the attributes of a batch of PyOb instances attribute by attribute"""
+
+    # Initialize rejected PyOb IDs
+    # i.e. PyOb instances already reported to the error handler, if any
+    rejected_ids = set()
+
+    # Initialize validated values by PyOb ID if None
+    # i.e. The raw row values of each PyOb instance already type checked elsewhere
+    validated = validated or {}
+
+    # Iterate over attribute plans
+    for name, attr_plan in plan.items():
+
+        # Continue if attribute has no type checks
+        if not attr_plan.type_checks:
+            continue
+
+        # Get PyOb instances and the values they set
+        pairs = get_set_values(PyObClass, pyobs, name)
+
+        # Iterate over the compiled type checks of the PyOb class relatives
+        for Relative, expected_type, is_valid in attr_plan.type_checks:
+
+            # Iterate over PyOb instances and values
+            for pyob, value in pairs:
+
+                # Continue if the value is the very row value already type checked
+                # NOTE: Values cast or replaced by the init method are checked again
+                if validated and validated[id(pyob)].get(name, Nothing) is value:
+                    continue
+
+                # Continue if type is valid
+                if is_valid(value):
+                    continue
+
+                # Initialize InvalidTypeError
+                error = InvalidTypeError(
+                    f"{Relative.__name__}.{name} expects a value of type "
+                    f"{expected_type} but got: {value} ({type(value)})"
+                )
+
+                # Raise InvalidTypeError if there is no error handler
+                if on_error is None:
+                    raise error
+
+                # Continue if PyOb instance has already been reported
+                if id(pyob) in rejected_ids:
+                    continue
+
+                # Report PyOb instance and carry on with the rest of the batch
+                rejected_ids.add(id(pyob))
+                on_error(pyob, error)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ VALIDATE PYOB KEYS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def validate_pyob_keys(PyObClass, plan, pyobs, on_error=None):
+    """Validates the keys of a batch of PyOb instances in a single set-based pass"""
+
+    # Initialize PyObs by key
+    # i.e. The key index entries that the batch will insert if valid
+    pyobs_by_key = {}
+
+    # Initialize rejected PyOb IDs
+    # i.e. PyOb instances already reported to the error handler, if any
+    rejected_ids = set()
+
+    # Define reject
+    def reject(pyob, error):
+        """Raises an error or reports it for a PyOb instance if there is a handler"""
+
+        # Raise error if there is no error handler
+        if on_error is None:
+            raise error
+
+        # Check if PyOb instance has not already been reported
+        if id(pyob) not in rejected_ids:
+
+            # Report PyOb instance and carry on with the rest of the batch
+            rejected_ids.add(id(pyob))
+            on_error(pyob, error)
+
+    # Iterate over keys
+    for key in PyObClass.PyObMeta.keys:
+
+        # Get attribute plan
+        attr_plan = plan[key]
+
+        # Initialize PyObs by value
+        # i.e. The PyOb instance of the batch that holds each value of the key
+        pyobs_by_value = {}
+
+        # Iterate over PyOb instances
+        for pyob in pyobs:
+
+            # Get key value
+            # NOTE: Includes inherited class attributes, as with Metaclass.__call__
+            value = getattr(pyob, key, Nothing)
+
+            # Continue if key is not set
+            if value is Nothing:
+                continue
+
+            # Check if key is None
+            if value is None:
+
+                # Reject PyOb instance with InvalidKeyError
+                reject(
+                    pyob,
+                    InvalidKeyError(
+                        f"{PyObClass.__name__}.{key} is a key and therefore cannot "
+                        "have a value of None"
+                    ),
+                )
+                continue
+
+            # Get other PyOb instance in the batch with the same key value
+            other = pyobs_by_key.setdefault(value, pyob)
+
+            # Check if the key value is duplicated within the batch
+            if other is not pyob:
+
+                # Reject PyOb instance with DuplicateKeyError
+                reject(
+                    pyob,
+                    DuplicateKeyError(
+                        f"A {PyObClass.label_singular} with a key of {value} already "
+                        f"exists: {other}"
+                    ),
+                )
+                continue
+
+            # Add PyOb instance to PyObs by value
+            pyobs_by_value[value] = pyob
+
+        # Iterate over the relatives that share the key
+        for Relative in attr_plan.KeyRelatives:
+
+            # Get PyObs by key map
+            relative_pyobs_by_key = Relative.PyObMeta.store._pyobs_by_key
+
+            # Iterate over duplicate values
+            for value in set(pyobs_by_value).intersection(relative_pyobs_by_key):
+
+                # Reject PyOb instance with DuplicateKeyError
+                reject(
+                    pyobs_by_value[value],
+                    DuplicateKeyError(
+                        f"A {Relative.label_singular} with a key of {value} already "
+                        f"exists: {relative_pyobs_by_key[value]}"
+                    ),
+                )
+
+    # Return PyObs by key without the entries of rejected PyOb instances
+    return {
+        value: pyob
+        for value, pyob in pyobs_by_key.items()
+        if id(pyob) not in rejected_ids
+    }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ BULK CREATE PYOBS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def bulk_create_pyobs(PyObClass, rows, workers=None, chunk_size=None):
+    """Creates, validates and stores a batch of PyOb instances atomically"""
+
+    # Get validation plan
+    plan = get_pyob_plan(PyObClass)
+
+    # Initialize PyObs
+    pyobs = []
+
+    # Initialize validated values by PyOb ID
+    validated = None
+
+    # Check if the raw rows should be validated across worker processes
+    if workers:
+
+        # Get rows as a list so that they can be split into chunks
+        rows = list(rows)
+
+        # Import process pool executor
+        # NOTE: Deferred as concurrent.futures is only needed once workers are used
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Validate the shape and types of the raw rows in worker processes
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            errors = validate_rows_in_parallel(
+                PyObClass=PyObClass,
+                numbers=range(len(rows)),
+                rows=rows,
+                executor=executor,
+                workers=workers,
+                chunk_size=chunk_size,
+            )
+
+        # Check if any row is invalid
+        if errors:
+
+            # Get the index and error of the first invalid row
+            index = min(errors)
+            error = errors[index]
+
+            # Raise error with the index of the row
+            raise type(error)(f"rows[{index}]: {error}") from error
+
+    # Initialize try-finally block
+    try:
+
+        # Initialize a PyOb instance per row
+        build_pyobs(PyObClass=PyObClass, rows=rows, pyobs=pyobs)
+
+        # Check if the raw rows have been validated
+        if workers:
+
+            # Map each PyOb instance to the row values it was validated with
+            validated = dict(
+                zip(map(id, pyobs), get_row_values(PyObClass=PyObClass, rows=rows))
+            )
+
+        # Type check the batch, skipping values validated in worker processes
+        validate_pyob_types(
+            PyObClass=PyObClass, plan=plan, pyobs=pyobs, validated=validated
+        )
+
+        # Hold the lock of the family if any
+        # So that no other thread can take a key between the check and the insert
+        with PyObClass.PyObMeta.store._family.locked():
+
+            # Validate the keys of the batch
+            pyobs_by_key = validate_pyob_keys(
+                PyObClass=PyObClass, plan=plan, pyobs=pyobs
+            )
+
+            # Index and store the batch
+            store_pyobs(PyObClass=PyObClass, pyobs=pyobs, pyobs_by_key=pyobs_by_key)
+
+    # Clear untracked PyOb IDs whether or not the batch is valid
+    # Nothing is indexed until the batch is valid so a failed one leaves no trace
+    finally:
+
+        # Remove untracked PyOb IDs
+        untracked_pyob_ids.difference_update([id(pyob) for pyob in pyobs])
+
+    # Return PyOb instances
+    return pyobs
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ABULK CREATE PYOBS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+async def abulk_create_pyobs(PyObClass, rows, chunk=CHUNK_SIZE):
+    """Bulk creates PyOb instances atomically, pausing for the event loop per chunk"""
+
+    # Get validation plan
+    plan = get_pyob_plan(PyObClass)
+
+    # Initialize PyObs
+    pyobs = []
+
+    # Get rows as an iterator so that they are consumed chunk by chunk
+    rows = iter(rows)
+
+    # Initialize try-finally block
+    try:
+
+        # Iterate until the rows are exhausted
+        while True:
+
+            # Get the next chunk of rows
+            batch = list(islice(rows, chunk))
+
+            # Break if there are no rows left
+            if not batch:
+                break
+
+            # Get the number of PyOb instances initialized so far
+            start = len(pyobs)
+
+            # Initialize a PyOb instance per row of the chunk
+            build_pyobs(PyObClass=PyObClass, rows=batch, pyobs=pyobs)
+
+            # Type check the chunk
+            validate_pyob_types(PyObClass=PyObClass, plan=plan, pyobs=pyobs[start:])
+
+            # Yield control to the event loop
+            # NOTE: Nothing is indexed yet so other coroutines never see a partial batch
+            await yield_control()
+
+        # Hold the lock of the family if any
+        # NOTE: There is no await from here on, so no other coroutine can take a key
+        # between the check and the insert
+        with PyObClass.PyObMeta.store._family.locked():
+
+            # Validate the keys of the batch
+            pyobs_by_key = validate_pyob_keys(
+                PyObClass=PyObClass, plan=plan, pyobs=pyobs
+            )
+
+            # Index and store the batch
+            store_pyobs(PyObClass=PyObClass, pyobs=pyobs, pyobs_by_key=pyobs_by_key)
+
+    # Clear untracked PyOb IDs whether the batch is valid, invalid or cancelled
+    finally:
+
+        # Remove untracked PyOb IDs
+        untracked_pyob_ids.difference_update([id(pyob) for pyob in pyobs])
+
+    # Return PyOb instances
+    return pyobs
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ STORE PYOBS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def store_pyobs(PyObClass, pyobs, pyobs_by_key):
+    """Indexes and stores a batch of PyOb instances whose keys are known to be valid"""
+
+    # Get store
+    store = PyObClass.PyObMeta.store
+
+    # Get PyOb instances and their values by ordered index, including class defaults
+    pairs_by_ordered_index = {
+        name: get_indexed_values(pyobs, name)
+        for name in PyObClass.PyObMeta.ordered_indexes
+    }
+
+    # Iterate over ordered indexes
+    for name, pairs in pairs_by_ordered_index.items():
+
+        # Validate that the values can be ordered before any index is changed
+        validate_pyob_order(
+            PyObClass=PyObClass, name=name, values=[value for _, value in pairs]
+        )
+
+    # Index keys in one go
+    store._pyobs_by_key.update(pyobs_by_key)
+
+    # Iterate over keys
+    for key in pyobs_by_key:
+
+        # Index key in the family key index
+        store._family.add(key, store)
+
+    # Check if store is weak
+    if store._weak_entries_by_id is not None:
+
+        # Iterate over keys
+        for name in PyObClass.PyObMeta.keys:
+
+            # Iterate over PyOb instances and their keys, including class-level defaults
+            for pyob, value in get_indexed_values(pyobs, name):
+
+                # Record key so that the family key index drops it once collected
+                remember_weak_value(store=store, pyob=pyob, name=name, value=value)
+
+    # Iterate over secondary indexes
+    for name in PyObClass.PyObMeta.indexes:
+
+        # Iterate over PyOb instances and their values, including class-level defaults
+        for pyob, value in get_indexed_values(pyobs, name):
+
+            # Index value
+            add_to_secondary_index(store=store, pyob=pyob, name=name, value=value)
+
+    # Iterate over ordered indexes
+    for name, pairs in pairs_by_ordered_index.items():
+
+        # Insert PyOb instances at their sorted positions in one pass
+        extend_ordered_index(store=store, name=name, pairs=pairs)
+
+    # Add PyOb instances to store in one go
+    store._insert(pyobs)
@@ -0,0 +1,262 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import types
+
+from typing import Any, Union, get_args, get_origin
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define union origins
+# i.e. The origins of both typing.Union[X, Y] and PEP 604 X | Y hints (Python 3.10+)
+UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CACHE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize type checkers by hint
+# i.e. A process-wide cache so that identical hints share a single compiled checker
+type_checkers_by_hint = {}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ IS PLAIN CLASS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def is_plain_class(hint):
+    """Returns a boolean of whether a type hint is a plain, non-generic class"""
+
+    # Return boolean of whether hint is a class without a typing origin
+    # NOTE: typing.Any is itself a class as of Python 3.11 but rejects isinstance
+    return isinstance(hint, type) and get_origin(hint) is None and hint is not Any
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE BOOL CHECKER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_bool_checker():
+    """Compiles a type checker for the bool type hint"""
+
+    # Define type checker
+    def is_valid(value):
+        """Returns a boolean of whether a value is a bool"""
+
+        # Return boolean of whether value is exactly a bool
+        # NOTE: bool cannot be subclassed so an exact type check is sufficient
+        return type(value) is bool
+
+    # Return type checker
+    return is_valid
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE CLASS CHECKER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_class_checker(Class):
+    """Compiles a type checker for a plain class type hint"""
+
+    # Define type checker
+    def is_valid(value):
+        """Returns a boolean of whether a value is an instance of the class"""
+
+        # Get value type
+        value_type = type(value)
+
+        # Return boolean of whether value is an instance of the class
+        # Booleans pass for ints / floats under MyPy so they are rejected here
+        return value_type is Class or (
+            value_type is not bool and isinstance(value, Class)
+        )
+
+    # Return type checker
+    return is_valid
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE UNION CHECKER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_union_checker(Classes):
+    """Compiles a type checker for a union of plain classes, e.g. Optional[int]"""
+
+    # Get exact classes
+    # i.e. The set used for the direct type(value) fast path
+    exact_classes = frozenset(Classes)
+
+    # Get classes as a tuple for isinstance
+    Classes = tuple(Classes)
+
+    # Define type checker
+    def is_valid(value):
+        """Returns a boolean of whether a value is an instance of any union member"""
+
+        # Get value type
+        value_type = type(value)
+
+        # Return boolean of whether value is an instance of any union member
+        # Booleans only pass when bool is itself a member of the union
+        return value_type in exact_classes or (
+            value_type is not bool and isinstance(value, Classes)
+        )
+
+    # Return type checker
+    return is_valid
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE BEARTYPE CHECKER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_beartype_checker(expected_type):
+    """Compiles a type checker for an arbitrary type hint using beartype"""
+
+    # Import beartype on first use
+    # NOTE: It is a large import that plain class and union hints never need
+    from beartype import beartype
+    from beartype.abby import is_bearable
+    from beartype.roar import BeartypeCallHintReturnViolation
+
+    # Define a function whose return value beartype will type check
+    def die_if_unbearable(value):
+        """Returns the value if it satisfies the expected type"""
+
+        # Return value
+        return value
+
+    # Annotate return value with the expected type
+    die_if_unbearable.__annotations__ = {"return": expected_type}
+
+    # Initialize try-except block
+    try:
+
+        # Decorate function with beartype once
+        # i.e. Beartype generates and caches the checking code at decoration time
+        die_if_unbearable = beartype(die_if_unbearable)
+
+    # Handle hints that beartype cannot decorate
+    except Exception:
+
+        # Define type checker
+        def is_valid(value):
+            """Returns a boolean of whether a value satisfies the expected type"""
+
+            # Return boolean of whether value is bearable
+            # Any unsupported hint errors will surface here as they did before
+            return type(value) is not bool and is_bearable(value, expected_type)
+
+        # Return type checker
+        return is_valid
+
+    # Define type checker
+    def is_valid(value):
+        """Returns a boolean of whether a value satisfies the expected type"""
+
+        # Return False if boolean edge case
+        # Booleans pass for ints / floats under MyPy
+        if type(value) is bool:
+            return False
+
+        # Initialize try-except block
+        try:
+
+            # Type check value
+            die_if_unbearable(value)
+
+        # Handle type violation
+        except BeartypeCallHintReturnViolation:
+
+            # Return False
+            return False
+
+        # Return True
+        return True
+
+    # Return type checker
+    return is_valid
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE TYPE CHECKER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_type_checker(expected_type):
+    """Compiles a specialized type checker for a type hint"""
+
+    # Check if bool
+    if expected_type is bool:
+
+        # Return bool type checker
+        return compile_bool_checker()
+
+    # Check if plain class, e.g. int, str or a PyOb class
+    if is_plain_class(expected_type):
+
+        # Return class type checker
+        return compile_class_checker(expected_type)
+
+    # Check if union, e.g. Optional[int] or Union[int, str]
+    if get_origin(expected_type) in UNION_ORIGINS:
+
+        # Get union members
+        members = get_args(expected_type)
+
+        # Check if every union member is a plain class
+        if all(is_plain_class(member) for member in members):
+
+            # Return union type checker
+            return compile_union_checker(members)
+
+    # Compile beartype type checker for all other hints, e.g. List[int]
+    is_valid = compile_beartype_checker(expected_type)
+
+    # Mark type checker as calling into beartype
+    # So that stats can tell it apart from the specialized type checkers
+    is_valid.is_bearable = True
+
+    # Return type checker
+    return is_valid
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET TYPE CHECKER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_type_checker(expected_type):
+    """Returns a cached type checker for a type hint, compiling it if necessary"""
+
+    # Initialize try-except block
+    try:
+
+        # Return cached type checker if any
+        return type_checkers_by_hint[expected_type]
+
+    # Handle uncached hints
+    except KeyError:
+
+        # Compile type checker
+        is_valid = compile_type_checker(expected_type)
+
+        # Cache type checker
+        type_checkers_by_hint[expected_type] = is_valid
+
+    # Handle unhashable hints
+    except TypeError:
+
+        # Compile type checker without caching
+        is_valid = compile_type_checker(expected_type)
+
+    # Return type checker
+    return is_valid
@@ -0,0 +1,111 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.main.tools.slots import get_field_defaults
+from pyob.tools.iterable import deduplicate
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NEW ROW HANDLE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def new_row_handle(cls, *args, **kwargs):
+    """Creates a PyOb instance as a row handle into the columns of its store"""
+
+    # Create a blank PyOb instance
+    pyob = object.__new__(cls)
+
+    # Allocate a row in the columns of the store
+    # NOTE: This bypasses __setattr__ as the row is not a field of the PyOb class
+    object.__setattr__(pyob, "_row", cls.PyObMeta.store._columns.allocate())
+
+    # Return PyOb instance
+    return pyob
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FREE ROW HANDLE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def free_row_handle(pyob):
+    """Releases the row of a PyOb instance as it is garbage collected"""
+
+    # Get row
+    # NOTE: None if the row was released when the store was cleared
+    row = pyob._row
+
+    # Free row so that it can be reused by a new PyOb instance
+    if row is not None:
+        pyob.__class__.PyObMeta.store._columns.free(row)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ IS COLUMNAR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def is_columnar(bases, storage):
+    """Returns a boolean of whether a PyOb class being created should be columnar"""
+
+    # Return whether columnar storage is requested or inherited
+    # NOTE: The row handles of a columnar parent cannot hold fields of their own
+    return storage == "columnar" or any(
+        hasattr(Base, "_column_names") for Base in bases
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COLUMN PYOB NAMESPACE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def column_pyob_namespace(bases, namespace):
+    """Turns the namespace of a PyOb class into that of a slotted row handle"""
+
+    # Return if slots are already defined
+    # e.g. By a localized copy of a columnar PyOb class
+    if "__slots__" in namespace:
+        return
+
+    # Get the fields to store in columns and their class-level defaults
+    column_names, column_defaults = get_field_defaults(
+        bases=bases, namespace=namespace
+    )
+
+    # Initialize slots
+    slots = []
+
+    # Check if no base is already a row handle
+    if not any(hasattr(Base, "_row") for Base in bases):
+
+        # Add row slot
+        slots.append("_row")
+
+    # Check if no base supports weak references
+    # So that row handles can still be held by weak stores
+    if not any(Base.__weakrefoffset__ for Base in bases):
+
+        # Add weakref slot
+        slots.append("__weakref__")
+
+    # Set slots
+    namespace["__slots__"] = tuple(slots)
+
+    # Iterate over bases
+    for Base in reversed(bases):
+
+        # Merge the column names and defaults of the base
+        # So that every columnar PyOb class has columns of its own for all its fields
+        column_names = getattr(Base, "_column_names", ()) + tuple(column_names)
+        column_defaults = {**getattr(Base, "_column_defaults", {}), **column_defaults}
+
+    # Set column names and defaults
+    namespace["_column_names"] = deduplicate(column_names)
+    namespace["_column_defaults"] = column_defaults
+
+    # Allocate a row on creation and free it on collection
+    namespace["__new__"] = new_row_handle
+    namespace["__del__"] = free_row_handle
@@ -0,0 +1,68 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from functools import wraps
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ IS DISK BACKED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def is_disk_backed(bases, namespace):
+    """Returns a boolean of whether a namespace or its bases already write to disk"""
+
+    # Return whether the namespace or any base writes through to its store
+    # e.g. The localized copy of a disk-backed PyOb class or one of its children
+    return namespace.get("_is_disk_backed", False) or any(
+        getattr(Base, "_is_disk_backed", False) for Base in bases
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SAVING
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def saving(method):
+    """Wraps an attribute method so that the PyOb instance is saved after each write"""
+
+    # Define wrapper
+    @wraps(method)
+    def wrapper(pyob, *args):
+        """Calls the attribute method and writes the PyOb instance to its store"""
+
+        # Call attribute method
+        method(pyob, *args)
+
+        # Write the new state of the PyOb instance through to disk
+        pyob.__class__.PyObMeta.store._save(pyob)
+
+    # Return wrapper
+    return wrapper
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DISK PYOB NAMESPACE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def disk_pyob_namespace(bases, namespace):
+    """Makes the attribute writes of a PyOb class namespace write through to disk"""
+
+    # Return if writes are already saved
+    if is_disk_backed(bases=bases, namespace=namespace):
+        return
+
+    # Iterate over attribute methods
+    for method_name in ("__setattr__", "__delattr__"):
+
+        # Get the user-defined or inherited attribute method
+        method = namespace.get(method_name) or getattr(bases[0], method_name)
+
+        # Wrap attribute method so that it saves the PyOb instance
+        namespace[method_name] = saving(method)
+
+    # Mark the namespace as disk-backed
+    namespace["_is_disk_backed"] = True
@@ -1,3 +1,320 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from contextvars import ContextVar
+from functools import partial
+from weakref import ref
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.index import PyObOrderedIndex
+from pyob.set import PyObSet
+from pyob.utils import Nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ UNTRACKED PYOB IDS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize untracked PyOb IDs
+# i.e. The IDs of PyOb instances whose writes skip validation and indexing, either
+# because they are pending a bulk create or because they were removed from a store
+untracked_pyob_ids = set()
+
+# Initialize detached weakrefs by ID
+# i.e. The weakrefs that release the untracked IDs of removed PyOb instances
+detached_weakrefs_by_id = {}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CURRENT TRANSACTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize current transaction
+# i.e. The innermost PyObTransaction of the running thread or task, if any
+current_transaction = ContextVar("current_transaction", default=None)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FORGET DETACHED PYOB
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def forget_detached_pyob(pyob_id, _):
+    """Releases the untracked ID of a removed PyOb instance once it is collected"""
+
+    # Remove PyOb instance ID from untracked PyOb IDs
+    # So that a new object that happens to reuse the ID is tracked as normal
+    untracked_pyob_ids.discard(pyob_id)
+
+    # Remove detached weakref
+    detached_weakrefs_by_id.pop(pyob_id, None)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DETACH PYOB
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def detach_pyob(pyob):
+    """Marks a removed PyOb instance so that its writes are no longer indexed"""
+
+    # Get PyOb instance ID
+    pyob_id = id(pyob)
+
+    # Add PyOb instance ID to untracked PyOb IDs
+    untracked_pyob_ids.add(pyob_id)
+
+    # Initialize a weakref that releases the ID once the PyOb instance is collected
+    detached_weakrefs_by_id[pyob_id] = ref(pyob, partial(forget_detached_pyob, pyob_id))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET TRANSACTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_transaction(store):
+    """Returns the innermost transaction whose writes cover a store, if any"""
+
+    # Get current transaction
+    transaction = current_transaction.get()
+
+    # Iterate until a transaction covers the store or none are left
+    # NOTE: A transaction without stores covers every store
+    while transaction is not None and not (
+        transaction.stores is None or store in transaction.stores
+    ):
+
+        # Move on to the enclosing transaction
+        transaction = transaction.parent
+
+    # Return transaction
+    return transaction
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PURGE WEAK PYOB
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def purge_weak_pyob(store, pyob_id, _):
+    """Removes the index entries left behind by a garbage collected PyOb instance"""
+
+    # Get and remove entry
+    # NOTE: The weak store and key index have already dropped the PyOb instance
+    entry = store._weak_entries_by_id.pop(pyob_id, None)
+
+    # Return if PyOb instance is no longer tracked
+    if entry is None:
+        return
+
+    # Get indexed values and whether the PyOb instance is counted in the store
+    _, values, is_counted = entry
+
+    # Check if PyOb instance is counted in the store
+    if is_counted:
+
+        # Subtract PyOb instance from the counts
+        store._adjust_counts(-1)
+
+    # Iterate over indexed values
+    for name, value in values.items():
+
+        # Check if value is a key that is no longer held by the store
+        # i.e. The weak key index has dropped it but the family key index has not
+        if name in store._PyObClass.PyObMeta.keys and value not in store._pyobs_by_key:
+
+            # Remove value from the family key index
+            store._family.discard(value, store)
+
+        # Get PyOb set of value
+        pyob_set = store._pyobs_by_index.get(name, {}).get(value)
+
+        # Check if PyOb set is defined
+        if pyob_set is not None:
+
+            # Resync the running total of the PyOb set with the PyOb instances left
+            # NOTE: The weakref of a PyOb instance is created before it joins any weak
+            # PyOb set, so its callback fires after the PyOb set has dropped it
+            pyob_set._count = len(pyob_set._counts_by_pyob)
+
+        # Check if PyOb set is now empty
+        if pyob_set is not None and not pyob_set._count:
+
+            # Remove PyOb set of value
+            store._pyobs_by_index[name].pop(value)
+
+        # Get ordered index
+        ordered_index = store._ordered_indexes.get(name)
+
+        # Check if ordered index is defined
+        if ordered_index is not None:
+
+            # Remove collected PyOb instances from value
+            ordered_index.purge(value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET WEAK ENTRY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_weak_entry(store, pyob):
+    """Returns the [weakref, indexed values, is counted] entry of a weak PyOb"""
+
+    # Get PyOb instance ID
+    pyob_id = id(pyob)
+
+    # Get entry
+    entry = store._weak_entries_by_id.get(pyob_id)
+
+    # Check if entry is None
+    if entry is None:
+
+        # Initialize a weakref whose callback purges the indexes of the PyOb instance
+        weakref = ref(pyob, partial(purge_weak_pyob, store, pyob_id))
+
+        # Initialize entry
+        # i.e. Not counted until the PyOb instance is inserted into the store
+        entry = store._weak_entries_by_id[pyob_id] = [weakref, {}, False]
+
+    # Return entry
+    return entry
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REMEMBER WEAK VALUE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def remember_weak_value(store, pyob, name, value):
+    """Records an indexed value of a PyOb instance so it can be purged once collected"""
+
+    # Return if store is not weak
+    if store._weak_entries_by_id is None:
+        return
+
+    # Record indexed value
+    get_weak_entry(store=store, pyob=pyob)[1][name] = value
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ADD TO SECONDARY INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def add_to_secondary_index(store, pyob, name, value):
+    """Adds a PyOb instance to the secondary index of a store under a value"""
+
+    # Get PyObs by value
+    pyobs_by_value = store._pyobs_by_index.setdefault(name, {})
+
+    # Record value in case the PyOb instance is collected from a weak store
+    remember_weak_value(store=store, pyob=pyob, name=name, value=value)
+
+    # Get PyOb set of value
+    pyob_set = pyobs_by_value.get(value)
+
+    # Check if PyOb set is None
+    if pyob_set is None:
+
+        # Initialize PyOb set of value
+        pyob_set = pyobs_by_value[value] = PyObSet(
+            PyObClass=store._PyObClass, weak=store._is_weak
+        )
+
+    # Add PyOb instance to PyOb set
+    pyob_set._add(pyob)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REMOVE FROM SECONDARY INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def remove_from_secondary_index(store, pyob, name, value):
+    """Removes a PyOb instance from the secondary index of a store under a value"""
+
+    # Get PyObs by value
+    pyobs_by_value = store._pyobs_by_index.get(name, {})
+
+    # Get PyOb set of value
+    pyob_set = pyobs_by_value.get(value)
+
+    # Return if PyOb set is None
+    if pyob_set is None:
+        return
+
+    # Remove PyOb instance from PyOb set
+    pyob_set._discard(pyob)
+
+    # Check if PyOb set is empty
+    # So that stale values do not accumulate in the index
+    if not pyob_set._counts_by_pyob:
+
+        # Remove PyOb set of value
+        pyobs_by_value.pop(value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ORDERED INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_ordered_index(store, name):
+    """Returns the ordered index of a store for a field, initializing it if needed"""
+
+    # Get ordered index
+    ordered_index = store._ordered_indexes.get(name)
+
+    # Check if ordered index is None
+    if ordered_index is None:
+
+        # Initialize ordered index
+        ordered_index = store._ordered_indexes[name] = PyObOrderedIndex(
+            weak=store._is_weak
+        )
+
+    # Return ordered index
+    return ordered_index
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ADD TO ORDERED INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def add_to_ordered_index(store, pyob, name, value):
+    """Adds a PyOb instance to the ordered index of a store at its sorted position"""
+
+    # Insert PyOb instance at its sorted position
+    get_ordered_index(store=store, name=name).add(pyob=pyob, value=value)
+
+    # Record value in case the PyOb instance is collected from a weak store
+    remember_weak_value(store=store, pyob=pyob, name=name, value=value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ EXTEND ORDERED INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def extend_ordered_index(store, name, pairs):
+    """Adds a batch of (PyOb, value) pairs to the ordered index of a store at once"""
+
+    # Insert PyOb instances at their sorted positions in one pass
+    get_ordered_index(store=store, name=name).extend(pairs)
+
+    # Iterate over PyOb instances and values
+    for pyob, value in pairs:
+
+        # Record value in case the PyOb instance is collected from a weak store
+        remember_weak_value(store=store, pyob=pyob, name=name, value=value)
+
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ INDEX PYOB ATTR
 # └─────────────────────────────────────────────────────────────────────────────────────
@@ -19,6 +336,11 @@ def index_pyob_attr(pyob, name, value):
     # Get store
     store = PyObMeta.store
 
+    # Get previous value
+    # NOTE: getattr rather than __dict__ so that slotted PyOb instances are supported
+    # Every removal below is identity-checked as this may be a class-level default
+    value_previous = getattr(pyob, name, Nothing)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ INDEX KEY
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -35,18 +357,248 @@ def index_pyob_attr(pyob, name, value):
         # Get PyObs instances by key
         pyobs_by_key = store._pyobs_by_key
 
-        # Check previous value is defined
+        # Get family
+        family = store._family
+
+        # Check if previous value is indexed to this PyOb instance
         # So that we can remove the existing key
-        if name in pyob.__dict__:
+        if value_previous is not Nothing and pyobs_by_key.get(value_previous) is pyob:
 
-            # Get previous value
-            value_previous = pyob.__dict__[name]
+            # Pop previous value from index
+            pyobs_by_key.pop(value_previous)
 
-            # Check if previous value is indexed
-            if value_previous in pyobs_by_key:
+            # Remove previous value from the family key index
+            family.discard(value_previous, store)
 
-                # Pop previous value from index
-                pyobs_by_key.pop(value_previous)
+        # Record value in case the PyOb instance is collected from a weak store
+        remember_weak_value(store=store, pyob=pyob, name=name, value=value)
 
         # Index new value as a key
         pyobs_by_key[value] = pyob
+
+        # Index new value in the family key index
+        family.add(value, store)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INDEX SECONDARY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Get secondary indexes
+    indexes = PyObMeta.indexes or ()
+
+    # Check if is a secondary index
+    if indexes and name in indexes:
+
+        # Check if previous value is defined
+        # So that the PyOb instance is no longer found under its previous value
+        if value_previous is not Nothing:
+
+            # Remove PyOb instance from previous value
+            remove_from_secondary_index(
+                store=store, pyob=pyob, name=name, value=value_previous
+            )
+
+        # Index new value
+        add_to_secondary_index(store=store, pyob=pyob, name=name, value=value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INDEX ORDERED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Get ordered indexes
+    ordered_indexes = PyObMeta.ordered_indexes or ()
+
+    # Check if is an ordered index
+    if ordered_indexes and name in ordered_indexes:
+
+        # Get ordered index
+        ordered_index = get_ordered_index(store=store, name=name)
+
+        # Check if previous value is defined
+        # So that the PyOb instance is moved rather than duplicated
+        if value_previous is not Nothing:
+
+            # Remove PyOb instance from its previous position
+            ordered_index.remove(pyob=pyob, value=value_previous)
+
+        # Insert PyOb instance at its new sorted position
+        add_to_ordered_index(store=store, pyob=pyob, name=name, value=value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DEINDEX PYOB ATTR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def deindex_pyob_attr(pyob, name):
+    """Removes the current value of a PyOb instance attribute from every index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VARIABLES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Get PyObMeta
+    PyObMeta = pyob.__class__.PyObMeta
+
+    # Get store
+    store = PyObMeta.store
+
+    # Get current value
+    value = getattr(pyob, name, Nothing)
+
+    # Return if value is not defined
+    if value is Nothing:
+        return
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DEINDEX KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Check if is key and the value is indexed to this PyOb instance
+    if name in (PyObMeta.keys or ()) and store._pyobs_by_key.get(value) is pyob:
+
+        # Pop value from index
+        store._pyobs_by_key.pop(value)
+
+        # Remove value from the family key index
+        store._family.discard(value, store)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DEINDEX SECONDARY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Check if is a secondary index
+    if name in (PyObMeta.indexes or ()):
+
+        # Remove PyOb instance from value
+        remove_from_secondary_index(store=store, pyob=pyob, name=name, value=value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DEINDEX ORDERED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Check if is an ordered index
+    if name in (PyObMeta.ordered_indexes or ()):
+
+        # Remove PyOb instance from ordered index
+        get_ordered_index(store=store, name=name).remove(pyob=pyob, value=value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DEINDEX PYOB
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def deindex_pyob(pyob):
+    """Removes a PyOb instance from every index of its PyOb store"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VARIABLES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Get PyOb class
+    PyObClass = pyob.__class__
+
+    # Get PyObMeta
+    PyObMeta = PyObClass.PyObMeta
+
+    # Get store
+    store = PyObMeta.store
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DEINDEX KEYS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Get PyObs instances by key
+    pyobs_by_key = store._pyobs_by_key
+
+    # Iterate over keys
+    for key in PyObMeta.keys or ():
+
+        # Get key value
+        value = getattr(pyob, key, Nothing)
+
+        # Check if the key value is indexed to this PyOb instance
+        # An identity check ensures that another PyOb instance's key is never popped
+        if value is not Nothing and pyobs_by_key.get(value) is pyob:
+
+            # Pop value from index
+            pyobs_by_key.pop(value)
+
+            # Remove value from the family key index
+            store._family.discard(value, store)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DEINDEX SECONDARY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Iterate over secondary indexes
+    for name in PyObMeta.indexes or ():
+
+        # Get indexed value
+        value = getattr(pyob, name, Nothing)
+
+        # Check if value is defined
+        if value is not Nothing:
+
+            # Remove PyOb instance from value
+            remove_from_secondary_index(store=store, pyob=pyob, name=name, value=value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DEINDEX ORDERED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Iterate over ordered indexes
+    for name in PyObMeta.ordered_indexes or ():
+
+        # Get indexed value
+        value = getattr(pyob, name, Nothing)
+
+        # Check if value is defined
+        if value is not Nothing:
+
+            # Remove PyOb instance from ordered index
+            get_ordered_index(store=store, name=name).remove(pyob=pyob, value=value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FORGET WEAK ENTRY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Check if store is weak
+    if store._weak_entries_by_id is not None:
+
+        # Remove weak entry along with its weakref so that no callback is fired
+        store._weak_entries_by_id.pop(id(pyob), None)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ UNCOVER PYOB INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def uncover_pyob_index(PyObClass, name):
+    """Marks an index as missing the PyOb instances of a changed class-level default"""
+
+    # Get PyObMeta
+    PyObMeta = PyObClass.PyObMeta
+
+    # Get store
+    # NOTE: A PyOb class being defined may not have a store of its own yet
+    store = getattr(PyObMeta, "store", None)
+
+    # Return if the attribute is not a secondary or ordered index of a PyOb store
+    if store is None or (
+        name not in (PyObMeta.indexes or ())
+        and name not in (PyObMeta.ordered_indexes or ())
+    ):
+        return
+
+    # Iterate over the store and its descendant stores
+    # i.e. Those whose PyOb instances may have been indexed under the previous default
+    for descendant_store in store._descendant_stores:
+
+        # Check if the descendant store has PyOb instances
+        if descendant_store._count:
+
+            # Mark index as uncovered so that queries scan rather than look it up
+            descendant_store._uncovered_indexes.add(name)
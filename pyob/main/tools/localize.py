@@ -2,51 +2,164 @@
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-from pyob.meta.classes.metaclass import Metaclass
-from pyob.tools import is_pyob_base, is_pyob_subclass
+from pyob.tools import is_pyob_subclass
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
-# │ LOCALIZE PYOB CLASS
+# │ PYOB LOCALIZE TEMPLATE
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 
-def localize_pyob_class(*PyObClasses):
-    """Localizes and returns an interable of PyOb class instances"""
+class PyObLocalizeTemplate:
+    """A reusable recipe for localizing the same PyOb classes again and again"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SLOTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    __slots__ = ("steps", "results")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, PyObClasses):
+        """Init Method"""
+
+        # Initialize steps
+        # i.e. A (PyOb class, bases, dropped names) tuple per PyOb class to copy, with
+        # bases as the positions of localized bases among the steps or other classes
+        self.steps = []
+
+        # Initialize positions by PyOb class
+        positions = {}
+
+        # Define add step helper function
+        def _add_step(PyObClass):
+            """Adds the steps of a PyOb class and its bases, returning its position"""
+
+            # Return class if not a PyOb subclass
+            # i.e. Bases such as mixins are shared rather than localized
+            if not is_pyob_subclass(PyObClass):
+                return PyObClass
 
-    # Initialize cache
-    cache = {}
+            # Return position if PyOb class already has a step
+            if PyObClass in positions:
+                return positions[PyObClass]
 
-    # Define localize helper function
-    def _localize(PyObClass):
+            # Add the steps of PyOb bases first
+            # So that localized bases always exist before their localized children
+            bases = tuple([_add_step(Base) for Base in PyObClass.__bases__])
 
-        # Return if class is not a PyOb subclass
-        if not is_pyob_subclass(PyObClass):
-            return PyObClass
+            # Get the names of the descriptors that the localized copy creates itself
+            # i.e. Instance dictionary, weak reference and slot descriptors
+            dropped = frozenset(
+                ("__dict__", "__weakref__", *PyObClass.__dict__.get("__slots__", ()))
+            )
 
-        # Return if PyOb class in cache
-        if PyObClass in cache:
-            return cache[PyObClass]
+            # Set position and add step
+            positions[PyObClass] = len(self.steps)
+            self.steps.append((PyObClass, bases, dropped))
 
-        # Localize PyOb bases
-        Bases = tuple([_localize(Base) for Base in PyObClass.__bases__])
+            # Return position
+            return positions[PyObClass]
 
-        # Get meta type
-        # To ensure that Metaclass is copied into new PyOb class
-        Type = Metaclass if is_pyob_base(PyObClass) else type
+        # Set results
+        # i.e. The position of each requested PyOb class among the steps
+        self.results = tuple([_add_step(PyObClass) for PyObClass in PyObClasses])
 
-        # Get and set localized PyOb class
-        cache[PyObClass] = Type(PyObClass.__name__, Bases, dict(PyObClass.__dict__))
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOCALIZE
+    # └─────────────────────────────────────────────────────────────────────────────────
 
-        # Set localized from attribute
-        # This will ensure that isinstance() still works with localized PyOb classes
-        cache[PyObClass].PyObMeta.localized_from = PyObClass
+    def localize(self):
+        """Returns fresh localized copies of the requested PyOb classes"""
+
+        # Initialize localized PyOb classes in step order
+        Localized = []
+
+        # Iterate over steps
+        for PyObClass, bases, dropped in self.steps:
+
+            # Get localized bases
+            Bases = tuple(
+                [Localized[base] if type(base) is int else base for base in bases]
+            )
+
+            # Get class dictionary without the descriptors
+            # NOTE: Copied on each localization so later class attributes carry over
+            class_dict = {
+                name: value
+                for name, value in PyObClass.__dict__.items()
+                if name not in dropped
+            }
+
+            # Create localized PyOb class with the metaclass of the PyOb class
+            # NOTE: Its PyObMeta settings and type hints are already resolved, so the
+            # metaclass only allocates its store and relationship lists
+            Localized.append(
+                type(PyObClass)(
+                    PyObClass.__name__, Bases, class_dict, localized_from=PyObClass
+                )
+            )
+
+        # Return localized PyOb classes
+        return [
+            Localized[result] if type(result) is int else result
+            for result in self.results
+        ]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET LOCALIZE TEMPLATE
+# └─────────────────────────────────────────────────────────────────────────────────────
 
-        # Return the localized PyOb class
-        return cache[PyObClass]
 
-    # Localize PyOb classes
-    PyObClasses = [_localize(PyObClass) for PyObClass in PyObClasses]
+def get_localize_template(PyObClasses):
+    """Returns the cached localization template of PyOb classes, building it if new"""
+
+    # Get the first PyOb class and the rest
+    PyObClass, *Included = PyObClasses
+
+    # Get PyObMeta of the first PyOb class
+    PyObMeta = PyObClass.PyObMeta
+
+    # Get the templates of the first PyOb class
+    templates = PyObMeta.localize_templates
+
+    # Check if the first PyOb class has not been localized yet
+    if templates is None:
+
+        # Initialize templates
+        templates = PyObMeta.localize_templates = {}
+
+    # Get template key
+    key = tuple(Included)
+
+    # Get template
+    template = templates.get(key)
+
+    # Check if there is no template yet
+    if template is None:
+
+        # Build and cache template
+        template = templates[key] = PyObLocalizeTemplate(PyObClasses)
+
+    # Return template
+    return template
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOCALIZE PYOB CLASS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def localize_pyob_class(*PyObClasses):
+    """Localizes and returns an interable of PyOb class instances"""
+
+    # Localize PyOb classes from their cached template
+    # NOTE: See benchmarks/localize.py for the time taken per localization
+    PyObClasses = get_localize_template(PyObClasses).localize()
 
     # Return localized PyOb classes
     return PyObClasses[0] if len(PyObClasses) == 1 else tuple(PyObClasses)
@@ -0,0 +1,122 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.main.tools.validate import check_validation_mode
+from pyob.tools.iterable import merge_tuples
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RESOLVE PYOB META
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def resolve_pyob_meta(PyObMeta):
+    """Resolves the keys, indexes and inherited settings of a PyObMeta class"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ KEYS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Get keys from current PyObMeta
+    keys = PyObMeta.keys or ()
+
+    # Ensure that keys is a tuple
+    # i.e. User can either pass in one key or an iterable of keys
+    keys = keys and ((keys,) if type(keys) is str else tuple(keys))
+
+    # Merge parent PyObMeta keys into current PyObMeta keys without duplicates
+    # This ensures that all PyOb subclasses inherit their parents' keys
+    keys = merge_tuples([Parent.PyObMeta.keys for Parent in PyObMeta.Parents] + [keys])
+
+    # Set PyObMeta.keys
+    PyObMeta.keys = keys
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INDEXES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define index attributes
+    # i.e. Secondary (hash) indexes and ordered (range) indexes
+    index_attributes = ("indexes", "ordered_indexes")
+
+    # Iterate over index attributes
+    for index_attribute in index_attributes:
+
+        # Get indexes from current PyObMeta
+        indexes = getattr(PyObMeta, index_attribute) or ()
+
+        # Ensure that indexes is a tuple
+        # i.e. User can either pass in one index or an iterable of indexes
+        indexes = indexes and (
+            (indexes,) if type(indexes) is str else tuple(indexes)
+        )
+
+        # Get parent PyObMeta indexes
+        parent_indexes = [
+            getattr(Parent.PyObMeta, index_attribute) for Parent in PyObMeta.Parents
+        ]
+
+        # Merge parent PyObMeta indexes into current PyObMeta indexes
+        # This ensures that all PyOb subclasses inherit their parents' indexes
+        indexes = merge_tuples(parent_indexes + [indexes])
+
+        # Set indexes on PyObMeta
+        setattr(PyObMeta, index_attribute, indexes)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ATTRIBUTE INHERITANCE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define inheritable attributes
+    # i.e. Attributes that will inherit from the first parent if not set otherwise
+    inheritable_attributes = (
+        "string",
+        "weak",
+        "slots",
+        "storage",
+        "threadsafe",
+        "validation",
+    )
+
+    # Iterate over inheritable attributes
+    for inheritable_attribute in inheritable_attributes:
+
+        # Get the value of the inheritable attribute
+        inheritable_attribute_value = getattr(PyObMeta, inheritable_attribute, None)
+
+        # Continue if the value of the inheritable attribute is not None
+        # i.e. It has been set explicitly and therefore should not be touched
+        if inheritable_attribute_value is not None:
+            continue
+
+        # Iterate over parent classes
+        for Parent in PyObMeta.Parents:
+
+            # Get the PyObMeta of the parent class
+            ParentPyObMeta = Parent.PyObMeta
+
+            # Get inherited attribute value from parent PyObMeta
+            inherited_attribute_value = getattr(
+                ParentPyObMeta, inheritable_attribute, None
+            )
+
+            # Continue if the inherited attribute value is None
+            # i.e. No meaningful attribute value to inherit
+            if inherited_attribute_value is None:
+                continue
+
+            # Set the inherited value on the current PyOb class and break
+            # i.e. Inherit the first meaningful attribute from any of the parents
+            setattr(PyObMeta, inheritable_attribute, inherited_attribute_value)
+            break
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALIDATION MODE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Check if a validation mode is set
+    if PyObMeta.validation is not None:
+
+        # Check validation mode
+        check_validation_mode(PyObMeta.validation)
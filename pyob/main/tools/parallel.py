@@ -0,0 +1,241 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import inspect
+
+from itertools import chain
+from math import ceil
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.exceptions import InvalidTypeError
+from pyob.main.tools.check import get_type_checker
+from pyob.main.tools.plan import get_pyob_plan
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the minimum number of rows sent to a worker process at once
+# i.e. Fewer rows would cost more to pickle and send than to validate in place
+MIN_CHUNK_SIZE = 500
+
+# Define the number of chunks per worker process
+# So that a worker that finishes early can pick up more of the rows
+CHUNKS_PER_WORKER = 4
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ROW SPEC
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_row_spec(PyObClass):
+    """Returns a picklable spec of the init arguments and field types of a PyOb class"""
+
+    # Get the parameters of the init method without self
+    parameters = list(inspect.signature(PyObClass.__init__).parameters.values())[1:]
+
+    # Get a bare signature of the init method
+    # NOTE: Annotations and defaults are dropped as they need not be picklable
+    signature = inspect.Signature(
+        [
+            parameter.replace(
+                annotation=inspect.Parameter.empty,
+                default=(
+                    inspect.Parameter.empty
+                    if parameter.default is inspect.Parameter.empty
+                    else None
+                ),
+            )
+            for parameter in parameters
+        ]
+    )
+
+    # Get the names of the init arguments
+    names = tuple(parameter.name for parameter in parameters)
+
+    # Get the names of the init arguments without a default
+    required = frozenset(
+        parameter.name
+        for parameter in parameters
+        if parameter.default is inspect.Parameter.empty
+    )
+
+    # Get whether every init argument can be passed by position or keyword
+    # So that rows can be matched to the arguments without binding the signature
+    is_plain = all(
+        parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+        for parameter in parameters
+    )
+
+    # Get the expected types of the fields named by an init argument
+    # NOTE: Init arguments are assumed to be stored under the same name, as is usual
+    checks = {
+        name: [(Relative.__name__, hint) for Relative, hint, _ in attr_plan.type_checks]
+        for name, attr_plan in get_pyob_plan(PyObClass).items()
+        if attr_plan.type_checks and name in names
+    }
+
+    # Return row spec
+    return signature, names, required, is_plain, checks
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ROW ARGUMENTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_row_arguments(spec, row):
+    """Returns the init arguments of a raw row by name or raises TypeError"""
+
+    # Get signature, names, required names and whether the signature is plain
+    signature, names, required, is_plain, _ = spec
+
+    # Check if row is a dictionary of keyword arguments
+    if isinstance(row, dict):
+
+        # Return row if it names every required argument and nothing else
+        if is_plain and required <= row.keys() and row.keys() <= set(names):
+            return row
+
+        # Otherwise bind row so that the signature explains what is wrong
+        return signature.bind(**row).arguments
+
+    # Return arguments by name if the row has a valid number of arguments
+    if is_plain and len(required) <= len(row) <= len(names):
+        return dict(zip(names, row))
+
+    # Otherwise bind row so that the signature explains what is wrong
+    return signature.bind(*row).arguments
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ VALIDATE ROWS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def validate_rows(spec, numbers, rows):
+    """Returns the row number and error of each raw row of a chunk that is invalid"""
+
+    # NOTE: This runs in a worker process so it only touches the spec and the rows
+
+    # Get type checkers by field name, compiled once per chunk
+    checks = [
+        (name, [(relative, hint, get_type_checker(hint)) for relative, hint in hints])
+        for name, hints in spec[-1].items()
+    ]
+
+    # Initialize errors
+    errors = []
+
+    # Iterate over row numbers and rows
+    for number, row in zip(numbers, rows):
+
+        # Initialize try-except block
+        try:
+
+            # Get init arguments by name
+            arguments = get_row_arguments(spec, row)
+
+        # Handle rows of the wrong shape, e.g. missing or unexpected arguments
+        except TypeError as error:
+
+            # Add error and continue
+            errors.append((number, error))
+            continue
+
+        # Iterate over the type checked fields
+        for name, hints in checks:
+
+            # Continue if the row does not pass the field
+            if name not in arguments:
+                continue
+
+            # Get value
+            value = arguments[name]
+
+            # Get the first relative and expected type that the value does not satisfy
+            failed = next(
+                (
+                    (relative, hint)
+                    for relative, hint, is_valid in hints
+                    if not is_valid(value)
+                ),
+                None,
+            )
+
+            # Continue if value is valid
+            if failed is None:
+                continue
+
+            # Add InvalidTypeError as would be raised in the parent process
+            errors.append(
+                (
+                    number,
+                    InvalidTypeError(
+                        f"{failed[0]}.{name} expects a value of type {failed[1]} but "
+                        f"got: {value} ({type(value)})"
+                    ),
+                )
+            )
+
+            # Break so that a row is only reported once
+            break
+
+    # Return errors
+    return errors
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ VALIDATE ROWS IN PARALLEL
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def validate_rows_in_parallel(PyObClass, numbers, rows, executor, workers, chunk_size):
+    """Validates raw rows across worker processes, returning errors by row number"""
+
+    # Get row spec
+    spec = get_row_spec(PyObClass)
+
+    # Get chunk size if not provided
+    chunk_size = chunk_size or max(
+        MIN_CHUNK_SIZE, ceil(len(rows) / (workers * CHUNKS_PER_WORKER))
+    )
+
+    # Get the start of each chunk
+    starts = range(0, len(rows), chunk_size)
+
+    # Validate chunks in worker processes
+    results = executor.map(
+        validate_rows,
+        [spec] * len(starts),
+        [numbers[start : start + chunk_size] for start in starts],
+        [rows[start : start + chunk_size] for start in starts],
+    )
+
+    # Return errors by row number
+    return dict(chain.from_iterable(results))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ROW VALUES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_row_values(PyObClass, rows):
+    """Returns a dictionary of the argument values of each raw row by name"""
+
+    # Get the names of the positional init arguments without self
+    names = [
+        parameter.name
+        for parameter in inspect.signature(PyObClass.__init__).parameters.values()
+        if parameter.kind
+        in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ][1:]
+
+    # Return argument values by name
+    return [row if isinstance(row, dict) else dict(zip(names, row)) for row in rows]
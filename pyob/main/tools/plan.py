@@ -0,0 +1,226 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from typing import get_type_hints
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.main.tools.check import get_type_checker
+from pyob.main.tools.traverse import traverse_pyob_direct_relatives
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB ATTR PLAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObAttrPlan:
+    """A flattened record of how a single PyOb class attribute is validated"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SLOTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    __slots__ = ("name", "is_key", "is_indexed", "type_checks", "KeyRelatives")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, name):
+        """Init Method"""
+
+        # Set attribute name
+        self.name = name
+
+        # Initialize is key to False
+        self.is_key = False
+
+        # Initialize is indexed to False
+        # i.e. Whether the attribute is a secondary or ordered index of the PyOb class
+        self.is_indexed = False
+
+        # Initialize type checks
+        # i.e. A list of (PyOb class, expected type, type checker) drawn from relatives
+        self.type_checks = []
+
+        # Initialize key relatives
+        # i.e. The PyOb classes whose stores must be checked for key unicity
+        self.KeyRelatives = []
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET PYOB TYPE HINTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_pyob_type_hints(PyObClass):
+    """Returns the type hints of a PyOb class, resolving them if not yet cached"""
+
+    # Get PyObMeta
+    PyObMeta = PyObClass.PyObMeta
+
+    # Get cached type hints
+    type_hints = PyObMeta.type_hints
+
+    # Check if type hints have not been resolved yet
+    # NOTE: They are resolved on first use rather than at class definition, as
+    # resolving them for every PyOb class adds up at import time
+    if type_hints is None:
+
+        # Initialize type hints
+        type_hints = {}
+
+        # Update type hints by init type hints
+        type_hints.update(get_type_hints(PyObClass.__init__) or {})
+
+        # Update type hints by class-level type hints
+        type_hints.update(get_type_hints(PyObClass) or {})
+
+        # NOTE: class-level type hints get priority because a different type may get
+        # passed into the init method but then casted to the class-level during init
+
+        # Cache type hints
+        PyObMeta.type_hints = type_hints
+
+    # Return type hints
+    return type_hints
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE PYOB PLAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_pyob_plan(PyObClass):
+    """Compiles a validation plan of all tracked attributes of a PyOb class"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VARIABLES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Get PyObMeta
+    PyObMeta = PyObClass.PyObMeta
+
+    # Get keys
+    keys = PyObMeta.keys or ()
+
+    # Initialize plan
+    # i.e. A map of attribute name to PyObAttrPlan for tracked attributes only
+    plan = {}
+
+    # Initialize relatives
+    Relatives = []
+
+    # Collect PyOb direct relatives in traversal order
+    # NOTE: list.append returns None so the traversal is never cut short
+    traverse_pyob_direct_relatives(
+        PyObClass=PyObClass, callback=Relatives.append, inclusive=True
+    )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ KEYS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Iterate over keys
+    for key in keys:
+
+        # Get or initialize attribute plan
+        attr_plan = plan.setdefault(key, PyObAttrPlan(key))
+
+        # Set is key to True
+        attr_plan.is_key = True
+
+        # Set key relatives
+        # i.e. Every relative that also treats the attribute as a key
+        attr_plan.KeyRelatives = [
+            Relative for Relative in Relatives if key in Relative.PyObMeta.keys
+        ]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INDEXES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Iterate over secondary and ordered indexes
+    for name in (PyObMeta.indexes or ()) + (PyObMeta.ordered_indexes or ()):
+
+        # Get or initialize attribute plan
+        attr_plan = plan.setdefault(name, PyObAttrPlan(name))
+
+        # Set is indexed to True
+        attr_plan.is_indexed = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ TYPE HINTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Iterate over relatives
+    for Relative in Relatives:
+
+        # Iterate over cached type hints of the relative
+        for name, expected_type in get_pyob_type_hints(Relative).items():
+
+            # Get or initialize attribute plan
+            attr_plan = plan.setdefault(name, PyObAttrPlan(name))
+
+            # Continue if the expected type is already covered by a closer relative
+            # Merging identical hints means each distinct type is only checked once
+            if any(hint is expected_type for _, hint, _ in attr_plan.type_checks):
+                continue
+
+            # Get compiled type checker
+            is_valid = get_type_checker(expected_type)
+
+            # Add type check to attribute plan
+            attr_plan.type_checks.append((Relative, expected_type, is_valid))
+
+    # Return plan
+    return plan
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET PYOB PLAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_pyob_plan(PyObClass):
+    """Returns the validation plan of a PyOb class, compiling it if invalidated"""
+
+    # Get PyObMeta
+    PyObMeta = PyObClass.PyObMeta
+
+    # Get validation plan
+    plan = PyObMeta.plan
+
+    # Check if plan has been invalidated
+    if plan is None:
+
+        # Compile and cache plan
+        plan = PyObMeta.plan = compile_pyob_plan(PyObClass)
+
+    # Return plan
+    return plan
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INVALIDATE PYOB PLANS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def invalidate_pyob_plans(PyObClass):
+    """Invalidates the validation plans of a PyOb class and its direct relatives"""
+
+    # Define traversal callback
+    def callback(Relative):
+        """Invalidates the validation plan of a relative PyOb class"""
+
+        # Reset validation plan so that it is recompiled on the next write
+        Relative.PyObMeta.plan = None
+
+    # Traverse PyOb direct relatives
+    traverse_pyob_direct_relatives(
+        PyObClass=PyObClass, callback=callback, inclusive=True
+    )
@@ -0,0 +1,189 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from typing import ClassVar, get_origin
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.tools.iterable import deduplicate
+from pyob.utils import Nothing
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET SLOT DEFAULT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_slot_default(pyob, name):
+    """Returns the class-level default of an unset slot, used as __getattr__"""
+
+    # Initialize try-except block
+    try:
+
+        # Return slot default
+        return pyob.__class__._slot_defaults[name]
+
+    # Handle attributes without a slot default
+    except KeyError:
+
+        # Raise AttributeError as if __getattr__ were not defined
+        raise AttributeError(
+            f"'{pyob.__class__.__name__}' object has no attribute '{name}'"
+        ) from None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET NAMESPACE SETTING
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_namespace_setting(bases, namespace, setting):
+    """Returns a PyObMeta setting of a PyOb class namespace, inheriting from bases"""
+
+    # Get setting from the PyObMeta of the namespace if any
+    value = getattr(namespace.get("PyObMeta"), setting, None)
+
+    # Return setting if set explicitly
+    if value is not None:
+        return value
+
+    # Otherwise inherit the setting of the first parent that sets it
+    return next(
+        (
+            getattr(Base.PyObMeta, setting)
+            for Base in bases
+            if getattr(getattr(Base, "PyObMeta", None), setting, None) is not None
+        ),
+        None,
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET FIELD NAMES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_field_names(namespace):
+    """Returns the names of the type hinted, key and indexed fields of a namespace"""
+
+    # Get class-level type hints
+    annotations = namespace.get("__annotations__", {})
+
+    # Get init type hints
+    init_annotations = getattr(namespace.get("__init__"), "__annotations__", {})
+
+    # Initialize names to the type hinted fields
+    # i.e. The same sources as PyObMeta.type_hints, minus class variables
+    names = [
+        name
+        for name, hint in {**init_annotations, **annotations}.items()
+        if name != "return" and ClassVar not in (hint, get_origin(hint))
+    ]
+
+    # Get PyObMeta of the namespace
+    PyObMeta = namespace.get("PyObMeta")
+
+    # Iterate over the PyObMeta settings that name fields
+    for setting in ("keys", "indexes", "ordered_indexes"):
+
+        # Get fields
+        fields = getattr(PyObMeta, setting, None) or ()
+
+        # Add fields to names
+        names += [fields] if type(fields) is str else list(fields)
+
+    # Return names without duplicates
+    return deduplicate(names)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET FIELD DEFAULTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_field_defaults(bases, namespace):
+    """Returns the fields a PyOb class namespace adds and their class-level defaults"""
+
+    # Initialize fields
+    fields = []
+
+    # Initialize defaults
+    # i.e. Class-level defaults that would otherwise shadow or conflict with a field
+    defaults = {}
+
+    # Iterate over field names
+    for name in get_field_names(namespace):
+
+        # Get inherited attribute from the first base that defines it
+        inherited = next(
+            (
+                getattr(Base, name)
+                for Base in bases
+                if getattr(Base, name, Nothing) is not Nothing
+            ),
+            Nothing,
+        )
+
+        # Get class-level default, preferring the namespace over any base
+        default = namespace.get(name, inherited)
+
+        # Continue if the class-level attribute is a descriptor
+        # e.g. A property, or the slot or column of a base that already stores it
+        if hasattr(type(default), "__get__"):
+            continue
+
+        # Check if there is a class-level default
+        if default is not Nothing:
+
+            # Move default out of the namespace and into the defaults
+            namespace.pop(name, None)
+            defaults[name] = default
+
+        # Add name to fields
+        fields.append(name)
+
+    # Return fields and defaults
+    return fields, defaults
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SLOT PYOB NAMESPACE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def slot_pyob_namespace(bases, namespace):
+    """Adds __slots__ generated from type hints to the namespace of a PyOb class"""
+
+    # Return if slots are already defined
+    # e.g. By the user or by a localized copy of a slotted PyOb class
+    if "__slots__" in namespace:
+        return
+
+    # Get the fields to slot and their class-level defaults
+    slots, slot_defaults = get_field_defaults(bases=bases, namespace=namespace)
+
+    # Check if no base supports weak references
+    # So that slotted PyOb instances can still be held by weak stores
+    if not any(Base.__weakrefoffset__ for Base in bases):
+
+        # Add weakref slot
+        slots.append("__weakref__")
+
+    # Set slots
+    namespace["__slots__"] = tuple(slots)
+
+    # Merge slot defaults over those inherited from bases
+    for Base in reversed(bases):
+        slot_defaults = {**getattr(Base, "_slot_defaults", {}), **slot_defaults}
+
+    # Check if there are any slot defaults
+    if slot_defaults:
+
+        # Set slot defaults
+        namespace["_slot_defaults"] = slot_defaults
+
+        # Serve slot defaults for unset slots unless __getattr__ is user defined
+        namespace.setdefault("__getattr__", get_slot_default)
@@ -0,0 +1,79 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the slots that hold bookkeeping rather than the state of a PyOb instance
+BOOKKEEPING_SLOTS = ("__dict__", "__weakref__", "_row")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET PYOB STATE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_pyob_state(pyob):
+    """Returns a dictionary of the attributes set on a PyOb instance"""
+
+    # Get PyOb class
+    PyObClass = pyob.__class__
+
+    # Initialize state to a copy of the instance dictionary if any
+    state = dict(getattr(pyob, "__dict__", {}))
+
+    # Iterate over the classes of the PyOb instance
+    for Class in PyObClass.__mro__:
+
+        # Get slots of the class
+        slots = Class.__dict__.get("__slots__", ())
+
+        # Iterate over slots
+        for name in (slots,) if type(slots) is str else slots:
+
+            # Continue if the slot is bookkeeping
+            if name in BOOKKEEPING_SLOTS:
+                continue
+
+            # Initialize try-except block
+            try:
+
+                # Add the value of the slot
+                # NOTE: The slot is read directly so that slot defaults are excluded
+                state[name] = Class.__dict__[name].__get__(pyob, Class)
+
+            # Handle slots that have not been set
+            except AttributeError:
+                continue
+
+    # Get columns of the PyOb class if columnar
+    columns = PyObClass.PyObMeta.store._columns
+
+    # Check if the PyOb class is columnar
+    if columns is not None:
+
+        # Get row
+        row = pyob._row
+
+        # Add the values set in the row
+        state.update(
+            (name, column.read(row))
+            for name, column in columns.items()
+            if column.is_set[row]
+        )
+
+    # Return state
+    return state
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SET PYOB STATE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def set_pyob_state(pyob, state):
+    """Sets the attributes of a PyOb instance without validating or indexing them"""
+
+    # Iterate over state
+    for name, value in state.items():
+
+        # Set attribute, bypassing PyOb.__setattr__
+        object.__setattr__(pyob, name, value)
@@ -2,6 +2,8 @@
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
+from pyob.stats import PyObStats
+from pyob.stats.tools import record
 from pyob.tools import is_pyob_base
 from pyob.utils import ReturnValue
 
@@ -76,6 +78,10 @@ def traverse_pyob_layer(PyObClass, callback, layer, inclusive=False, seen=None):
         # Add PyObClass ID to seen
         seen.add(class_id)
 
+        # Record the visit if stats are enabled
+        if PyObStats.enabled:
+            record(PyObClass, "traversal_visits")
+
         # Apply callback function and get result
         result = callback(Relative)
 
@@ -2,15 +2,222 @@
 # │ GENERAL IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-from beartype.abby import is_bearable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-from pyob.exceptions import DuplicateKeyError, InvalidKeyError, InvalidTypeError
-from pyob.main.tools.index import index_pyob_attr
-from pyob.main.tools.traverse import traverse_pyob_direct_relatives
+from pyob.exceptions import (
+    DuplicateKeyError,
+    InvalidKeyError,
+    InvalidTypeError,
+    InvalidValidationModeError,
+)
+from pyob.index import PyObOrderedIndex
+from pyob.main.tools.index import get_transaction, index_pyob_attr
+from pyob.main.tools.plan import get_pyob_plan
+from pyob.stats import PyObStats
+from pyob.stats.tools import record
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define validation modes
+STRICT = "strict"
+SAMPLED = "sampled"
+DEFERRED = "deferred"
+OFF = "off"
+
+# Define the interval at which the writes to a store are type checked when sampled
+# i.e. The first of every this many writes
+SAMPLE_INTERVAL = 100
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CURRENT VALIDATION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize current validation
+# i.e. A (mode, stores written in deferred mode) pair overriding the validation mode
+# of every PyOb class within a validation block, if any
+current_validation = ContextVar("current_validation", default=None)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CHECK VALIDATION MODE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def check_validation_mode(mode):
+    """Raises an InvalidValidationModeError if a validation mode is not supported"""
+
+    # Check if validation mode is not supported
+    if mode not in (STRICT, SAMPLED, DEFERRED, OFF):
+
+        # Raise InvalidValidationModeError
+        raise InvalidValidationModeError(
+            f"{mode!r} is not a validation mode, expected one of: "
+            f"{STRICT!r}, {SAMPLED!r}, {DEFERRED!r} or {OFF!r}"
+        )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ VALIDATION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@contextmanager
+def validation(mode):
+    """Overrides the validation mode of every PyOb class within a block"""
+
+    # Check validation mode
+    check_validation_mode(mode)
+
+    # Initialize the stores written in deferred mode within the block
+    stores = {}
+
+    # Override validation mode
+    token = current_validation.set((mode, stores))
+
+    # Initialize try-finally block
+    try:
+
+        # Run block
+        yield
+
+    # Restore validation mode
+    finally:
+        current_validation.reset(token)
+
+    # Iterate over the stores written in deferred mode
+    for store in stores:
+
+        # Type check the PyOb instances written within the block in one batched pass
+        store._validate_pending()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ IS TYPE CHECKED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def is_type_checked(pyob, name):
+    """Returns whether a write to a PyOb instance attribute is type checked now"""
+
+    # Get PyObMeta
+    PyObMeta = pyob.__class__.PyObMeta
+
+    # Get validation override if any
+    override = current_validation.get()
+
+    # Get validation mode
+    mode = override[0] if override else PyObMeta.validation
+
+    # Return True if strict
+    # NOTE: Ordered indexes are always type checked as they cannot sort mistyped values
+    if mode is None or mode == STRICT or name in PyObMeta.ordered_indexes:
+        return True
+
+    # Get store
+    store = PyObMeta.store
+
+    # Check if sampled
+    if mode == SAMPLED:
+
+        # Get and increment the number of writes to the store
+        count = store._write_count
+        store._write_count = count + 1
+
+        # Return whether the write is the first of its interval
+        return count % SAMPLE_INTERVAL == 0
+
+    # Check if deferred
+    if mode == DEFERRED:
+
+        # Mark PyOb instance as pending a type check
+        store._pending_pyobs[pyob] = None
+
+        # Check if within a validation block
+        if override:
+
+            # Mark store as written so that it is validated at the end of the block
+            override[1][store] = None
+
+    # Return False
+    return False
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RECORD TYPE CHECKS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def record_type_checks(PyObClass, name, value, type_checks):
+    """Type checks a PyOb instance attribute, recording the stats of the PyOb class"""
+
+    # Record validation
+    record(PyObClass, "validations")
+
+    # Record type checks and those that call into beartype
+    record(PyObClass, "type_checks", len(type_checks))
+    record(
+        PyObClass,
+        "bearable_checks",
+        sum(getattr(is_valid, "is_bearable", False) for *_, is_valid in type_checks),
+    )
+
+    # Get start time
+    start = perf_counter()
+
+    # Initialize try-finally block
+    try:
+
+        # Iterate over the compiled type checks of the PyOb class relatives
+        for Relative, expected_type, is_valid in type_checks:
+
+            # Check if type is invalid
+            if not is_valid(value):
+
+                # Raise InvalidTypeError
+                raise InvalidTypeError(
+                    f"{Relative.__name__}.{name} expects a value of type "
+                    f"{expected_type} but got: {value} ({type(value)})"
+                )
+
+    # Record validation time, whether the value is valid or not
+    finally:
+        record(PyObClass, "validation_seconds", perf_counter() - start)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ VALIDATE PYOB ORDER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def validate_pyob_order(PyObClass, name, values):
+    """Raises an InvalidTypeError if values cannot be ordered by an ordered index"""
+
+    # Get ordered index if any
+    ordered_index = PyObClass.PyObMeta.store._ordered_indexes.get(name)
+
+    # Initialize try-except block
+    try:
+
+        # Check that values can be ordered among themselves and against the index
+        # NOTE: Checked before indexing so that a failed write leaves no index changed
+        (ordered_index or PyObOrderedIndex()).check(values)
+
+    # Handle values that cannot be ordered
+    except TypeError as error:
+
+        # Raise InvalidTypeError
+        raise InvalidTypeError(
+            f"{PyObClass.__name__}.{name} is an ordered index and therefore expects "
+            f"values that can be ordered against each other: {error}"
+        ) from None
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -18,8 +225,8 @@ from pyob.main.tools.traverse import traverse_pyob_direct_relatives
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 
-def validate_pyob_attr(pyob, name, value):
-    """Validates a PyOb instance attribute"""
+def validate_pyob_attr(pyob, name, value, attr_plan=None, check_types=True):
+    """Validates a PyOb instance attribute against its compiled attribute plan"""
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ VARIABLES
@@ -28,19 +235,21 @@ def validate_pyob_attr(pyob, name, value):
     # Get PyOb class
     PyObClass = pyob.__class__
 
-    # Get PyObMeta
-    PyObMeta = PyObClass.PyObMeta
+    # Get attribute plan if not provided
+    attr_plan = attr_plan or get_pyob_plan(PyObClass).get(name)
+
+    # Return if attribute is untracked
+    # i.e. Neither a key nor type hinted anywhere in the PyOb class relatives
+    if attr_plan is None:
+        return
+
+    # Get is key
+    is_key = attr_plan.is_key
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ VALIDATE KEY TYPE
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    # Get keys
-    keys = PyObMeta.keys or ()
-
-    # Determine if key
-    is_key = keys and name in keys
-
     # Check if key and is None
     if is_key and value is None:
 
@@ -53,87 +262,75 @@ def validate_pyob_attr(pyob, name, value):
         )
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ TRAVERSE PYOB RELATIVES
+    # │ VALIDATE TYPE HINTS
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    # Define traversal callback
-    def callback(PyObClass):
-        """Validates a PyOb instance attribute against its PyOb class relatives"""
+    # Get type checks unless deferred
+    # i.e. Inside a transaction or if the validation mode is not strict
+    type_checks = attr_plan.type_checks if check_types else ()
 
-        # ┌─────────────────────────────────────────────────────────────────────────────
-        # │ VARIABLES
-        # └─────────────────────────────────────────────────────────────────────────────
+    # Check if stats are enabled and the write is type checked
+    if PyObStats.enabled and type_checks:
 
-        # Get PyObMeta
-        PyObMeta = PyObClass.PyObMeta
+        # Type check the value, recording counters
+        record_type_checks(PyObClass, name, value, type_checks)
 
-        # ┌─────────────────────────────────────────────────────────────────────────────
-        # │ VALIDATE TYPE HINTS
-        # └─────────────────────────────────────────────────────────────────────────────
+    # Otherwise iterate over the compiled type checks of the PyOb class relatives
+    else:
 
-        # Get cached type hints
-        type_hints = PyObClass.PyObMeta.type_hints
-
-        # Check if name in type hints
-        if name in type_hints:
-
-            # Get expected type
-            expected_type = type_hints[name]
-
-            # Check if boolean edge case
-            if type(value) is bool and expected_type is not bool:
-
-                # Set type is valid to False
-                # Booleans pass for ints / floats under MyPy
-                type_is_valid = False
-
-            # Otherwise handle general case
-            else:
-
-                # Determine if type is valid
-                type_is_valid = is_bearable(value, expected_type)
+        # Iterate over the compiled type checks of the PyOb class relatives
+        for Relative, expected_type, is_valid in type_checks:
 
             # Check if type is invalid
-            if not type_is_valid:
+            if not is_valid(value):
 
                 # Raise InvalidTypeError
                 raise InvalidTypeError(
-                    f"{PyObClass.__name__}.{name} expects a value of type "
+                    f"{Relative.__name__}.{name} expects a value of type "
                     f"{expected_type} but got: {value} ({type(value)})"
                 )
 
-        # ┌─────────────────────────────────────────────────────────────────────────────
-        # │ VALIDATE KEY UNICITY
-        # └─────────────────────────────────────────────────────────────────────────────
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALIDATE ORDER
+    # └─────────────────────────────────────────────────────────────────────────────────
 
-        # Check if is a key in the PyOb class
-        if is_key and name in PyObMeta.keys:
+    # Check if is an ordered index
+    if name in (PyObClass.PyObMeta.ordered_indexes or ()):
 
-            # Get PyObs by key map
-            pyobs_by_key = PyObMeta.store._pyobs_by_key
+        # Validate that the value can be ordered against the ordered index
+        validate_pyob_order(PyObClass=PyObClass, name=name, values=(value,))
 
-            # Check if value in PyObs by key map
-            if value in pyobs_by_key:
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALIDATE KEY UNICITY
+    # └─────────────────────────────────────────────────────────────────────────────────
 
-                # Get other
-                other = pyobs_by_key[value]
+    # Return if not a key
+    if not is_key:
+        return
 
-                # Check if existing index is not the current PyOb instance
-                if id(other) != id(pyob):
+    # Iterate over the relatives that share the key
+    for Relative in attr_plan.KeyRelatives:
 
-                    # Get singular label
-                    label_singular = PyObClass.label_singular
+        # Get PyObs by key map
+        pyobs_by_key = Relative.PyObMeta.store._pyobs_by_key
 
-                    # Raise DuplicateKeyError
-                    raise DuplicateKeyError(
-                        f"A {label_singular} with a key of {value} already exists: "
-                        f"{other}"
-                    )
+        # Check if value in PyObs by key map
+        if value in pyobs_by_key:
 
-    # Traverse PyOb direct relatives
-    traverse_pyob_direct_relatives(
-        PyObClass=PyObClass, callback=callback, inclusive=True
-    )
+            # Get other
+            other = pyobs_by_key[value]
+
+            # Check if existing index is not the current PyOb instance
+            if id(other) != id(pyob):
+
+                # Get singular label
+                label_singular = Relative.label_singular
+
+                # Raise DuplicateKeyError
+                raise DuplicateKeyError(
+                    f"A {label_singular} with a key of {value} already exists: "
+                    f"{other}"
+                )
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -141,11 +338,61 @@ def validate_pyob_attr(pyob, name, value):
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 
-def validate_and_index_pyob_attr(pyob, name, value):
+def validate_and_index_pyob_attr(pyob, name, value, attr_plan=None):
     """Validates and indexes a PyOb instance attribute"""
 
-    # Validate PyOb instance attribute
-    validate_pyob_attr(pyob=pyob, name=name, value=value)
+    # Get store
+    store = pyob.__class__.PyObMeta.store
+
+    # Get the transaction that covers the store if any
+    transaction = get_transaction(store)
+
+    # Check if a transaction covers the store
+    if transaction is not None:
+
+        # Validate and index PyOb instance attribute as part of the transaction
+        # So that the write is undo logged and its type check deferred to commit
+        transaction.write(pyob=pyob, name=name, value=value, attr_plan=attr_plan)
+
+        # Return
+        return
+
+    # Get whether to type check the write
+    check_types = is_type_checked(pyob=pyob, name=name)
+
+    # Get the lock of the family of the PyOb class if thread-safe
+    lock = store._family._lock
+
+    # Check if the family is not thread-safe
+    if lock is None:
+
+        # Validate PyOb instance attribute
+        validate_pyob_attr(
+            pyob=pyob,
+            name=name,
+            value=value,
+            attr_plan=attr_plan,
+            check_types=check_types,
+        )
+
+        # Index PyOb instance attribute
+        index_pyob_attr(pyob=pyob, name=name, value=value)
+
+        # Return
+        return
+
+    # Validate and index as one atomic step
+    # So that two threads cannot both pass the key check before either indexes
+    with lock:
+
+        # Validate PyOb instance attribute
+        validate_pyob_attr(
+            pyob=pyob,
+            name=name,
+            value=value,
+            attr_plan=attr_plan,
+            check_types=check_types,
+        )
 
-    # Index PyOb instance attribute
-    index_pyob_attr(pyob=pyob, name=name, value=value)
+        # Index PyOb instance attribute
+        index_pyob_attr(pyob=pyob, name=name, value=value)
@@ -1,18 +1,25 @@
-# ┌─────────────────────────────────────────────────────────────────────────────────────
-# │ GENERAL IMPORTS
-# └─────────────────────────────────────────────────────────────────────────────────────
-
-from typing import get_type_hints
-
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
+from pyob.column import PyObColumn, PyObColumns
+from pyob.exceptions import InvalidStorageError
+from pyob.main.tools.bulk import get_set_values
+from pyob.main.tools.columns import column_pyob_namespace, is_columnar
+from pyob.main.tools.disk import disk_pyob_namespace
+from pyob.main.tools.index import deindex_pyob, uncover_pyob_index
+from pyob.main.tools.meta import resolve_pyob_meta
+from pyob.main.tools.plan import get_pyob_type_hints, invalidate_pyob_plans
+from pyob.main.tools.slots import get_namespace_setting, slot_pyob_namespace
 from pyob.main.tools.validate import validate_and_index_pyob_attr
 from pyob.meta.classes.metaclass_base import MetaclassBase
-from pyob.store.classes import PyObStore
+from pyob.stats import PyObStats
+from pyob.stats.tools import record
+from pyob.store.classes import PyObDiskStore, PyObStore
+from pyob.tools import is_pyob_base
 from pyob.tools.iterable import deduplicate
 from pyob.tools.string import split_pascal
+from pyob.utils import Nothing
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -23,30 +30,79 @@ from pyob.tools.string import split_pascal
 class Metaclass(type):
     """The metaclass for the PyOb class"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __NEW__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __new__(mcs, name, bases, namespace, localized_from=None, **kwargs):
+        """New Method"""
+
+        # Check if the PyOb class is a localized copy
+        # i.e. Whose namespace is already columnar, slotted or disk-backed as needed
+        if localized_from is not None:
+
+            # Create and return PyOb class
+            return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+        # Get storage setting
+        storage = get_namespace_setting(bases, namespace, "storage")
+
+        # Check if the PyOb class should be columnar
+        if is_columnar(bases=bases, storage=storage):
+
+            # Turn the PyOb class into a row handle into columns of its store
+            column_pyob_namespace(bases=bases, namespace=namespace)
+
+        # Otherwise check if the PyOb class should be slotted
+        elif get_namespace_setting(bases, namespace, "slots"):
+
+            # Generate slots from the type hinted fields of the namespace
+            slot_pyob_namespace(bases=bases, namespace=namespace)
+
+        # Check if the PyOb class should be disk-backed
+        if storage == "disk":
+
+            # Write the attribute writes of PyOb instances through to disk
+            disk_pyob_namespace(bases=bases, namespace=namespace)
+
+        # Create and return PyOb class
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INIT__
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def __init__(cls, *args, **kwargs):
+    def __init__(cls, *args, localized_from=None, **kwargs):
         """Init Method"""
 
         # ┌─────────────────────────────────────────────────────────────────────────────
         # │ PYOB META
         # └─────────────────────────────────────────────────────────────────────────────
 
+        # Get the PyObMeta defined on or inherited by the current class
+        DefinedPyObMeta = cls.PyObMeta
+
         # Get metaclass dictionary
-        # i.e. A blank copy of the MetaclassBase attributes
+        # i.e. The attributes and methods defined in the current class PyObMeta
+        # NOTE: Instance dictionary and weak reference descriptors are made anew
+        metaclass_dict = {
+            name: value
+            for name, value in DefinedPyObMeta.__dict__.items()
+            if name not in ("__dict__", "__weakref__")
+        }
+
+        # Get the bases of the current class PyObMeta
+        Bases = tuple(Base for Base in DefinedPyObMeta.__bases__ if Base is not object)
+
+        # Add MetaclassBase to the bases unless already inherited
         # To ensure every PyObMeta class shares a common set of attributes and methods
-        metaclass_dict = dict(MetaclassBase.__dict__)
-
-        # Update metaclass dictionary with the attributes of the current class PyObMeta
-        # To ensure the metaclass dictionary inherits all the attributes and methods
-        # defined in the current class PyObMeta
-        metaclass_dict.update(dict(cls.PyObMeta.__dict__))
+        # without copying them into every PyObMeta class
+        if not any(issubclass(Base, MetaclassBase) for Base in Bases):
+            Bases += (MetaclassBase,)
 
         # Create a new reference for PyObMeta so each PyOb class has its own PyObMeta
         # Otherwise we will end up reassigning mutable attributes such as the store
-        cls.PyObMeta = type("PyObMeta", cls.PyObMeta.__bases__, metaclass_dict)
+        cls.PyObMeta = type("PyObMeta", Bases, metaclass_dict)
 
         # Get the freshly initialized PyObMeta
         PyObMeta = cls.PyObMeta
@@ -63,14 +119,6 @@ class Metaclass(type):
         # i.e. Any PyOb classes that end up inheriting from the current class
         PyObMeta.Children = []
 
-        # ┌─────────────────────────────────────────────────────────────────────────────
-        # │ STORE
-        # └─────────────────────────────────────────────────────────────────────────────
-
-        # Initialize store
-        # i.e. The "database" of all instances initialized from the current class
-        PyObMeta.store = PyObStore(PyObClass=cls)
-
         # Iterate over all base classes
         for Base in cls.__bases__:
 
@@ -93,91 +141,172 @@ class Metaclass(type):
             ParentPyObMeta.Children.append(cls)
 
         # ┌─────────────────────────────────────────────────────────────────────────────
-        # │ KEYS
+        # │ SETTINGS
         # └─────────────────────────────────────────────────────────────────────────────
 
-        # Get keys from current PyObMeta
-        keys = PyObMeta.keys or ()
+        # Check if the PyOb class is not a localized copy
+        # i.e. Localized copies keep the settings resolved for the PyOb class they copy
+        if localized_from is None:
 
-        # Ensure that keys is a tuple
-        # i.e. User can either pass in one key or an iterable of keys
-        keys = keys and ((keys,) if type(keys) is str else tuple(keys))
+            # Resolve keys, indexes and inherited settings of PyObMeta
+            resolve_pyob_meta(PyObMeta)
 
-        # Merge parent PyObMeta keys into current PyObMeta keys
-        # This ensures that all PyOb subclasses inherit their parents' keys
-        keys = sum([Parent.PyObMeta.keys for Parent in PyObMeta.Parents] + [keys], ())
+        # ┌─────────────────────────────────────────────────────────────────────────────
+        # │ STORE
+        # └─────────────────────────────────────────────────────────────────────────────
 
-        # Remove any duplicate keys
-        keys = deduplicate(keys)
+        # Check if the PyOb class is disk-backed
+        if PyObMeta.storage == "disk":
 
-        # Set PyObMeta.keys
-        PyObMeta.keys = keys
+            # Check if the PyOb class has secondary or ordered indexes
+            # NOTE: These would hold every PyOb instance in memory by reference
+            if PyObMeta.indexes or PyObMeta.ordered_indexes:
+
+                # Raise InvalidStorageError
+                raise InvalidStorageError(
+                    f"{cls.__name__} is disk-backed and therefore supports keys but "
+                    "not indexes or ordered indexes"
+                )
+
+            # Initialize a store whose PyOb instances are kept on disk between uses
+            PyObMeta.store = PyObDiskStore(PyObClass=cls)
+
+        # Otherwise initialize an in-memory store
+        else:
+
+            # Initialize store
+            # i.e. The "database" of all instances initialized from the current class
+            # NOTE: A weak store only holds PyOb instances that are referenced elsewhere
+            PyObMeta.store = PyObStore(PyObClass=cls, weak=bool(PyObMeta.weak))
+
+        # Get the stores whose running totals include the PyOb instances of this class
+        # i.e. The store itself followed by the stores of every ancestor, each once
+        rollup_stores = sum(
+            [Parent.PyObMeta.store._rollup_stores for Parent in PyObMeta.Parents],
+            PyObMeta.store._rollup_stores,
+        )
+
+        # Remove any duplicate rollup stores and set them on the store
+        # NOTE: Diamond inheritance would otherwise count an instance twice
+        PyObMeta.store._rollup_stores = deduplicate(rollup_stores)
+
+        # Iterate over rollup stores
+        for rollup_store in PyObMeta.store._rollup_stores:
+
+            # Add store to the descendant stores of the rollup store
+            rollup_store._descendant_stores.add(PyObMeta.store)
 
         # ┌─────────────────────────────────────────────────────────────────────────────
-        # │ ATTRIBUTE INHERITANCE
+        # │ FAMILY
         # └─────────────────────────────────────────────────────────────────────────────
 
-        # Define inheritable attributes
-        # i.e. Attributes that will inherit from the first parent if not set otherwise
-        inheritable_attributes = ("string",)
+        # Get the families of the parent classes
+        # NOTE: The PyOb base class is excluded so that unrelated hierarchies stay apart
+        families = deduplicate(
+            [
+                Parent.PyObMeta.store._family
+                for Parent in PyObMeta.Parents
+                if not is_pyob_base(Parent)
+            ]
+        )
 
-        # Iterate over inheritable attributes
-        for inheritable_attribute in inheritable_attributes:
+        # Check if there are any parent families
+        if families:
 
-            # Get the value of the inheritable attribute
-            inheritable_attribute_value = getattr(PyObMeta, inheritable_attribute, None)
+            # Get the largest parent family
+            # So that the smaller families are the ones whose keys are re-indexed
+            family = max(families, key=len)
 
-            # Continue if the value of the inheritable attribute is not None
-            # i.e. It has been set explicitly and therefore should not be touched
-            if inheritable_attribute_value is not None:
-                continue
+            # Iterate over the other parent families and the family of the store
+            for other in families + [PyObMeta.store._family]:
 
-            # Iterate over parent classes
-            for Parent in PyObMeta.Parents:
+                # Merge other family into the family unless it is the same
+                # i.e. A class with several parents joins their families together
+                if other is not family:
+                    family.merge(other)
 
-                # Get the PyObMeta of the parent class
-                ParentPyObMeta = Parent.PyObMeta
+        # Check if the PyOb class is thread-safe
+        if PyObMeta.threadsafe:
 
-                # Get inherited attribute value from parent PyObMeta
-                inherited_attribute_value = getattr(
-                    ParentPyObMeta, inheritable_attribute, None
-                )
+            # Serialize the key checks and index writes of the whole family
+            # NOTE: Its PyOb classes share one key index so must share one lock
+            PyObMeta.store._family.make_threadsafe()
 
-                # Continue if the inherited attribute value is None
-                # i.e. No meaningful attribute value to inherit
-                if inherited_attribute_value is None:
-                    continue
+        # ┌─────────────────────────────────────────────────────────────────────────────
+        # │ TYPE HINTS
+        # └─────────────────────────────────────────────────────────────────────────────
 
-                # Set the inherited value on the current PyOb class and break
-                # i.e. Inherit the first meaningful attribute from any of the parents
-                setattr(PyObMeta, inheritable_attribute, inherited_attribute_value)
-                break
+        # Check if the PyOb class is not a localized copy
+        # i.e. Localized copies share the type hints of the PyOb class they copy
+        if localized_from is None:
+
+            # Initialize type hints to None
+            # i.e. Resolved and cached on first use by get_pyob_type_hints
+            PyObMeta.type_hints = None
 
         # ┌─────────────────────────────────────────────────────────────────────────────
-        # │ TYPE HINTS
+        # │ COLUMNS
         # └─────────────────────────────────────────────────────────────────────────────
 
-        # Initialize type hints
-        type_hints = {}
+        # Check if the PyOb class is columnar
+        if hasattr(cls, "_column_names"):
+
+            # Set storage to columnar, as it is for the children of a columnar class
+            PyObMeta.storage = "columnar"
 
-        # Update type hints by init type hints
-        type_hints.update(get_type_hints(cls.__init__) or {})
+            # Initialize the columns of the store
+            # i.e. The field values of every PyOb instance of the class itself
+            columns = PyObMeta.store._columns = PyObColumns()
 
-        # Update type hints by class-level type hints
-        type_hints.update(get_type_hints(cls) or {})
+            # Get type hints
+            # NOTE: Resolved right away as columns are packed according to them
+            type_hints = get_pyob_type_hints(cls)
 
-        # NOTE: class-level type hints get priority because a different type may get
-        # passed into the init method but then casted to the class-level during init
+            # Iterate over column names
+            for name in cls._column_names:
+
+                # Initialize column packed according to its type hint
+                column = PyObColumn(
+                    name=name,
+                    type_hint=type_hints.get(name),
+                    default=cls._column_defaults.get(name, Nothing),
+                )
 
-        # Set type hints
-        cls.PyObMeta.type_hints = type_hints
+                # Add column to columns
+                columns[name] = column
+
+                # Set column on the PyOb class
+                # So that PyOb instances read and write their fields through it
+                setattr(cls, name, column)
+
+        # ┌─────────────────────────────────────────────────────────────────────────────
+        # │ VALIDATION PLAN
+        # └─────────────────────────────────────────────────────────────────────────────
+
+        # Initialize validation plan to None
+        # i.e. Compiled on first write by get_pyob_plan, along with the type hints
+        PyObMeta.plan = None
+
+        # Check if the PyOb class has parents and is not a localized copy
+        # NOTE: The relatives of a localized copy are other fresh localized copies, so
+        # none of them has a plan to invalidate yet
+        if PyObMeta.Parents and localized_from is None:
+
+            # Invalidate the validation plans of all direct relatives
+            # The Children of the parent classes have changed so their plans are stale
+            invalidate_pyob_plans(cls)
 
         # ┌─────────────────────────────────────────────────────────────────────────────
         # │ LOCALIZATION
         # └─────────────────────────────────────────────────────────────────────────────
 
         # Set localized from attribute
-        PyObMeta.localized_from = None
+        # This will ensure that isinstance() still works with localized PyOb classes
+        PyObMeta.localized_from = localized_from
+
+        # Reset localization templates
+        # i.e. Those copied along with the PyObMeta of a parent or localized class
+        PyObMeta.localize_templates = None
 
         # ┌─────────────────────────────────────────────────────────────────────────────
         # │ SUPER INIT
@@ -196,32 +325,46 @@ class Metaclass(type):
         # Get PyOb store
         store = cls.PyObMeta.store
 
-        # Get counts by PyOb instance
-        counts_by_pyob = store._counts_by_pyob
-
-        # Get PyOb instances by key
-        pyobs_by_key = store._pyobs_by_key
-
         # Define list of attributes to validate
-        attrs_to_validate = list(cls.PyObMeta.keys)
+        # i.e. Keys and indexes, which must also cover class-level defaults
+        # NOTE: Only those left to a class-level or slot default are validated here
+        attrs_to_validate = [
+            *cls.PyObMeta.keys,
+            *cls.PyObMeta.indexes,
+            *cls.PyObMeta.ordered_indexes,
+        ]
 
         # Ensure list off attributes to validate is unique
         attrs_to_validate = deduplicate(attrs_to_validate)
 
+        # Create a blank PyOb instance
+        # The instance is created ahead of init so that it can be deindexed on failure
+        pyob = cls.__new__(cls, *args, **kwargs)
+
+        # Return PyOb instance if not an instance of the PyOb class, as with type()
+        if not isinstance(pyob, cls):
+            return pyob
+
         # Initialize try-except block
         try:
 
-            # Get PyOb instance
-            pyob = super().__call__(*args, **kwargs)
+            # Initialize PyOb instance
+            pyob.__init__(*args, **kwargs)
 
             # Iterate over attributes to validate
             for attr in attrs_to_validate:
 
-                # Check if PyOb class has the attribute
-                if hasattr(cls, attr):
+                # Continue if the attribute is set on the PyOb instance itself
+                # i.e. It has already been validated and indexed by __setattr__
+                if get_set_values(cls, (pyob,), attr):
+                    continue
+
+                # Get PyOb instance attribute
+                # NOTE: Slots that were never set have no value even on the class
+                pyob_attr = getattr(pyob, attr, Nothing)
 
-                    # Get PyOb instance attribute
-                    pyob_attr = getattr(pyob, attr)
+                # Check if PyOb instance has the attribute
+                if pyob_attr is not Nothing:
 
                     # Validate and index PyOb instance attribute
                     validate_and_index_pyob_attr(pyob=pyob, name=attr, value=pyob_attr)
@@ -233,11 +376,10 @@ class Metaclass(type):
         # Handle any exception encountered during initialization
         except Exception:
 
-            # Clean up key index as if PyOb instance never existed
-            # Ensures no keys for problematic instances are kept in the index
-            store._obs_by_key = {
-                k: v for k, v in pyobs_by_key.items() if v in counts_by_pyob
-            }
+            # Clean up indexes as if PyOb instance never existed
+            # Ensures no keys or values for problematic instances are kept in indexes
+            with store._family.locked():
+                deindex_pyob(pyob)
 
             # Re-raise exception
             raise
@@ -246,11 +388,42 @@ class Metaclass(type):
             # The above except block ensures that PyOb initialization is atomic
 
         # Add PyOb instance to store
-        store._counts_by_pyob[pyob] = 1
+        store._insert((pyob,))
+
+        # Record the construction if stats are enabled
+        if PyObStats.enabled:
+            record(cls, "constructions")
 
         # Return PyOb instance
         return pyob
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETATTR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setattr__(cls, name, value):
+        """Set Attribute Method"""
+
+        # Set class attribute
+        super().__setattr__(name, value)
+
+        # Mark any index of the attribute as missing PyOb instances
+        # i.e. Those that inherit the class-level default were indexed under the old one
+        uncover_pyob_index(PyObClass=cls, name=name)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __DELATTR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __delattr__(cls, name):
+        """Delete Attribute Method"""
+
+        # Delete class attribute
+        super().__delattr__(name)
+
+        # Mark any index of the attribute as missing PyOb instances
+        uncover_pyob_index(PyObClass=cls, name=name)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __GETITEM__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -258,8 +431,8 @@ class Metaclass(type):
     def __getitem__(cls, key):
         """Get Item Method"""
 
-        # Apply get item to PyOb store
-        return cls.PyObMeta.store[key]
+        # Get PyOb instance by key from PyOb store
+        return cls.PyObMeta.store.key(key)
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INSTANCECHECK__
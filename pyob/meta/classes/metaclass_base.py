@@ -1,3 +1,10 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.stats.tools import get_pyob_stats
+
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ METACLASS BASE
 # └─────────────────────────────────────────────────────────────────────────────────────
@@ -23,6 +30,62 @@ class MetaclassBase:
     # Initialize keys to None
     keys = None
 
+    # Initialize secondary indexes to None
+    # i.e. Non-unique fields whose values are indexed to a PyObSet of PyOb instances
+    indexes = None
+
+    # Initialize ordered indexes to None
+    # i.e. Fields whose values are kept sorted for range and top-n queries
+    ordered_indexes = None
+
+    # Initialize weak to None
+    # i.e. Whether the store and indexes only weakly reference PyOb instances
+    weak = None
+
+    # Initialize slots to None
+    # i.e. Whether instances store type hinted fields in slots rather than a __dict__
+    # NOTE: See benchmarks/slots_memory.py for the memory saved per instance
+    slots = None
+
+    # Initialize storage to None
+    # i.e. "columnar" to store field values in per-field arrays of the store, with
+    # PyOb instances as thin row handles, or "disk" to keep PyOb instances in a
+    # memory-mapped file, materializing them on access
+    storage = None
+
+    # Initialize threadsafe to None
+    # i.e. Whether key checks and index writes are atomic across threads, serialized
+    # by a lock shared with the PyOb classes of the same key-sharing family
+    # NOTE: See benchmarks/thread_stress.py for a stress test with many threads
+    threadsafe = None
+
+    # Initialize validation to None
+    # i.e. "strict" to type check every write, "sampled" to type check one in every
+    # hundred writes, "deferred" to type check written PyOb instances on validate_all
+    # or "off", with keys and ordered indexes always checked regardless
+    validation = None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALIDATION PLAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize validation plan to None
+    # i.e. A map of tracked attribute names to their compiled PyObAttrPlan
+    plan = None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOCALIZATION
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize localized from to None
+    # i.e. The PyOb class that the PyOb class is a localized copy of
+    localized_from = None
+
+    # Initialize localization templates to None
+    # i.e. A map of the tuple of PyOb classes localized along with the PyOb class to
+    # their cached PyObLocalizeTemplate
+    localize_templates = None
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ AESTHETIC SETTINGS
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -32,3 +95,15 @@ class MetaclassBase:
 
     # Initialize labels to None
     label_singular = label_plural = None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ STATS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def stats(PyObMeta):
+        """Returns a dictionary of the performance counters of the PyOb class"""
+
+        # Return the stats of the PyOb class of the store
+        # NOTE: Counters are only recorded while pyob.stats is enabled
+        return get_pyob_stats(PyObMeta.store._PyObClass)
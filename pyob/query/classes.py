@@ -0,0 +1,492 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import operator
+import types
+
+from itertools import islice
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.main.tools.plan import get_pyob_type_hints
+from pyob.utils import Nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define lookup separator
+# e.g. score__gte=10
+LOOKUP_SEPARATOR = "__"
+
+# Define comparisons by lookup
+LOOKUPS = {
+    "exact": operator.eq,
+    "in": lambda value, values: value in values,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+# Define range lookups
+# i.e. The lookups that an ordered index can answer without a scan
+RANGE_LOOKUPS = ("gt", "gte", "lt", "lte")
+
+# Define the number of PyOb instances handled between yields to the event loop
+CHUNK_SIZE = 1_000
+
+# Define symbols by lookup
+# i.e. The operators used to describe a condition in an explain() plan
+SYMBOLS = {
+    "exact": "=",
+    "in": "IN",
+    "gt": ">",
+    "gte": ">=",
+    "lt": "<",
+    "lte": "<=",
+}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ YIELD CONTROL
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@types.coroutine
+def yield_control():
+    """Suspends the awaiting coroutine for one pass of the event loop"""
+
+    # Yield to the event loop, exactly as asyncio.sleep(0) does
+    # NOTE: This spares synchronous users the import time of asyncio
+    yield
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ AITERATE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+async def aiterate(iterable, chunk=CHUNK_SIZE):
+    """Yields the items of an iterable, pausing for the event loop between chunks"""
+
+    # Get items
+    # NOTE: The same iterator as a for loop so that the order is exactly the same
+    items = iter(iterable)
+
+    # Iterate until the items are exhausted
+    while True:
+
+        # Get the next chunk of items
+        # NOTE: As with a for loop, the source must not change size meanwhile
+        batch = list(islice(items, chunk))
+
+        # Return if there are no items left
+        if not batch:
+            return
+
+        # Iterate over items
+        for item in batch:
+
+            # Yield item
+            yield item
+
+        # Yield control to the event loop
+        await yield_control()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PARSE CONDITIONS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def parse_conditions(lookups):
+    """Parses keyword lookups into a tuple of (name, lookup, value) conditions"""
+
+    # Initialize conditions
+    conditions = []
+
+    # Iterate over lookups
+    for name, value in lookups.items():
+
+        # Split name into field and lookup
+        field, _, lookup = name.rpartition(LOOKUP_SEPARATOR)
+
+        # Check if lookup is not recognized
+        # i.e. The name is a plain field name, which implies an exact lookup
+        if not field or lookup not in LOOKUPS:
+
+            # Set field and lookup
+            field, lookup = name, "exact"
+
+        # Add condition to conditions
+        conditions.append((field, lookup, value))
+
+    # Return conditions
+    return tuple(conditions)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DESCRIBE CONDITION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def describe_condition(condition):
+    """Returns a human-readable description of a (name, lookup, value) condition"""
+
+    # Unpack condition
+    name, lookup, value = condition
+
+    # Return description
+    return f"{name} {SYMBOLS[lookup]} {value!r}"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB QUERY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObQuery:
+    """A lazy, chainable query over a PyObSet or PyObStore"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, source):
+        """Init Method"""
+
+        # Set source
+        # i.e. The PyObSet or PyObStore that the query is evaluated against
+        self._source = source
+
+        # Initialize filters
+        # i.e. A tuple of (negate, conditions) groups that must all hold
+        self._filters = ()
+
+        # Initialize ordering
+        self._ordering = ()
+
+        # Initialize limit
+        self._limit = None
+
+        # Initialize values fields
+        # i.e. None unless the query should yield dictionaries instead of PyObs
+        self._fields = None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self):
+        """Iterate Method"""
+
+        # Get plan description, candidates factory and whether candidates are sorted
+        _, get_candidates, is_sorted = self._plan()
+
+        # Get candidate PyOb instances
+        # i.e. Nothing is evaluated until the query is iterated
+        pyobs = get_candidates()
+
+        # Check if there are any filters
+        if self._filters:
+
+            # Filter candidate PyOb instances
+            pyobs = (pyob for pyob in pyobs if self._matches(pyob))
+
+        # Check if there is an ordering that the plan does not already satisfy
+        if self._ordering and not is_sorted:
+
+            # Sort PyOb instances
+            pyobs = self._sort(pyobs)
+
+        # Check if there is a limit
+        if self._limit is not None:
+
+            # Limit PyOb instances
+            pyobs = islice(pyobs, self._limit)
+
+        # Check if values fields are defined
+        if self._fields is not None:
+
+            # Get values fields
+            fields = self._fields
+
+            # Convert PyOb instances to dictionaries of values
+            pyobs = ({f: getattr(pyob, f, None) for f in fields} for pyob in pyobs)
+
+        # Yield from PyOb instances
+        yield from pyobs
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self):
+        """Representation Method"""
+
+        # Return representation
+        return f"<PyObQuery: {self._source._PyObClass.__name__}>"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CLONE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _clone(self, **attributes):
+        """Returns a copy of the query with updated attributes"""
+
+        # Initialize query
+        query = self.__class__(self._source)
+
+        # Copy attributes
+        query.__dict__.update(self.__dict__)
+
+        # Update attributes
+        query.__dict__.update(attributes)
+
+        # Return query
+        return query
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _MATCHES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _matches(self, pyob):
+        """Returns a boolean of whether a PyOb instance satisfies all filters"""
+
+        # Iterate over filters
+        for negate, conditions in self._filters:
+
+            # Initialize matched to True
+            matched = True
+
+            # Iterate over conditions
+            for name, lookup, value in conditions:
+
+                # Get attribute value
+                attr_value = getattr(pyob, name, Nothing)
+
+                # Initialize try-except block
+                try:
+
+                    # Determine if condition is met
+                    # A missing attribute never satisfies a condition
+                    matched = attr_value is not Nothing and LOOKUPS[lookup](
+                        attr_value, value
+                    )
+
+                # Handle incomparable values, e.g. None > 1
+                except TypeError:
+
+                    # Set matched to False
+                    matched = False
+
+                # Break if condition is not met
+                if not matched:
+                    break
+
+            # Return False if the filter group does not hold
+            if bool(matched) is negate:
+                return False
+
+        # Return True
+        return True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PLAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _plan(self):
+        """Returns a plan description, a candidates factory and whether it is sorted"""
+
+        # Get the conditions that every result must satisfy
+        # i.e. Excluded groups can never narrow the candidates
+        conditions = tuple(
+            condition
+            for negate, group in self._filters
+            if not negate
+            for condition in group
+        )
+
+        # Return the plan chosen by the source
+        return self._source._plan_query(conditions, self._ordering)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SORT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _sort(self, pyobs):
+        """Returns a list of PyOb instances sorted by the query ordering"""
+
+        # Materialize PyOb instances
+        pyobs = list(pyobs)
+
+        # Iterate over ordering fields from least to most significant
+        # Python's sort is stable so each pass preserves the order of the previous
+        for field in reversed(self._ordering):
+
+            # Determine if descending
+            descending = field.startswith("-")
+
+            # Get field name
+            name = field.lstrip("-")
+
+            # Define sort key
+            def key(pyob, name=name):
+                """Returns a sort key that orders missing and None values first"""
+
+                # Get attribute value
+                value = getattr(pyob, name, None)
+
+                # Return sort key
+                return (False,) if value is None else (True, value)
+
+            # Sort PyOb instances
+            pyobs.sort(key=key, reverse=descending)
+
+        # Return PyOb instances
+        return pyobs
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def filter(self, **lookups):
+        """Returns a query narrowed to PyOb instances matching all lookups"""
+
+        # Get filter group
+        group = (False, parse_conditions(lookups))
+
+        # Return query with an additional filter group
+        return self._clone(_filters=self._filters + (group,))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXCLUDE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def exclude(self, **lookups):
+        """Returns a query without PyOb instances matching all lookups"""
+
+        # Get negated filter group
+        group = (True, parse_conditions(lookups))
+
+        # Return query with an additional negated filter group
+        return self._clone(_filters=self._filters + (group,))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ORDER BY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def order_by(self, *fields):
+        """Returns a query ordered by fields, prefixed by "-" to sort descending"""
+
+        # Return query with an ordering
+        return self._clone(_ordering=tuple(fields))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LIMIT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def limit(self, n):
+        """Returns a query that yields at most n results"""
+
+        # Return query with a limit
+        return self._clone(_limit=n)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def values(self, *fields):
+        """Returns a query that yields dictionaries of field values"""
+
+        # Get PyOb class
+        PyObClass = self._source._PyObClass
+
+        # Get the keys and type hinted fields of the PyOb class
+        default_fields = PyObClass.PyObMeta.keys + tuple(get_pyob_type_hints(PyObClass))
+
+        # Remove any duplicate default fields
+        default_fields = tuple(dict.fromkeys(default_fields))
+
+        # Default fields to the keys and type hinted fields of the PyOb class
+        fields = fields or default_fields
+
+        # Return query with values fields
+        return self._clone(_fields=fields)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AITER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def aiter(self, chunk=CHUNK_SIZE):
+        """Returns an async iterator of the results, pausing for the event loop"""
+
+        # Return async iterator of results
+        return aiterate(self, chunk=chunk)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def count(self):
+        """Returns the number of results of the query"""
+
+        # Return count of results
+        return sum(1 for _ in self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FIRST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def first(self):
+        """Returns the first result of the query or None"""
+
+        # Return first result
+        return next(iter(self.limit(1)), None)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def explain(self):
+        """Returns a description of how the query will be evaluated"""
+
+        # Get plan description and whether candidates are sorted
+        description, _, is_sorted = self._plan()
+
+        # Initialize lines
+        lines = [description]
+
+        # Iterate over filters
+        for negate, conditions in self._filters:
+
+            # Get description of conditions
+            described = " AND ".join(describe_condition(c) for c in conditions)
+
+            # Add filter to lines
+            lines.append(f"{'EXCLUDE' if negate else 'FILTER'} {described}")
+
+        # Check if there is an ordering that the plan does not already satisfy
+        if self._ordering and not is_sorted:
+
+            # Add sort to lines
+            lines.append(f"SORT BY {', '.join(self._ordering)}")
+
+        # Check if there is a limit
+        if self._limit is not None:
+
+            # Add limit to lines
+            lines.append(f"LIMIT {self._limit}")
+
+        # Check if values fields are defined
+        if self._fields is not None:
+
+            # Add values to lines
+            lines.append(f"VALUES {', '.join(self._fields)}")
+
+        # Return explanation
+        return "\n".join(lines)
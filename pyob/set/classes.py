@@ -1,9 +1,27 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from itertools import islice
+from operator import attrgetter
+from weakref import WeakKeyDictionary
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
+from pyob.aggregate.classes import prepare_batch
+from pyob.query import PyObQuery
+from pyob.query.classes import CHUNK_SIZE, aiterate
 from pyob.tools.string import pascalize
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the number of PyOb instances whose field values are pulled at a time
+BATCH_SIZE = 10_000
+
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PYOB SET
@@ -24,18 +42,30 @@ class PyObSet:
     # i.e. A record of all PyOb instance counts in the PyObSet
     _counts_by_pyob = None
 
+    # Initialize count to 0
+    # i.e. The running total of the PyOb instance counts in the PyObSet
+    _count = 0
+
+    # Initialize is weak to False
+    # i.e. Whether the PyObSet holds weak references to its PyOb instances
+    _is_weak = False
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INIT__
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def __init__(self, PyObClass):
+    def __init__(self, PyObClass, weak=False):
         """Init Method"""
 
         # Set PyOb class
         self._PyObClass = PyObClass
 
+        # Set is weak
+        self._is_weak = weak
+
         # Initialize counts by PyOb
-        self._counts_by_pyob = {}
+        # A weak PyObSet drops PyOb instances as soon as they are garbage collected
+        self._counts_by_pyob = WeakKeyDictionary() if weak else {}
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __GETITEM__
@@ -70,11 +100,38 @@ class PyObSet:
     def __len__(self):
         """Length Method"""
 
-        # Get PyOb counts
-        pyob_counts = self._counts_by_pyob.values()
+        # Return the running total of all PyOb counts
+        return self._count
 
-        # Return sum of all PyOb counts
-        return sum(pyob_counts)
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _add(self, pyob, count=1):
+        """Adds a PyOb instance to the PyObSet with a count unless already present"""
+
+        # Get counts by PyOb
+        counts_by_pyob = self._counts_by_pyob
+
+        # Return if PyOb instance is already in the PyObSet
+        if pyob in counts_by_pyob:
+            return
+
+        # Add PyOb instance with its count
+        counts_by_pyob[pyob] = count
+
+        # Adjust running total
+        self._count += count
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _DISCARD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _discard(self, pyob):
+        """Removes a PyOb instance from the PyObSet if present"""
+
+        # Remove PyOb instance and adjust running total by its count
+        self._count -= self._counts_by_pyob.pop(pyob, 0)
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __REPR__
@@ -126,3 +183,193 @@ class PyObSet:
 
         # Return representation
         return representation
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _BATCHES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _batches(self, name):
+        """Yields batches of the values of a field, None where it is not set"""
+
+        # Get PyOb instances
+        pyobs = PyObSet.__iter__(self)
+
+        # Get value getter
+        get_value = attrgetter(name)
+
+        # Iterate until the PyOb instances are exhausted
+        while True:
+
+            # Get the next batch of PyOb instances
+            batch = list(islice(pyobs, BATCH_SIZE))
+
+            # Return if there are no PyOb instances left
+            if not batch:
+                return
+
+            # Initialize try-except block
+            try:
+
+                # Get the value of each PyOb instance
+                values = list(map(get_value, batch))
+
+            # Handle PyOb instances that do not have the field
+            except AttributeError:
+
+                # Get the value of each PyOb instance or None
+                values = [getattr(pyob, name, None) for pyob in batch]
+
+            # Yield values
+            yield values
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PLAN QUERY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _plan_query(self, conditions, ordering=()):
+        """Returns a plan description, a candidates factory and whether it is sorted"""
+
+        # Return a streaming scan of the PyOb set
+        # NOTE: A PyObSet has no indexes of its own so conditions cannot narrow it
+        return f"SCAN {self._PyObClass.__name__} set", self.__iter__, False
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def filter(self, **lookups):
+        """Returns a lazy query of PyOb instances matching all lookups"""
+
+        # Return filtered query
+        return PyObQuery(self).filter(**lookups)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXCLUDE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def exclude(self, **lookups):
+        """Returns a lazy query of PyOb instances not matching all lookups"""
+
+        # Return excluded query
+        return PyObQuery(self).exclude(**lookups)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ORDER BY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def order_by(self, *fields):
+        """Returns a lazy query of PyOb instances ordered by fields"""
+
+        # Return ordered query
+        return PyObQuery(self).order_by(*fields)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LIMIT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def limit(self, n):
+        """Returns a lazy query of at most n PyOb instances"""
+
+        # Return limited query
+        return PyObQuery(self).limit(n)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def values(self, *fields):
+        """Returns a lazy query of dictionaries of PyOb instance field values"""
+
+        # Return values query
+        return PyObQuery(self).values(*fields)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALUES LIST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def values_list(self, *fields, flat=False):
+        """Returns a list of tuples of field values, or a list of values if flat"""
+
+        # Check if flat is requested for anything but a single field
+        if flat and len(fields) != 1:
+
+            # Raise TypeError
+            raise TypeError("values_list() with flat=True expects exactly one field")
+
+        # Initialize columns
+        # i.e. A list of the values of each field across the PyOb instances
+        columns = []
+
+        # Iterate over fields
+        for field in fields:
+
+            # Initialize column
+            column = []
+
+            # Iterate over batches of field values
+            for batch in self._batches(field):
+
+                # Add batch to column
+                column.extend(batch)
+
+            # Add column to columns
+            columns.append(column)
+
+        # Return the values of the field if flat or otherwise rows of values
+        return columns[0] if flat else list(zip(*columns))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AGGREGATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def aggregate(self, **aggregates):
+        """Returns a dictionary of the results of named aggregates"""
+
+        # Initialize states
+        states = {name: aggregate.start() for name, aggregate in aggregates.items()}
+
+        # Initialize aggregate names by field
+        # So that the values of a field are pulled once however many aggregates use it
+        names_by_field = {}
+
+        # Iterate over aggregates
+        for name, aggregate in aggregates.items():
+
+            # Add aggregate name to the names of its field
+            names_by_field.setdefault(aggregate.field, []).append(name)
+
+        # Iterate over fields and aggregate names
+        for field, names in names_by_field.items():
+
+            # Get batches of prepared field values
+            # NOTE: Without a field only the number of PyOb instances is needed
+            batches = (
+                (range(len(self)),)
+                if field is None
+                else map(prepare_batch, self._batches(field))
+            )
+
+            # Iterate over batches
+            for values in batches:
+
+                # Iterate over aggregate names
+                for name in names:
+
+                    # Reduce batch
+                    states[name] = aggregates[name].step(states[name], values)
+
+        # Return results
+        return {
+            name: aggregate.finish(states[name])
+            for name, aggregate in aggregates.items()
+        }
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AITER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def aiter(self, chunk=CHUNK_SIZE):
+        """Returns an async iterator of the PyOb instances, pausing per chunk"""
+
+        # Return async iterator of PyOb instances
+        return aiterate(self, chunk=chunk)
@@ -0,0 +1,509 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import pickle
+
+from itertools import islice
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.exceptions import InvalidSnapshotError
+from pyob.main.tools.bulk import store_pyobs, validate_pyob_keys, validate_pyob_types
+from pyob.main.tools.plan import get_pyob_plan
+from pyob.main.tools.state import get_pyob_state, set_pyob_state
+from pyob.set import PyObSet
+from pyob.tools import is_pyob_base
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define snapshot format and version
+# i.e. The header that every snapshot starts with
+SNAPSHOT_FORMAT = "pyob-snapshot"
+SNAPSHOT_VERSION = 1
+
+# Define the number of PyOb instances written and read per record
+# So that neither dumping nor loading ever holds more than a chunk of pickled state
+# NOTE: Both still keep one ordinal per PyOb instance, as any later record may
+# reference any PyOb instance of the snapshot
+CHUNK_SIZE = 10_000
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SNAPSHOT PICKLER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SnapshotPickler(pickle.Pickler):
+    """A pickler that writes references to PyOb instances as ordinals"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, file, stores):
+        """Init Method"""
+
+        # Call parent init method
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # Set stores
+        # i.e. The stores being snapshotted, outside of which PyObs cannot be referenced
+        self.stores = stores
+
+        # Initialize ordinals by PyOb ID
+        self.ordinals_by_id = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET ORDINAL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get_ordinal(self, pyob):
+        """Returns the ordinal of a PyOb instance, assigning one on first sight"""
+
+        # Return ordinal
+        return self.ordinals_by_id.setdefault(id(pyob), len(self.ordinals_by_id))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REDUCER OVERRIDE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def reducer_override(self, obj):
+        """Reduces PyOb instances to a (PyOb class, ordinal) reference"""
+
+        # NOTE: Unlike persistent_id this is never called for builtin scalars and
+        # containers, which make up nearly everything in a snapshot
+
+        # Get PyObMeta of the object's class if any
+        PyObMeta = getattr(obj.__class__, "PyObMeta", None)
+
+        # Reduce anything but a PyOb instance as usual
+        if PyObMeta is None or isinstance(obj, type):
+            return NotImplemented
+
+        # Get store
+        store = PyObMeta.store
+
+        # Check if the PyOb instance is not part of the snapshot
+        if store not in self.stores or obj not in store._counts_by_pyob:
+
+            # Raise PicklingError
+            raise pickle.PicklingError(
+                f"Cannot snapshot a reference to {obj!r}, which is not stored in the "
+                f"snapshotted PyOb classes, unless {obj.__class__.__name__} is dumped "
+                "along with them"
+            )
+
+        # Return reference
+        return resolve_pyob, (obj.__class__, self.get_ordinal(obj))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SNAPSHOT UNPICKLER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SnapshotUnpickler(pickle.Unpickler):
+    """An unpickler that resolves ordinals to PyOb instances"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, file, pyobs_by_ordinal):
+        """Init Method"""
+
+        # Call parent init method
+        super().__init__(file)
+
+        # Set PyObs by ordinal
+        # i.e. The PyOb instances loaded or referenced so far
+        self.pyobs_by_ordinal = pyobs_by_ordinal
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FIND CLASS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def find_class(self, module, name):
+        """Returns a global, resolving PyOb references against this unpickler"""
+
+        # Return a resolver of PyOb references to the loaded PyOb instances
+        if module == __name__ and name == resolve_pyob.__name__:
+            return self.resolve_pyob
+
+        # Return global
+        return super().find_class(module, name)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RESOLVE PYOB
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def resolve_pyob(self, PyObClass, ordinal):
+        """Returns the PyOb instance of a (PyOb class, ordinal) reference"""
+
+        # Return PyOb instance, creating a blank one if it has not been loaded yet
+        # i.e. A forward reference whose state is filled in by its own record
+        return get_blank_pyob(PyObClass, ordinal, self.pyobs_by_ordinal)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RESOLVE PYOB
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def resolve_pyob(PyObClass, ordinal):
+    """Stands in for SnapshotUnpickler.resolve_pyob in pickled PyOb references"""
+
+    # Raise InvalidSnapshotError
+    raise InvalidSnapshotError("PyOb references can only be resolved by load()")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET BLANK PYOB
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_blank_pyob(PyObClass, ordinal, pyobs_by_ordinal):
+    """Returns the PyOb instance of an ordinal, creating it blank if not yet loaded"""
+
+    # Get PyOb instance
+    pyob = pyobs_by_ordinal.get(ordinal)
+
+    # Check if PyOb instance has not been created yet
+    if pyob is None:
+
+        # Create a blank PyOb instance without initializing it
+        pyob = pyobs_by_ordinal[ordinal] = PyObClass.__new__(PyObClass)
+
+    # Return PyOb instance
+    return pyob
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET PYOBS BY KEY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_pyobs_by_key(PyObClass, pyobs):
+    """Returns the key index entries of a batch of PyOb instances without validation"""
+
+    # Initialize PyObs by key
+    pyobs_by_key = {}
+
+    # Iterate over keys
+    for key in PyObClass.PyObMeta.keys:
+
+        # Iterate over PyOb instances
+        for pyob in pyobs:
+
+            # Get key value
+            # NOTE: Includes inherited class attributes, as with validate_pyob_keys
+            value = getattr(pyob, key, None)
+
+            # Index key value if set
+            if value is not None:
+                pyobs_by_key[value] = pyob
+
+    # Return PyObs by key
+    return pyobs_by_key
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET SNAPSHOT STORES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_snapshot_stores(PyObClasses):
+    """Returns the stores of PyOb classes and their descendants in traversal order"""
+
+    # Ensure that PyOb classes is a tuple
+    # i.e. User can either pass in one PyOb class or an iterable of PyOb classes
+    PyObClasses = (PyObClasses,) if isinstance(PyObClasses, type) else PyObClasses
+
+    # Initialize stores
+    # i.e. A dictionary so that stores reached from several roots are kept once
+    stores = {}
+
+    # Iterate over PyOb classes
+    for PyObClass in PyObClasses:
+
+        # Get PyObMeta if any
+        PyObMeta = getattr(PyObClass, "PyObMeta", None)
+
+        # Check if not a PyOb class
+        if PyObMeta is None:
+
+            # Raise InvalidSnapshotError
+            raise InvalidSnapshotError(
+                f"Cannot snapshot {PyObClass!r}, which is not a PyOb class"
+            )
+
+        # Get roots
+        # i.e. The direct children of PyOb itself, which has no store of its own
+        Roots = PyObMeta.Children if is_pyob_base(PyObClass) else [PyObClass]
+
+        # Iterate over roots
+        for Root in Roots:
+
+            # Add the store and descendant stores of root
+            stores.update(dict.fromkeys(Root.PyObMeta.store._get_stores()))
+
+    # Iterate over stores
+    for store in stores:
+
+        # Get PyOb class
+        PyObClass = store._PyObClass
+
+        # Check if PyOb class is localized
+        # NOTE: A localized copy shares its qualified name with the PyOb class it was
+        # localized from, so pickle cannot record it as a class that load can find
+        if PyObClass.PyObMeta.localized_from is not None:
+
+            # Raise InvalidSnapshotError
+            raise InvalidSnapshotError(
+                f"Cannot snapshot {PyObClass.__name__}, which is a localized PyOb "
+                "class, dump the PyOb class it was localized from instead"
+            )
+
+    # Check if there is nothing to snapshot
+    if not stores:
+
+        # Raise InvalidSnapshotError
+        raise InvalidSnapshotError(
+            f"Cannot snapshot {PyObClasses!r}, which have no PyOb stores"
+        )
+
+    # Return stores
+    return list(stores)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ READ RECORDS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def read_records(file, pyobs_by_ordinal):
+    """Yields the records of a snapshot file one at a time"""
+
+    # Iterate until the end of the file
+    while True:
+
+        # Initialize try-except block
+        try:
+
+            # Yield the next record
+            # NOTE: A fresh unpickler per record keeps its memo bounded to a chunk
+            yield SnapshotUnpickler(file, pyobs_by_ordinal).load()
+
+        # Handle the end of the file
+        except EOFError:
+            return
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DUMP
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def dump(PyObClasses, path):
+    """Writes the stores of PyOb classes and their descendants to a binary snapshot"""
+
+    # NOTE: PyObClasses is a PyOb class, PyOb itself for every PyOb class, or an
+    # iterable of PyOb classes whose PyOb instances reference one another
+    # NOTE: Localized PyOb classes cannot be dumped and raise InvalidSnapshotError
+
+    # Get the stores of the PyOb classes and their descendants
+    # NOTE: This raises before the file is opened if there is nothing to snapshot
+    stores = get_snapshot_stores(PyObClasses)
+
+    # Initialize count
+    count = 0
+
+    # Open snapshot file
+    with open(path, "wb") as file:
+
+        # Initialize pickler
+        pickler = SnapshotPickler(file, stores=set(stores))
+
+        # Write header
+        pickler.dump(
+            (SNAPSHOT_FORMAT, SNAPSHOT_VERSION, [store._PyObClass for store in stores])
+        )
+
+        # Clear memo so that every record can be read by a fresh unpickler
+        pickler.clear_memo()
+
+        # Iterate over stores
+        for store in stores:
+
+            # Get the PyOb instances of the store itself
+            pyobs = PyObSet.__iter__(store)
+
+            # Iterate until the PyOb instances are exhausted
+            while True:
+
+                # Get the next chunk of PyOb instances
+                chunk = list(islice(pyobs, CHUNK_SIZE))
+
+                # Break if there are no PyOb instances left
+                if not chunk:
+                    break
+
+                # Get the ordinal and state of each PyOb instance
+                states = [
+                    (pickler.get_ordinal(pyob), get_pyob_state(pyob)) for pyob in chunk
+                ]
+
+                # Write a record of the PyOb class and the states
+                pickler.dump((store._PyObClass, states))
+
+                # Clear memo so that it does not keep every record alive
+                # This also lets every record be read by a fresh unpickler
+                pickler.clear_memo()
+
+                # Increment count
+                count += len(chunk)
+
+    # Return the number of PyOb instances written
+    return count
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOAD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def load(path, verify=False):
+    """Restores the PyOb instances of a snapshot into their stores, chunk by chunk"""
+
+    # NOTE: Snapshots are pickles and must only be loaded from trusted sources
+    # NOTE: If any chunk fails, the chunks already stored are removed again
+    # NOTE: Without verify, types and key unicity are assumed to hold as when dumped
+
+    # Initialize PyObs by ordinal
+    # NOTE: Kept for the whole load, as any later record may reference any PyOb
+    # instance, so memory is bounded by the number of PyOb instances rather than
+    # the chunk size
+    pyobs_by_ordinal = {}
+
+    # Initialize count
+    count = 0
+
+    # Open snapshot file
+    with open(path, "rb") as file:
+
+        # Get records
+        records = read_records(file, pyobs_by_ordinal)
+
+        # Initialize try-except block
+        try:
+
+            # Read header
+            header = next(records, None)
+
+        # Handle files that are not pickles at all
+        except pickle.UnpicklingError:
+
+            # Set header to None
+            header = None
+
+        # Get whether header is that of a supported snapshot
+        is_supported = type(header) is tuple and header[:2] == (
+            SNAPSHOT_FORMAT,
+            SNAPSHOT_VERSION,
+        )
+
+        # Check if header is not that of a supported snapshot
+        if not is_supported:
+
+            # Raise InvalidSnapshotError
+            raise InvalidSnapshotError(
+                f"{path} is not a PyOb snapshot of version {SNAPSHOT_VERSION}"
+            )
+
+        # Initialize stored chunks
+        # i.e. The PyOb instances stored so far, removed again if a later record fails
+        stored = []
+
+        # Initialize try-except block
+        try:
+
+            # Iterate over records
+            for PyObClass, states in records:
+
+                # Initialize PyObs
+                pyobs = []
+
+                # Iterate over ordinals and states
+                for ordinal, state in states:
+
+                    # Get PyOb instance
+                    pyob = get_blank_pyob(PyObClass, ordinal, pyobs_by_ordinal)
+
+                    # Restore state without validating or indexing it
+                    set_pyob_state(pyob, state)
+
+                    # Add PyOb instance to PyObs
+                    pyobs.append(pyob)
+
+                # Hold the lock of the family if any
+                # So that no other thread can take a key between check and insert
+                with PyObClass.PyObMeta.store._family.locked():
+
+                    # Check if the chunk should be verified
+                    if verify:
+
+                        # Get validation plan
+                        plan = get_pyob_plan(PyObClass)
+
+                        # Type check the chunk
+                        validate_pyob_types(
+                            PyObClass=PyObClass, plan=plan, pyobs=pyobs
+                        )
+
+                        # Validate the keys of the chunk against itself and the stores
+                        pyobs_by_key = validate_pyob_keys(
+                            PyObClass=PyObClass, plan=plan, pyobs=pyobs
+                        )
+
+                    # Otherwise trust the keys of the chunk
+                    else:
+
+                        # Get key index entries directly
+                        pyobs_by_key = get_pyobs_by_key(
+                            PyObClass=PyObClass, pyobs=pyobs
+                        )
+
+                    # Index and store the chunk
+                    store_pyobs(
+                        PyObClass=PyObClass, pyobs=pyobs, pyobs_by_key=pyobs_by_key
+                    )
+
+                # Add the chunk to stored chunks
+                stored.append(pyobs)
+
+                # Increment count
+                count += len(pyobs)
+
+        # Handle any exception encountered while loading
+        # So that a snapshot is loaded in full or not at all, as with bulk_create
+        except Exception:
+
+            # Iterate over stored chunks from last to first
+            for pyobs in reversed(stored):
+
+                # Iterate over PyOb instances
+                for pyob in pyobs:
+
+                    # Remove PyOb instance from its store and every index
+                    pyob.__class__.PyObMeta.store._remove(pyob)
+
+            # Re-raise exception
+            raise
+
+    # Return the number of PyOb instances loaded
+    return count
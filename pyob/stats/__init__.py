@@ -0,0 +1,6 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.stats.classes import PyObStats  # noqa
+from pyob.stats.tools import disable, enable, report, reset  # noqa
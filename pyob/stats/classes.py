@@ -0,0 +1,81 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB STATS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObStats:
+    """The performance counters of a PyOb class"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize enabled to False
+    # i.e. Whether counters are recorded at all, process-wide
+    # NOTE: Every instrumented code path checks this first so that disabled stats
+    # cost a single class attribute lookup
+    enabled = False
+
+    # Define counter names
+    counters = (
+        "constructions",
+        "setattr_calls",
+        "validations",
+        "validation_seconds",
+        "type_checks",
+        "bearable_checks",
+        "traversal_visits",
+        "key_hits",
+        "key_misses",
+    )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self):
+        """Init Method"""
+
+        # Initialize constructions
+        # i.e. The number of PyOb instances created through the metaclass
+        self.constructions = 0
+
+        # Initialize setattr calls
+        # i.e. The number of calls to PyOb.__setattr__
+        self.setattr_calls = 0
+
+        # Initialize validations
+        # i.e. The number of writes that were type checked
+        self.validations = 0
+
+        # Initialize validation seconds
+        # i.e. The time spent type checking writes
+        self.validation_seconds = 0.0
+
+        # Initialize type checks
+        # i.e. The number of type checkers applied, one per relative that hints a field
+        self.type_checks = 0
+
+        # Initialize bearable checks
+        # i.e. The number of those type checkers that call into beartype
+        self.bearable_checks = 0
+
+        # Initialize traversal visits
+        # i.e. The number of relatives visited by traversals from the PyOb class
+        self.traversal_visits = 0
+
+        # Initialize key hits and misses
+        # i.e. The number of key lookups in the PyOb store that found a PyOb instance
+        # and the number that did not
+        self.key_hits = 0
+        self.key_misses = 0
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AS DICT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def as_dict(self):
+        """Returns a dictionary of counter names to values"""
+
+        # Return counters
+        return {name: getattr(self, name) for name in self.counters}
@@ -0,0 +1,150 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from weakref import WeakKeyDictionary
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob.stats.classes import PyObStats
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ STATS BY CLASS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize stats by class
+# i.e. The PyObStats of every PyOb class with recorded counters, released along with
+# the PyOb class itself, e.g. a localized copy
+stats_by_class = WeakKeyDictionary()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ENABLE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def enable():
+    """Starts recording the performance counters of every PyOb class"""
+
+    # Enable stats
+    PyObStats.enabled = True
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DISABLE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def disable():
+    """Stops recording performance counters, keeping those recorded so far"""
+
+    # Disable stats
+    PyObStats.enabled = False
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RESET
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def reset():
+    """Discards the performance counters recorded so far"""
+
+    # Clear stats by class
+    stats_by_class.clear()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def record(PyObClass, name, amount=1):
+    """Adds an amount to a performance counter of a PyOb class"""
+
+    # Get stats of the PyOb class
+    stats = stats_by_class.get(PyObClass)
+
+    # Check if the PyOb class has no stats yet
+    if stats is None:
+
+        # Initialize stats
+        stats = stats_by_class[PyObClass] = PyObStats()
+
+    # Add amount to counter
+    setattr(stats, name, getattr(stats, name) + amount)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET PYOB STATS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_pyob_stats(PyObClass):
+    """Returns a dictionary of the performance counters and store size of a class"""
+
+    # Get stats of the PyOb class, or blank ones if nothing was recorded
+    stats = stats_by_class.get(PyObClass) or PyObStats()
+
+    # Get store
+    store = PyObClass.PyObMeta.store
+
+    # Return counters along with the store sizes
+    # i.e. The PyOb instances of the class itself and those of its descendants too
+    return {**stats.as_dict(), "size": store._count, "total": store._total}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REPORT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def report():
+    """Returns a table of the performance counters of every PyOb class recorded"""
+
+    # Define columns
+    # i.e. A (header, counter name) pair per column after the class name
+    columns = (
+        ("new", "constructions"),
+        ("setattr", "setattr_calls"),
+        ("checked", "validations"),
+        ("check ms", "validation_seconds"),
+        ("types", "type_checks"),
+        ("beartype", "bearable_checks"),
+        ("visits", "traversal_visits"),
+        ("hits", "key_hits"),
+        ("misses", "key_misses"),
+        ("size", "size"),
+    )
+
+    # Initialize rows with the header
+    rows = [["class", *(header for header, _ in columns)]]
+
+    # Iterate over PyOb classes by name
+    for PyObClass in sorted(stats_by_class.keys(), key=lambda c: c.__qualname__):
+
+        # Get stats
+        stats = get_pyob_stats(PyObClass)
+
+        # Convert validation time to milliseconds
+        stats["validation_seconds"] = round(stats["validation_seconds"] * 1000, 1)
+
+        # Add row
+        rows.append(
+            [PyObClass.__qualname__, *(f"{stats[name]:,}" for _, name in columns)]
+        )
+
+    # Get the width of each column
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+    # Return table
+    # i.e. The class names left-aligned and the counters right-aligned
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    )
@@ -3,3 +3,4 @@
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from pyob.store.classes import PyObStore  # noqa
+from pyob.store.classes import PyObDiskStore  # noqa
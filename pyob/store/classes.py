@@ -1,11 +1,48 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from heapq import merge
+from itertools import islice
+from operator import itemgetter
+from threading import Lock
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-from pyob.exceptions import NonExistentKeyError
+from pyob.disk import PyObDiskKeyIndex, PyObDiskRecords
+from pyob.exceptions import (
+    NonExistentIndexError,
+    NonExistentKeyError,
+    NonExistentPyObError,
+)
+from pyob.family import PyObFamily
+from pyob.family.classes import NULL_LOCK
+from pyob.main.tools.bulk import validate_pyob_types
+from pyob.main.tools.index import (
+    deindex_pyob,
+    detach_pyob,
+    get_transaction,
+    get_weak_entry,
+)
+from pyob.main.tools.plan import get_pyob_plan
 from pyob.main.tools.traverse import traverse_pyob_descendants
+from pyob.query.classes import RANGE_LOOKUPS, describe_condition
 from pyob.set import PyObSet
-from pyob.utils import Nothing, ReturnValue
+from pyob.set.classes import BATCH_SIZE
+from pyob.stats import PyObStats
+from pyob.stats.tools import record
+from pyob.utils import Nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the lock of running totals
+# NOTE: Stores outside a family, e.g. that of PyOb itself, total several families
+TOTALS_LOCK = Lock()
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -23,6 +60,56 @@ class PyObStore(PyObSet):
     # Initialize PyObs by key to None
     _pyobs_by_key = None
 
+    # Initialize PyObs by index to None
+    # i.e. A map of secondary index name to a map of value to PyObSet
+    _pyobs_by_index = None
+
+    # Initialize ordered indexes to None
+    # i.e. A map of ordered index name to PyObOrderedIndex
+    _ordered_indexes = None
+
+    # Initialize uncovered indexes to None
+    # i.e. The names of indexes that miss PyOb instances of the store, such as those
+    # whose class-level default was changed after they were indexed
+    _uncovered_indexes = None
+
+    # Initialize weak entries by ID to None
+    # i.e. A map of PyOb instance ID to [weakref, indexed values, is counted]
+    _weak_entries_by_id = None
+
+    # Initialize count to 0
+    # i.e. The number of PyOb instances in the store itself
+    _count = 0
+
+    # Initialize total to 0
+    # i.e. The number of PyOb instances in the store and its descendants
+    _total = 0
+
+    # Initialize rollup stores to None
+    # i.e. The store itself and the stores of all its ancestors, each counted once
+    _rollup_stores = None
+
+    # Initialize descendant stores to None
+    # i.e. The set of the store itself and the stores of all its descendants
+    _descendant_stores = None
+
+    # Initialize family to None
+    # i.e. The PyObFamily whose key index is shared with related PyOb stores
+    _family = None
+
+    # Initialize columns to None
+    # i.e. The PyObColumns holding the field values of a columnar PyOb class
+    _columns = None
+
+    # Initialize write count to 0
+    # i.e. The number of writes to the store under the sampled validation mode
+    _write_count = 0
+
+    # Initialize pending PyObs to None
+    # i.e. PyOb instances written under the deferred validation mode but not yet
+    # type checked, as keys of a dictionary
+    _pending_pyobs = None
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INIT__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -34,7 +121,37 @@ class PyObStore(PyObSet):
         super().__init__(*args, **kwargs)
 
         # Initialize PyObs by key
-        self._pyobs_by_key = {}
+        # Weak stores drop keys as soon as their PyOb instances are garbage collected
+        self._pyobs_by_key = WeakValueDictionary() if self._is_weak else {}
+
+        # Initialize PyObs by index
+        self._pyobs_by_index = {}
+
+        # Initialize ordered indexes
+        self._ordered_indexes = {}
+
+        # Initialize uncovered indexes
+        self._uncovered_indexes = set()
+
+        # Initialize weak entries by ID if weak
+        # So that secondary and ordered indexes can be purged of collected instances
+        self._weak_entries_by_id = {} if self._is_weak else None
+
+        # Initialize pending PyObs
+        # NOTE: A weak store does not keep PyOb instances alive until validated
+        self._pending_pyobs = WeakKeyDictionary() if self._is_weak else {}
+
+        # Initialize rollup stores
+        # NOTE: The metaclass extends these with the stores of any ancestors
+        self._rollup_stores = [self]
+
+        # Initialize descendant stores
+        # NOTE: The metaclass adds the store of every new PyOb class to its ancestors
+        self._descendant_stores = {self}
+
+        # Initialize family
+        # NOTE: The metaclass merges this with the families of any parents
+        self._family = PyObFamily(store=self)
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __ITER__
@@ -43,14 +160,21 @@ class PyObStore(PyObSet):
     def __iter__(self):
         """Iterate Method"""
 
-        # Yield from current store
-        yield from super().__iter__()
+        # Iterate over the store and its descendant stores
+        for store in self._get_stores():
 
-        # Iterate over Children
-        for Child in self._PyObClass.PyObMeta.Children:
+            # Check if other threads may write to the store meanwhile
+            # NOTE: Copying a dictionary is atomic so iteration needs no lock
+            if store._family._lock is not None and type(store._counts_by_pyob) is dict:
 
-            # Yield from child store
-            yield from Child.PyObMeta.store.__iter__()
+                # Yield from a copy of the store
+                yield from list(store._counts_by_pyob)
+
+            # Otherwise iterate over the store itself
+            else:
+
+                # Yield from store
+                yield from PyObSet.__iter__(store)
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __LEN__
@@ -59,44 +183,573 @@ class PyObStore(PyObSet):
     def __len__(self):
         """Len Method"""
 
-        # Return the count of the PyOb store and its children
-        return super().__len__() + sum(
-            [len(Child.PyObMeta.store) for Child in self._PyObClass.PyObMeta.Children]
+        # Return the running total of the PyOb store and its descendants
+        return self._total
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADJUST COUNTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _adjust_counts(self, delta):
+        """Adjusts the count of the store and the totals of it and its ancestors"""
+
+        # Adjust count
+        self._count += delta
+
+        # Hold the lock of running totals if other threads may adjust them too
+        with TOTALS_LOCK if self._family._lock is not None else NULL_LOCK:
+
+            # Iterate over rollup stores
+            for store in self._rollup_stores:
+
+                # Adjust total
+                store._total += delta
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _BATCHES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _batches(self, name):
+        """Yields batches of the values of a field, None where it is not set"""
+
+        # Iterate over the store and its descendant stores
+        for store in self._get_stores():
+
+            # Get columns
+            columns = store._columns
+
+            # Get column if any
+            column = columns and columns.get(name)
+
+            # Check if the whole column can be yielded as a single batch
+            # i.e. Rows follow the store order, none are stale and all are set
+            if (
+                column is not None
+                and columns.is_ordered
+                and columns.size == store._count
+                and column.is_full()
+            ):
+
+                # Yield the values of the column
+                yield column.values
+
+            # Otherwise pull values from the PyOb instances in batches
+            else:
+
+                # Yield batches of the store
+                yield from PyObSet._batches(store, name)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET STORES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_stores(self):
+        """Returns the store and its descendant stores in traversal order"""
+
+        # Initialize stores
+        stores = []
+
+        # Define callback
+        def callback(PyObClass):
+            """Adds the store of a PyOb class to the stores"""
+
+            # Add store to stores
+            stores.append(PyObClass.PyObMeta.store)
+
+        # Traverse PyOb descendants
+        # NOTE: Each descendant is visited once even if it inherits along two paths
+        traverse_pyob_descendants(
+            PyObClass=self._PyObClass, callback=callback, inclusive=True
         )
 
+        # Return stores
+        return stores
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ KEY
+    # │ _GET LOADED PYOBS
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def key(self, key, default=Nothing):
-        """Returns the PyOb associated with a key from the PyOb store"""
+    def _get_loaded_pyobs(self):
+        """Returns a list of the PyOb instances of the store that are in memory"""
+
+        # Return PyOb instances
+        # NOTE: Every PyOb instance of an in-memory store is by definition loaded
+        return list(self._counts_by_pyob)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INSERT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _insert(self, pyobs):
+        """Adds fully indexed PyOb instances of the store's own PyOb class"""
+
+        # Hold the lock of the family if any
+        # So that the check for PyOb instances already stored is atomic with the add
+        with self._family.locked():
+
+            # Get the PyOb instances not yet in the store
+            pyobs = [pyob for pyob in pyobs if pyob not in self._counts_by_pyob]
+
+            # Check if store is columnar
+            if self._columns is not None:
+
+                # Track whether rows still follow the order of the store
+                self._columns.track_order(pyobs=pyobs, start=self._count)
+
+            # Add PyOb instances to store in one go
+            self._counts_by_pyob.update(dict.fromkeys(pyobs, 1))
+
+            # Check if store is weak
+            if self._weak_entries_by_id is not None:
+
+                # Iterate over PyOb instances
+                for pyob in pyobs:
+
+                    # Mark PyOb instance as counted
+                    # So that its collection is subtracted from the counts
+                    get_weak_entry(store=self, pyob=pyob)[2] = True
+
+            # Adjust counts
+            self._adjust_counts(len(pyobs))
+
+            # Get the transaction that covers the store if any
+            transaction = get_transaction(self)
+
+            # Check if a transaction covers the store
+            if transaction is not None:
+
+                # Log the inserts so that a rollback removes the PyOb instances
+                transaction.log_insert(pyobs)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PLAN QUERY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _plan_query(self, conditions, ordering=()):
+        """Returns a plan description, a candidates factory and whether it is sorted"""
+
+        # Get PyObMeta
+        PyObMeta = self._PyObClass.PyObMeta
+
+        # Get PyOb class name
+        class_name = self._PyObClass.__name__
+
+        # Initialize the equality conditions that an index can answer
+        # i.e. A list of (condition, distinct values) pairs
+        lookups = []
+
+        # Iterate over conditions
+        for condition in conditions:
+
+            # Unpack condition
+            name, lookup, value = condition
+
+            # Continue if not an equality lookup
+            if lookup not in ("exact", "in"):
+                continue
+
+            # Continue if the field is neither a key nor a secondary index
+            if name not in PyObMeta.keys and name not in PyObMeta.indexes:
+                continue
+
+            # Attempt to get the distinct values the condition matches
+            try:
+                values = tuple(dict.fromkeys(value if lookup == "in" else (value,)))
+
+            # Continue if a value is unhashable and so cannot be looked up
+            # i.e. The condition is answered by a scan instead
+            except TypeError:
+                continue
+
+            # Add condition and values to lookups
+            lookups.append((condition, values))
+
+        # Iterate over equality conditions
+        for condition, values in lookups:
+
+            # Continue if not a key
+            if condition[0] not in PyObMeta.keys:
+                continue
+
+            # Define candidates factory
+            def get_candidates(values=values):
+                """Yields the PyOb instances found by key"""
+
+                # Iterate over values
+                for value in values:
+
+                    # Get PyOb instance by key
+                    pyob = self.key(value, None)
+
+                    # Yield PyOb instance if found
+                    if pyob is not None:
+                        yield pyob
+
+            # Return key lookup plan
+            description = f"KEY LOOKUP {describe_condition(condition)} on {class_name}"
+            return description, get_candidates, False
+
+        # Iterate over equality conditions
+        for condition, values in lookups:
+
+            # Get field name
+            name = condition[0]
+
+            # Continue if not a secondary index that covers every PyOb instance
+            if name not in PyObMeta.indexes or not self._is_covered(name):
+                continue
+
+            # Define candidates factory
+            def get_candidates(name=name, values=values):
+                """Yields the PyOb instances found by secondary index"""
+
+                # Iterate over values
+                for value in values:
+
+                    # Yield from PyOb instances of value
+                    yield from self.where(**{name: value})
+
+            # Return index lookup plan
+            description = (
+                f"INDEX LOOKUP {describe_condition(condition)} on {class_name} "
+                "and descendants"
+            )
+            return description, get_candidates, False
+
+        # Get the ordered index field and direction of a single-field ordering if any
+        # i.e. An ordering that the ordered index can yield without sorting
+        ordered_by = len(ordering) == 1 and ordering[0].lstrip("-")
+
+        # Reset ordered by if the ordering field is not an ordered index
+        ordered_by = ordered_by if ordered_by in PyObMeta.ordered_indexes else None
+
+        # Reset ordered by if the ordered index may miss PyOb instances
+        ordered_by = ordered_by if ordered_by and self._is_covered(ordered_by) else None
+
+        # Get whether the ordering is descending
+        reverse = bool(ordering) and ordering[0].startswith("-")
+
+        # Initialize the range bounds that an ordered index can answer
+        # i.e. A map of field name to a pair of lists of lower and upper bounds
+        bounds = {}
+
+        # Iterate over conditions
+        for name, lookup, value in conditions:
+
+            # Continue if not a range lookup on an ordered index
+            if lookup not in RANGE_LOOKUPS or name not in PyObMeta.ordered_indexes:
+                continue
+
+            # Continue if the ordered index may miss PyOb instances
+            if not self._is_covered(name):
+                continue
+
+            # Add value to the lower or upper bounds of the field
+            bounds.setdefault(name, ([], []))[lookup in ("lt", "lte")].append(value)
+
+        # Iterate over range bounds, preferring the ordering field
+        for name in sorted(bounds, key=lambda name: name != ordered_by):
+
+            # Get lower and upper bounds
+            lows, highs = bounds[name]
+
+            # Initialize try-except block
+            try:
+
+                # Get the tightest inclusive bounds
+                # NOTE: Exclusive bounds are enforced when the query filters candidates
+                lo = max(lows) if lows else None
+                hi = min(highs) if highs else None
+
+            # Handle incomparable bounds
+            except TypeError:
+                continue
+
+            # Determine if the range scan also satisfies the ordering
+            is_sorted = name == ordered_by
+
+            # Define candidates factory
+            def get_candidates(name=name, lo=lo, hi=hi, reverse=is_sorted and reverse):
+                """Yields the PyOb instances found by ordered index"""
+
+                # Yield from PyOb instances in range
+                yield from self.range(name, lo=lo, hi=hi, reverse=reverse)
+
+            # Get description of range conditions
+            described = " AND ".join(
+                describe_condition(condition)
+                for condition in conditions
+                if condition[0] == name and condition[1] in RANGE_LOOKUPS
+            )
+
+            # Return range scan plan
+            description = f"RANGE SCAN {described} on {class_name} and descendants"
+            return description, get_candidates, is_sorted
+
+        # Check if the ordering field is an ordered index that covers every PyOb
+        # Missing and None values are not indexed but must still be yielded
+        if ordered_by and self._count_ordered(ordered_by) == len(self):
+
+            # Define candidates factory
+            def get_candidates():
+                """Yields every PyOb instance in the order of the ordered index"""
+
+                # Yield from PyOb instances in order
+                yield from self.range(ordered_by, reverse=reverse)
+
+            # Return ordered scan plan
+            description = f"ORDERED SCAN {ordering[0]} on {class_name} and descendants"
+            return description, get_candidates, True
+
+        # Return a streaming scan of the PyOb store and its descendants
+        return f"SCAN {class_name} and descendants", self.__iter__, False
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _IS COVERED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _is_covered(self, name):
+        """Returns whether an index covers the store and descendants"""
+
+        # Return False if the index misses PyOb instances of any descendant store
+        # NOTE: A query must then scan so that its results match those of a scan
+        return not any(
+            name in store._uncovered_indexes for store in self._descendant_stores
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COUNT ORDERED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _count_ordered(self, name):
+        """Returns the number of PyOb instances in an ordered index and descendants"""
+
+        # Initialize count
+        count = 0
 
         # Define callback
         def callback(PyObClass):
-            """Returns a PyOb instance by key if present"""
+            """Adds the size of the ordered index of a PyOb class store to the count"""
 
-            # Get PyObMeta
-            PyObMeta = PyObClass.PyObMeta
+            # Declare count as nonlocal
+            nonlocal count
+
+            # Get ordered index
+            ordered_index = PyObClass.PyObMeta.store._ordered_indexes.get(name)
+
+            # Add size of ordered index to count
+            count += len(ordered_index) if ordered_index is not None else 0
+
+        # Traverse PyOb descendants
+        traverse_pyob_descendants(
+            PyObClass=self._PyObClass, callback=callback, inclusive=True
+        )
+
+        # Return count
+        return count
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _remove(self, pyob):
+        """Removes a PyOb instance of the store's own PyOb class from every index"""
+
+        # Hold the lock of the family if any
+        with self._family.locked():
+
+            # Remove PyOb instance from key, secondary and ordered indexes
+            deindex_pyob(pyob)
+
+            # Remove PyOb instance from store
+            self._counts_by_pyob.pop(pyob)
+
+            # Adjust counts
+            self._adjust_counts(-1)
+
+            # Get the transaction that covers the store if any
+            transaction = get_transaction(self)
+
+            # Check if a transaction covers the store
+            if transaction is not None:
+
+                # Log the removal so that a rollback reattaches the PyOb instance
+                transaction.log_remove(pyob)
+
+        # Detach PyOb instance so that later writes do not re-index it
+        detach_pyob(pyob)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SAVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _save(self, pyob):
+        """Persists the state of a PyOb instance after a write, if the store needs to"""
+
+        # NOTE: An in-memory store holds PyOb instances themselves so this is a no-op
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _VALIDATE PENDING
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _validate_pending(self):
+        """Type checks the PyOb instances written under deferred validation"""
+
+        # Get PyOb class
+        PyObClass = self._PyObClass
+
+        # Hold the lock of the family if any
+        with self._family.locked():
+
+            # Get the pending PyOb instances that are still stored
+            pyobs = [
+                pyob
+                for pyob in list(self._pending_pyobs)
+                if pyob in self._counts_by_pyob
+            ]
+
+            # Type check PyOb instances attribute by attribute
+            validate_pyob_types(
+                PyObClass=PyObClass, plan=get_pyob_plan(PyObClass), pyobs=pyobs
+            )
+
+            # Reset pending PyOb instances
+            # NOTE: Only once valid, so that a failed check can be repeated
+            self._pending_pyobs.clear()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def clear(self):
+        """Removes every PyOb instance from the PyOb store and its descendants"""
+
+        # Define callback
+        def callback(PyObClass):
+            """Empties the store of a PyOb class"""
+
+            # Get store
+            store = PyObClass.PyObMeta.store
+
+            # Check if a transaction covers the store
+            if get_transaction(store) is not None:
+
+                # Iterate over PyOb instances
+                # NOTE: One by one so that each removal is undo logged
+                for pyob in list(PyObSet.__iter__(store)):
+
+                    # Remove PyOb instance from every index
+                    store._remove(pyob)
+
+                # Return
+                return
+
+            # Hold the lock of the family of the store if any
+            with store._family.locked():
 
-            # Get PyObs by key
-            pyobs_by_key = PyObMeta.store._pyobs_by_key
+                # Get the PyOb instances in memory
+                pyobs = store._get_loaded_pyobs()
 
-            # Check if key in PyObs by key
-            if key in pyobs_by_key:
+                # Iterate over PyOb instances
+                for pyob in pyobs:
 
-                # Get PyOb instance
-                pyob = pyobs_by_key[key]
+                    # Detach PyOb instance so that later writes do not re-index it
+                    detach_pyob(pyob)
 
-                # Return PyOb instance in ReturnValue
-                return ReturnValue(pyob)
+                # Subtract the count of the store from its totals and those of ancestors
+                store._adjust_counts(-store._count)
+
+                # Iterate over the keys of the store
+                for key in list(store._pyobs_by_key):
+
+                    # Remove key from the family key index
+                    store._family.discard(key, store)
+
+                # Reset store and indexes wholesale rather than deindexing one by one
+                store._counts_by_pyob.clear()
+                store._pyobs_by_key.clear()
+                store._pyobs_by_index.clear()
+                store._ordered_indexes.clear()
+
+                # Reset uncovered indexes as there is nothing left for them to miss
+                store._uncovered_indexes.clear()
+
+                # Check if store is columnar
+                if store._columns is not None:
+
+                    # Reset columns, releasing the rows of PyOb instances in memory
+                    store._columns.reset(pyobs)
+
+                # Check if store is weak
+                if store._weak_entries_by_id is not None:
+
+                    # Reset weak entries along with their weakrefs
+                    store._weak_entries_by_id.clear()
 
         # Traverse PyOb descendants
-        result = traverse_pyob_descendants(
+        traverse_pyob_descendants(
             PyObClass=self._PyObClass, callback=callback, inclusive=True
         )
 
-        # Extract PyOb instance from result
-        pyob = result and result.value
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EVICT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def evict(self, predicate):
+        """Removes the PyOb instances matching a predicate and returns their count"""
+
+        # Get the PyOb instances to evict
+        # NOTE: These are collected first so that the stores are not mutated mid-scan
+        pyobs = [pyob for pyob in self if predicate(pyob)]
+
+        # Iterate over PyOb instances
+        for pyob in pyobs:
+
+            # Remove PyOb instance from the store of its PyOb class
+            pyob.__class__.PyObMeta.store._remove(pyob)
+
+        # Return number of evicted PyOb instances
+        return len(pyobs)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def key(self, key, default=Nothing):
+        """Returns the PyOb associated with a key from the PyOb store"""
+
+        # Get descendant stores
+        descendant_stores = self._descendant_stores
+
+        # Get the store of the family that holds the key
+        # i.e. A single probe of the family key index regardless of hierarchy depth
+        store = self._family._stores_by_key.get(key)
+
+        # Check if several stores of the family hold the key
+        if type(store) is list:
+
+            # Initialize PyOb instance to None
+            pyob = None
+
+            # Iterate over the stores that are the PyOb store or a descendant
+            # NOTE: A stale entry of a weak store must not hide a later holder
+            for store in (s for s in store if s in descendant_stores):
+
+                # Get PyOb instance if held by the store
+                # NOTE: A single get is safe even if a weak entry is collected meanwhile
+                pyob = store._pyobs_by_key.get(key)
+
+                # Break if PyOb instance is held by the store
+                if pyob is not None:
+                    break
+
+        # Otherwise get PyOb instance if held by the PyOb store or a descendant
+        else:
+            pyob = store._pyobs_by_key.get(key) if store in descendant_stores else None
+
+        # Record the hit or miss if stats are enabled
+        if PyObStats.enabled:
+            record(self._PyObClass, "key_misses" if pyob is None else "key_hits")
 
         # Check if PyOb instance is not None
         if pyob is not None:
@@ -123,3 +776,283 @@ class PyObStore(PyObSet):
 
         # Return default
         return default
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def remove(self, pyob):
+        """Removes a PyOb instance from the PyOb store or that of a descendant"""
+
+        # Get store of PyOb instance if any
+        store = getattr(getattr(pyob.__class__, "PyObMeta", None), "store", None)
+
+        # Determine if PyOb instance is stored in the PyOb store or a descendant
+        is_stored = (
+            store in self._descendant_stores and pyob in store._counts_by_pyob
+        )
+
+        # Check if PyOb instance is not stored
+        if not is_stored:
+
+            # Raise NonExistentPyObError
+            raise NonExistentPyObError(
+                f"{pyob!r} does not exist in the {self._PyObClass.__name__} store"
+            )
+
+        # Remove PyOb instance from the store of its PyOb class
+        store._remove(pyob)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ WHERE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def where(self, **values):
+        """Returns a PyObSet of the PyOb instances in the PyOb store matching values"""
+
+        # Initialize PyOb set
+        pyob_set = PyObSet(PyObClass=self._PyObClass)
+
+        # Define callback
+        def callback(PyObClass):
+            """Adds the matching PyOb instances of a PyOb class store to the PyOb set"""
+
+            # Get PyObMeta
+            PyObMeta = PyObClass.PyObMeta
+
+            # Get store
+            store = PyObMeta.store
+
+            # Get the secondary indexes of the store that apply to the values
+            # NOTE: Indexes that may miss PyOb instances of the store are scanned
+            indexed = [
+                name
+                for name in PyObMeta.indexes
+                if name in values and name not in store._uncovered_indexes
+            ]
+
+            # Check if any values are indexed
+            if indexed:
+
+                # Get the candidate PyOb sets of each indexed value
+                pyob_sets = [
+                    store._pyobs_by_index.get(name, {}).get(values[name])
+                    for name in indexed
+                ]
+
+                # Return if any indexed value has no PyOb instances
+                if not all(pyob_sets):
+                    return
+
+                # Get the smallest candidate PyOb set
+                candidates = min(pyob_sets, key=len)._counts_by_pyob
+
+                # Get the remaining values to match against
+                remaining = {k: v for k, v in values.items() if k not in indexed}
+
+            # Otherwise handle scan
+            else:
+
+                # Scan all PyOb instances of the store
+                candidates, remaining = store._counts_by_pyob, values
+
+            # Iterate over candidates
+            for pyob in candidates:
+
+                # Check if PyOb instance matches remaining values
+                if all(getattr(pyob, k, Nothing) == v for k, v in remaining.items()):
+
+                    # Add PyOb instance to PyOb set
+                    pyob_set._add(pyob, store._counts_by_pyob[pyob])
+
+        # Traverse PyOb descendants
+        traverse_pyob_descendants(
+            PyObClass=self._PyObClass, callback=callback, inclusive=True
+        )
+
+        # Return PyOb set
+        return pyob_set
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RANGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def range(self, name, lo=None, hi=None, reverse=False):
+        """Returns an iterator of PyOb instances with lo <= name <= hi in order"""
+
+        # Check if name is not an ordered index
+        if name not in self._PyObClass.PyObMeta.ordered_indexes:
+
+            # Raise NonExistentIndexError
+            raise NonExistentIndexError(
+                f"{self._PyObClass.__name__}.{name} is not an ordered index"
+            )
+
+        # Initialize the sorted (value, PyOb) streams of each store
+        streams = []
+
+        # Define callback
+        def callback(PyObClass):
+            """Adds the sorted stream of a PyOb class store to the streams"""
+
+            # Get ordered index
+            ordered_index = PyObClass.PyObMeta.store._ordered_indexes.get(name)
+
+            # Check if ordered index is defined
+            if ordered_index is not None:
+
+                # Add sorted stream of ordered index to streams
+                streams.append(ordered_index.items(lo=lo, hi=hi, reverse=reverse))
+
+        # Traverse PyOb descendants
+        traverse_pyob_descendants(
+            PyObClass=self._PyObClass, callback=callback, inclusive=True
+        )
+
+        # Merge the already sorted streams lazily rather than re-sorting them
+        merged = merge(*streams, key=itemgetter(0), reverse=reverse)
+
+        # Return an iterator of the merged PyOb instances
+        return map(itemgetter(1), merged)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ TOP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def top(self, name, n):
+        """Returns a list of the n PyOb instances with the greatest values of name"""
+
+        # Return the first n PyOb instances in descending order
+        return list(islice(self.range(name, reverse=True), n))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALIDATE ALL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def validate_all(self):
+        """Type checks every PyOb instance of the store and its descendants at once"""
+
+        # Initialize count
+        count = 0
+
+        # Iterate over the store and its descendant stores
+        for store in self._get_stores():
+
+            # Get PyOb class
+            PyObClass = store._PyObClass
+
+            # Get validation plan
+            plan = get_pyob_plan(PyObClass)
+
+            # Hold the lock of the family if any
+            with store._family.locked():
+
+                # Get the PyOb instances of the store itself
+                pyobs = PyObSet.__iter__(store)
+
+                # Iterate until the PyOb instances are exhausted
+                while True:
+
+                    # Get the next batch of PyOb instances
+                    batch = list(islice(pyobs, BATCH_SIZE))
+
+                    # Break if there are no PyOb instances left
+                    if not batch:
+                        break
+
+                    # Type check the batch attribute by attribute
+                    validate_pyob_types(PyObClass=PyObClass, plan=plan, pyobs=batch)
+
+                    # Increment count
+                    count += len(batch)
+
+                # Reset pending PyOb instances as they have all been validated
+                store._pending_pyobs.clear()
+
+        # Return the number of PyOb instances validated
+        return count
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PYOB DISK STORE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PyObDiskStore(PyObStore):
+    """A PyOb store whose PyOb instances live in a memory-mapped file between uses"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, *args, **kwargs):
+        """Init Method"""
+
+        # Call parent init method
+        # NOTE: A disk store holds no references to its PyOb instances so is never weak
+        super().__init__(*args, **{**kwargs, "weak": False})
+
+        # Initialize records in place of the counts by PyOb
+        # i.e. PyOb instances are materialized on access and released once unused
+        self._counts_by_pyob = PyObDiskRecords(PyObClass=self._PyObClass)
+
+        # Initialize key index in place of the PyObs by key
+        # i.e. A map of key value to record number rather than to PyOb instance
+        self._pyobs_by_key = PyObDiskKeyIndex(records=self._counts_by_pyob)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET LOADED PYOBS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_loaded_pyobs(self):
+        """Returns a list of the PyOb instances of the store that are in memory"""
+
+        # Return PyOb instances in memory
+        # NOTE: Those on disk only are never handed out again once the store is cleared
+        return self._counts_by_pyob.loaded()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INSERT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _insert(self, pyobs):
+        """Adds fully indexed PyOb instances of the store's own PyOb class"""
+
+        # Hold the lock of the family if any
+        # So that keys held for PyOb instances that fail to write are released at once
+        with self._family.locked():
+
+            # Initialize try-except block
+            try:
+
+                # Write PyOb instances to disk
+                super()._insert(pyobs)
+
+            # Handle PyOb instances whose state cannot be written
+            except Exception:
+
+                # Iterate over PyOb instances
+                for pyob in pyobs:
+
+                    # Clean up the keys indexed during init as if it never existed
+                    deindex_pyob(pyob)
+
+                # Re-raise exception
+                raise
+
+            # Point the keys indexed during init at the records just written
+            self._pyobs_by_key.flush()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SAVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _save(self, pyob):
+        """Persists the state of a PyOb instance after a write, if the store needs to"""
+
+        # Hold the lock of the family if any
+        # NOTE: Appends to the file of the store must not interleave
+        with self._family.locked():
+
+            # Write the new state of the PyOb instance as its record
+            self._counts_by_pyob.save(pyob)
@@ -33,6 +33,22 @@ def deduplicate(iterable, recursive=False):
     return to_type(iterable)
 
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MERGE TUPLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def merge_tuples(tuples):
+    """Merges tuples in order without duplicates, reusing an equal one if any"""
+
+    # Merge tuples and remove any duplicate items
+    merged = deduplicate(sum(tuples, ()))
+
+    # Return the first of the tuples equal to the merged tuple, if any
+    # i.e. So that a class adding nothing to its parent shares the tuple of its parent
+    return next((items for items in tuples if items == merged), merged)
+
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ IS ITERABLE
 # └─────────────────────────────────────────────────────────────────────────────────────
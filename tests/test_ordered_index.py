@@ -0,0 +1,88 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob import PyOb
+from pyob.exceptions import InvalidTypeError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DEFINE ORDERED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def define_ordered():
+    """Returns a PyOb class with a key and an untyped ordered index"""
+
+    # Define a PyOb class
+    class Ordered(PyOb):
+        class PyObMeta:
+            keys = ("k",)
+            ordered_indexes = ("s",)
+
+        def __init__(self, k, s):
+            self.k = k
+            self.s = s
+
+    # Return PyOb class
+    return Ordered
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST BULK CREATE UNORDERABLE VALUES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_bulk_create_unorderable_values():
+    """Ensures that a batch of unorderable values leaves the indexes untouched"""
+
+    # Define PyOb class
+    Ordered = define_ordered()
+
+    # Assert that bulk creating mixed types raises InvalidTypeError
+    with pytest.raises(InvalidTypeError):
+        Ordered.bulk_create([dict(k=1, s=1), dict(k=2, s="x")])
+
+    # Assert that nothing was stored or indexed
+    assert len(Ordered.obs) == 0
+    assert Ordered.obs.key(1, None) is None
+
+    # Assert that the keys of the failed batch are still free
+    assert Ordered(1, 3).s == 3
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST WRITE UNORDERABLE VALUES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_write_unorderable_values():
+    """Ensures that unorderable values are rejected on init and on write"""
+
+    # Define PyOb class
+    Ordered = define_ordered()
+
+    # Initialize a PyOb instance
+    pyob = Ordered(1, 1)
+
+    # Assert that an unorderable value on init raises InvalidTypeError
+    with pytest.raises(InvalidTypeError):
+        Ordered(2, "x")
+
+    # Assert that the key of the failed PyOb instance is still free
+    assert len(Ordered.obs) == 1
+    assert Ordered(2, 2).k == 2
+
+    # Assert that an unorderable value on write raises InvalidTypeError
+    with pytest.raises(InvalidTypeError):
+        pyob.s = "x"
+
+    # Assert that the ordered index is unchanged
+    assert pyob.s == 1
+    assert list(Ordered.obs.order_by("s")) == [pyob, Ordered.obs.key(2)]
@@ -0,0 +1,28 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from pyob import PyOb
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST FILTER UNHASHABLE VALUES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_filter_unhashable_values():
+    """Ensures that unhashable values on unindexed fields are answered by a scan"""
+
+    # Define a PyOb class with an unindexed list field
+    class Tagged(PyOb):
+        def __init__(self, name, tags):
+            self.name = name
+            self.tags = tags
+
+    # Initialize PyOb instances
+    Tagged("a", ["a"])
+    Tagged("b", ["b"])
+
+    # Assert that exact and in lookups on the list field match by scan
+    assert [p.name for p in Tagged.obs.filter(tags=["a"])] == ["a"]
+    assert [p.name for p in Tagged.obs.filter(tags__in=[["a"]])] == ["a"]
@@ -0,0 +1,81 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import pyob.snapshot.tools
+
+from pyob import PyOb
+from pyob.exceptions import DuplicateKeyError, InvalidSnapshotError
+from pyob.snapshot import dump, load
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ KEYED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Keyed(PyOb):
+    """A PyOb class with a key, defined at module level so that it can be pickled"""
+
+    class PyObMeta:
+        keys = ("k",)
+
+    def __init__(self, k):
+        self.k = k
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST DUMP LOCALIZED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_dump_localized(tmp_path):
+    """Ensures that localized PyOb classes are rejected before anything is written"""
+
+    # Get a localized copy of a PyOb class
+    Localized = Keyed.Localized()
+    Localized(1)
+
+    # Assert that dumping it raises InvalidSnapshotError
+    with pytest.raises(InvalidSnapshotError):
+        dump(Localized, tmp_path / "localized.pyob")
+
+    # Assert that no snapshot file was written
+    assert not (tmp_path / "localized.pyob").exists()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST LOAD VERIFY ROLLBACK
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_load_verify_rollback(tmp_path, monkeypatch):
+    """Ensures that a failed chunk removes the chunks already loaded"""
+
+    # Write one PyOb instance per chunk
+    monkeypatch.setattr(pyob.snapshot.tools, "CHUNK_SIZE", 1)
+
+    # Dump two PyOb instances
+    Keyed.obs.clear()
+    Keyed(1)
+    Keyed(2)
+    dump(Keyed, tmp_path / "keyed.pyob")
+
+    # Clear the store and take the key of the second chunk
+    Keyed.obs.clear()
+    Keyed(2)
+
+    # Assert that loading with verify raises DuplicateKeyError on the second chunk
+    with pytest.raises(DuplicateKeyError):
+        load(tmp_path / "keyed.pyob", verify=True)
+
+    # Assert that the first chunk was removed again
+    assert len(Keyed.obs) == 1
+    assert Keyed.obs.key(1, None) is None
+    assert Keyed(1).k == 1
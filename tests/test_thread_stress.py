@@ -0,0 +1,45 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.thread_stress import Account, SavingsAccount, run
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST THREAD STRESS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_thread_stress():
+    """Ensures that threads competing for keys leave the stores consistent"""
+
+    # Run a small number of threads over a small number of keys
+    pyobs, _, _ = run(threads=4, number=2000)
+
+    # Get stores and family
+    store, child_store = Account.PyObMeta.store, SavingsAccount.PyObMeta.store
+    family = store._family
+
+    # Assert that no two threads were both allowed to create the same key
+    keys = [pyob.number for pyob in pyobs]
+    assert len(keys) == len(set(keys))
+
+    # Assert that exactly the PyOb instances kept by the threads are stored
+    assert set(map(id, Account.obs)) == set(map(id, pyobs))
+
+    # Assert that the counts and totals agree with the stores
+    assert store._count == len(store._counts_by_pyob)
+    assert child_store._count == len(child_store._counts_by_pyob)
+    assert len(Account.obs) == len(pyobs)
+
+    # Assert that every key resolves to the PyOb instance holding it
+    assert all(Account.obs.key(pyob.number) is pyob for pyob in pyobs)
+    assert len(family) == len(pyobs)
+
+    # Assert that the secondary index holds every PyOb instance exactly once
+    indexed = sum(
+        len(pyob_set)
+        for s in (store, child_store)
+        for pyob_set in s._pyobs_by_index.get("branch", {}).values()
+    )
+    assert indexed == len(pyobs)
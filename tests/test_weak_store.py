@@ -0,0 +1,30 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.weak_store import MAX_RETAINED_BLOCKS, Session, run
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST WEAK STORE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_weak_store():
+    """Ensures that a weak store releases dropped PyOb instances and index entries"""
+
+    # Create and drop PyOb instances
+    retained, _ = run(number=20_000)
+
+    # Get store
+    store = Session.obs
+
+    # Assert that every PyOb instance and index entry has been released
+    assert len(store) == 0
+    assert not store._pyobs_by_key
+    assert not store._pyobs_by_index.get("user")
+    assert not store._ordered_indexes["started"]
+    assert not store._weak_entries_by_id
+
+    # Assert that no more than interpreter noise is retained
+    assert retained < MAX_RETAINED_BLOCKS